@@ -12,6 +12,8 @@ from projectiles import ProjectileData
 
 
 class Ability(TimeAccess):
+    __slots__ = ('_use_effects', '_use_conditions', 'uses_left')
+
     def __init__(self) -> None:
 
         self._use_effects: List[Effect] = []
@@ -79,6 +81,8 @@ class AbilityData(BaseAbilityData):
 
 
 class GenericAbility(Ability):
+    __slots__ = ('_cool_down_fraction_fun', 'finite_uses')
+
     def __init__(self, data: AbilityData) -> None:
         super().__init__()
 
@@ -144,6 +148,8 @@ class GenericAbility(Ability):
 
 
 class DecrementUses(Effect):
+    __slots__ = ('_used_ability',)
+
     def __init__(self, ability: Ability) -> None:
         self._used_ability = ability
 
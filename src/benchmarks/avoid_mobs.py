@@ -0,0 +1,60 @@
+"""Time Enemy._avoid_mobs for every enemy, with and without the index.
+
+Enemies are spread at a constant density, so the indexed cost should grow
+linearly while the brute force cost grows quadratically.
+
+Run from the src directory with `python -m benchmarks.avoid_mobs`.
+"""
+import timeit
+from random import Random
+from typing import List
+
+from pygame.math import Vector2
+
+import model
+from creatures.enemies import Enemy
+from data.constructors import build_map_object
+from test.pygame_mock import MockTimer, initialize_everything
+from test.testing_utilities import make_player
+
+ENEMY_COUNTS = (10, 50, 100, 250, 500, 1000, 2000)
+SPACING = 40  # Average distance between neighboring enemies.
+
+
+def _spawn_enemies(count: int) -> List[Enemy]:
+    player = make_player()
+    rng = Random(count)
+    side = SPACING * count ** 0.5
+    for _ in range(count):
+        pos = Vector2(rng.uniform(0, side), rng.uniform(0, side))
+        build_map_object('zombie', pos, player)
+    return model.GroupsAccess().groups.enemies.sprites()
+
+
+def _time_avoid_mobs(enemies: List[Enemy]) -> float:
+    def avoid_all() -> None:
+        for enemy in enemies:
+            enemy._avoid_mobs()
+
+    repeats = max(1, 2000 // len(enemies))
+    return min(timeit.repeat(avoid_all, number=repeats, repeat=3)) / repeats
+
+
+def main() -> None:
+    groups = model.Groups()
+    initialize_everything(groups, MockTimer())
+
+    print('%8s %14s %14s %8s' % ('enemies', 'brute (ms)', 'indexed (ms)',
+                                 'speedup'))
+    for count in ENEMY_COUNTS:
+        enemies = _spawn_enemies(count)
+        brute = _time_avoid_mobs(enemies)
+        groups.enemies.build_index()
+        indexed = _time_avoid_mobs(enemies)
+        print('%8d %14.3f %14.3f %8.1f' % (count, 1000 * brute,
+                                           1000 * indexed, brute / indexed))
+        groups.empty()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Time one behavior step per NPC type, interpreted and compiled.
+
+Effects are replaced by no-ops so only the state machine is timed.
+
+Run from the src directory with `python -m benchmarks.behavior`.
+"""
+import timeit
+from typing import Any, Callable
+
+from pygame.math import Vector2
+
+import model
+from data.constructors import build_map_object
+from test.pygame_mock import MockTimer, initialize_everything
+from test.testing_utilities import make_player
+
+NPC_LABELS = ('zombie', 'red_zombie', 'turret')
+DISTANCES = (100, 450, 600)
+NUMBER = 20000
+
+
+def _no_op(effect: Any, humanoid: Any) -> None:
+    pass
+
+
+def _time(step: Callable[[], Any]) -> float:
+    return min(timeit.repeat(step, number=NUMBER, repeat=3)) / NUMBER
+
+
+def main() -> None:
+    initialize_everything(model.Groups(), MockTimer())
+    player = make_player()
+
+    print('%11s %9s %17s %15s %8s' % ('npc', 'distance', 'interpreted (us)',
+                                      'compiled (us)', 'speedup'))
+    for label in NPC_LABELS:
+        for distance in DISTANCES:
+            enemy = build_map_object(label, Vector2(distance, 0), player)
+            behavior = enemy.behavior
+            for effect_type in {type(e) for e in behavior._effects}:
+                effect_type.activate = _no_op  # type: ignore
+
+            def interpreted() -> None:
+                enemy.status.state = behavior.determine_state(enemy)
+                behavior.do_state_behavior(enemy)
+
+            def compiled() -> None:
+                behavior.run(enemy)
+
+            slow = _time(interpreted)
+            fast = _time(compiled)
+            print('%11s %9d %17.2f %15.2f %7.1fx' % (
+                label, distance, 1e6 * slow, 1e6 * fast, slow / fast))
+
+
+if __name__ == '__main__':
+    main()
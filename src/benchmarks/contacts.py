@@ -0,0 +1,66 @@
+"""Time Dungeon._find_contacts with many enemies and bullets.
+
+Enemies and bullets are spread at a constant density around the player,
+so the cost of finding contacts should grow linearly with their numbers.
+The brute force column times pg.sprite.groupcollide on the same groups.
+
+Run from the src directory with `python -m benchmarks.contacts`.
+"""
+import time
+from random import Random
+
+import pygame as pg
+from pygame.math import Vector2
+
+import model
+from controllers.dungeon_controller import Dungeon
+from data.constructors import build_map_object
+from projectiles import ProjectileData, SimpleProjectile
+from test.pygame_mock import MockTimer, initialize_everything
+from view import images
+
+CASES = ((250, 25), (1000, 100), (2000, 500), (4000, 1000))
+SPACING = 40  # Average distance between neighboring enemies.
+REPEATS = 5
+
+
+def main() -> None:
+    groups = model.Groups()
+    initialize_everything(groups, MockTimer())
+    dungeon = Dungeon('farzomboz.tmx')
+    player = dungeon.player
+    bullet_data = ProjectileData(False, 10, 0, 1000, images.LITTLE_BULLET)
+
+    print('%8s %8s %16s %14s' % ('enemies', 'bullets', 'contacts (ms)',
+                                 'brute (ms)'))
+    for enemy_count, bullet_count in CASES:
+        rng = Random(enemy_count)
+        side = SPACING * enemy_count ** 0.5
+
+        def spread() -> Vector2:
+            return player.pos + Vector2(rng.uniform(-side / 2, side / 2),
+                                        rng.uniform(-side / 2, side / 2))
+
+        for enemy in groups.enemies.sprites():
+            enemy.kill()
+        for _ in range(enemy_count):
+            build_map_object('zombie', spread(), player)
+
+        contacts = brute = float('inf')
+        for _ in range(REPEATS):
+            groups.bullets.empty()
+            for _ in range(bullet_count):
+                SimpleProjectile(spread(), Vector2(1, 0), bullet_data)
+            start = time.perf_counter()
+            pg.sprite.groupcollide(groups.enemies, groups.bullets, False,
+                                   False)
+            brute = min(brute, time.perf_counter() - start)
+            start = time.perf_counter()
+            dungeon._find_contacts()
+            contacts = min(contacts, time.perf_counter() - start)
+        print('%8d %8d %16.2f %14.2f' % (enemy_count, bullet_count,
+                                         1000 * contacts, 1000 * brute))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Time drawing a frame with most enemies spread off screen.
+
+Enemies are scattered over a square WORLD_SIZE pixels wide, of which the
+screen shows about 2%.
+
+Run from the src directory with `python -m benchmarks.culling`.
+"""
+import timeit
+from random import Random
+
+from pygame.math import Vector2
+
+import model
+from controllers.dungeon_controller import Dungeon
+from data.constructors import build_map_object
+from test.pygame_mock import MockTimer, initialize_everything
+from view.dungeon_view import DungeonView
+
+ENEMY_COUNTS = (100, 500, 2000)
+WORLD_SIZE = 6000
+
+
+def main() -> None:
+    groups = model.Groups()
+    timer = MockTimer()
+    initialize_everything(groups, timer)
+    dungeon = Dungeon('farzomboz.tmx')
+    player = dungeon.player
+    view = DungeonView()
+    view.set_camera_range(WORLD_SIZE, WORLD_SIZE)
+    rng = Random(0)
+
+    def draw() -> None:
+        view.draw(player, dungeon.map)
+
+    print('%8s %12s' % ('enemies', 'draw (ms)'))
+    for count in ENEMY_COUNTS:
+        while len(groups.enemies) < count:
+            pos = Vector2(rng.uniform(0, WORLD_SIZE),
+                          rng.uniform(0, WORLD_SIZE))
+            build_map_object('zombie', pos, player)
+        groups.enemies.build_index()
+        draw()
+        seconds = min(timeit.repeat(draw, number=20, repeat=3)) / 20
+        print('%8d %12.2f' % (count, 1000 * seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Time drawing and presenting frames with and without dirty rects.
+
+The camera stays put while zombies walk around it, which is the case
+dirty rect rendering speeds up.
+
+Run from the src directory with `python -m benchmarks.dirty_rects`.
+"""
+import timeit
+from random import Random
+
+from pygame.math import Vector2
+
+import model
+from controllers.dungeon_controller import Dungeon
+from data.constructors import build_map_object
+from test.pygame_mock import MockTimer, initialize_everything
+from view.dungeon_view import DungeonView
+
+ENEMY_COUNTS = (0, 10, 50, 200)
+FRAMES = 50
+
+
+def main() -> None:
+    groups = model.Groups()
+    timer = MockTimer()
+    initialize_everything(groups, timer)
+    dungeon = Dungeon('farzomboz.tmx')
+    player = dungeon.player
+    view = DungeonView()
+    view.set_camera_range(dungeon.map.width, dungeon.map.height)
+    rng = Random(0)
+
+    def frame() -> None:
+        for enemy in groups.enemies:
+            enemy.pos += Vector2(rng.uniform(-2, 2), rng.uniform(-2, 2))
+        view.draw(player, dungeon.map)
+        view.update_display()
+
+    print('%8s %12s %12s %8s' % ('enemies', 'full (ms)', 'dirty (ms)',
+                                 'speedup'))
+    for count in ENEMY_COUNTS:
+        while len(groups.enemies) < count:
+            offset = Vector2(rng.uniform(-300, 300), rng.uniform(-200, 200))
+            build_map_object('zombie', player.pos + offset, player)
+        times = []
+        for dirty in (False, True):
+            view.dirty_rects = dirty
+            frame()
+            times.append(min(timeit.repeat(frame, number=FRAMES,
+                                           repeat=3)) / FRAMES)
+        print('%8d %12.2f %12.2f %7.1fx' % (
+            count, 1000 * times[0], 1000 * times[1], times[0] / times[1]))
+
+
+if __name__ == '__main__':
+    main()
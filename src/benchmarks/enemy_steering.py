@@ -0,0 +1,67 @@
+"""Time one frame of enemy movement, enemy by enemy and in a batch.
+
+Enemies crowd around the player so that most of them pursue it.
+
+Run from the src directory with `python -m benchmarks.enemy_steering`.
+"""
+import timeit
+from random import Random
+from typing import List
+
+from pygame.math import Vector2
+
+import model
+from creatures.enemies import Enemy
+from creatures.steering import EnemySteering
+from data.constructors import build_map_object
+from test.pygame_mock import MockTimer, initialize_everything
+from test.testing_utilities import make_player
+
+ENEMY_COUNTS = (10, 50, 100, 250, 500, 1000)
+SIDE = 600  # Enemies are spread over a square this wide around the player.
+
+
+def _spawn_enemies(count: int) -> List[Enemy]:
+    player = make_player()
+    rng = Random(count)
+    for _ in range(count):
+        pos = Vector2(rng.uniform(-SIDE / 2, SIDE / 2),
+                      rng.uniform(-SIDE / 2, SIDE / 2))
+        build_map_object('zombie', pos, player)
+    return model.GroupsAccess().groups.enemies.sprites()
+
+
+def main() -> None:
+    groups = model.Groups()
+    timer = MockTimer()
+    initialize_everything(groups, timer)
+    steering = EnemySteering()
+
+    def scalar() -> None:
+        groups.enemies.build_index()
+        for enemy in groups.enemies.sprites():
+            enemy.update()
+
+    def batch() -> None:
+        groups.enemies.build_index()
+        steering.update(groups.enemies, timer.dt)
+        for enemy in groups.enemies.sprites():
+            enemy.update()
+
+    print('%8s %14s %14s %8s' % ('enemies', 'scalar (ms)', 'batch (ms)',
+                                 'speedup'))
+    for count in ENEMY_COUNTS:
+        _spawn_enemies(count)
+        repeats = max(1, 1000 // count)
+        scalar_time = min(timeit.repeat(scalar, number=repeats,
+                                        repeat=3)) / repeats
+        batch_time = min(timeit.repeat(batch, number=repeats,
+                                       repeat=3)) / repeats
+        print('%8d %14.2f %14.2f %7.1fx' % (
+            count, 1000 * scalar_time, 1000 * batch_time,
+            scalar_time / batch_time))
+        groups.empty()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Report the memory used by each Enemy and Projectile, with tracemalloc.
+
+Run from the src directory with `python -m benchmarks.entity_memory`.
+"""
+import gc
+import tracemalloc
+from typing import Callable
+
+from pygame.math import Vector2
+
+import model
+from data.constructors import build_map_object
+from projectiles import ProjectileData, ProjectileFactory, SimpleProjectile
+from test.pygame_mock import MockTimer, initialize_everything
+from test.testing_utilities import make_player
+from view import images
+
+COUNT = 2000
+
+
+def _bytes_per_object(build: Callable[[int], None]) -> float:
+    # Build one first, so that caches filled on first use are not counted.
+    build(0)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for k in range(COUNT):
+        build(k)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    return sum(stat.size_diff for stat in stats) / COUNT
+
+
+def main() -> None:
+    groups = model.Groups()
+    initialize_everything(groups, MockTimer())
+    player = make_player()
+    data = ProjectileData(False, 10, 100, 1000, images.LITTLE_BULLET)
+    factory = ProjectileFactory(data)
+
+    def zombie(k: int) -> None:
+        build_map_object('zombie', Vector2(k, 0), player)
+
+    def turret(k: int) -> None:
+        build_map_object('turret', Vector2(k, 0), player)
+
+    def bullet(k: int) -> None:
+        factory.build(Vector2(k, 0), Vector2(1, 0))
+
+    def simple_bullet(k: int) -> None:
+        SimpleProjectile(Vector2(k, 0), Vector2(1, 0), data)
+
+    for label, build in (('zombie', zombie), ('turret', turret),
+                         ('FancyProjectile', bullet),
+                         ('SimpleProjectile', simple_bullet)):
+        print('%18s %8.0f bytes' % (label, _bytes_per_object(build)))
+        groups.empty()
+
+
+if __name__ == '__main__':
+    main()
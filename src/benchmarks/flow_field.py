@@ -0,0 +1,132 @@
+"""Compare zombies pursuing in a straight line and along flow field paths.
+
+Zombies are spawned on open cells of farzomboz.tmx within detection range
+of the player, who stands still. For each pursuit effect the report gives
+the steering time per frame, the number of wall collisions resolved, the
+number of flow field searches and how many zombies reached the player.
+
+The search a flow field runs each time its target enters another cell is
+then timed on farzomboz.tmx and on a large generated grid, bounded by
+PATH_REACH and over the whole grid.
+
+Run from the src directory with `python -m benchmarks.flow_field`.
+"""
+import math
+import time
+from random import Random
+from typing import Any, Callable, List
+
+from pygame.math import Vector2
+
+import model
+from controllers.dungeon_controller import Dungeon
+from creatures.steering import PATH_REACH
+from data.constructors import build_map_object
+from navigation import FlowField
+from occupancy import OccupancyGrid, Point
+from test.pygame_mock import MockTimer, initialize_everything
+
+ENEMY_COUNTS = (50, 200)
+FRAMES = 300
+REACHED_DISTANCE = 64
+NPC_TYPES = ('zombie', 'hunter_zombie')
+LARGE_GRID_CELLS = 200
+SEARCHES = 20
+
+
+def _counting(func: Callable, counts: List[int]) -> Callable:
+    def counted(*args: Any) -> Any:
+        hits = func(*args)
+        counts[0] += bool(hits)
+        return hits
+    return counted
+
+
+def run(npc_type: str, count: int) -> None:
+    groups = model.Groups()
+    timer = MockTimer()
+    initialize_everything(groups, timer)
+    dungeon = Dungeon('farzomboz.tmx')
+    player = dungeon.player
+    for enemy in groups.enemies.sprites():
+        enemy.kill()
+
+    rng = Random(count)
+    grid = dungeon.occupancy
+    spawned = 0
+    while spawned < count:
+        pos = player.pos + Vector2(rng.uniform(-380, 380),
+                                   rng.uniform(-380, 380))
+        distance = (pos - player.pos).length()
+        cell = grid.cell_of(pos)
+        if 150 < distance < 380 and grid.contains(cell) and \
+                not grid.is_blocked(cell):
+            build_map_object(npc_type, pos, player)
+            spawned += 1
+
+    collisions = [0]
+    walls = groups.walls
+    walls.collide_rect = _counting(walls.collide_rect, collisions)
+    steering = dungeon._steering
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        groups.enemies.build_index()
+        steering.update(groups.enemies, timer.dt)
+    elapsed = time.perf_counter() - start
+
+    reached = sum(1 for enemy in groups.enemies
+                  if (enemy.pos - player.pos).length() < REACHED_DISTANCE)
+    searches = sum(field.searches for field in steering._fields.values())
+    print('%-14s %8d %10.2f %12d %9d %8d' % (
+        npc_type, count, 1000 * elapsed / FRAMES, collisions[0], searches,
+        reached))
+
+
+def time_searches(name: str, grid: OccupancyGrid) -> None:
+    rng = Random(0)
+    rows, columns = grid.blocked.shape
+    targets: List[Point] = []
+    while len(targets) < SEARCHES:
+        cell = (rng.randrange(columns), rng.randrange(rows))
+        if not grid.is_blocked(cell):
+            targets.append(((cell[0] + 0.5) * grid.cell_width,
+                            (cell[1] + 0.5) * grid.cell_height))
+    for reach in (PATH_REACH, math.inf):
+        field = FlowField(grid, reach)
+        start = time.perf_counter()
+        for target in targets:
+            field.update(target)
+        elapsed = (time.perf_counter() - start) / SEARCHES
+        print('%-16s %8s %8d %12.2f %8d' % (
+            name, reach, columns * rows, 1000 * elapsed, len(field._costs)))
+
+
+def large_grid() -> OccupancyGrid:
+    rng = Random(1)
+    grid = OccupancyGrid(LARGE_GRID_CELLS, LARGE_GRID_CELLS, (64, 64))
+    for _ in range(LARGE_GRID_CELLS * 5):
+        x = 64 * rng.randrange(LARGE_GRID_CELLS)
+        y = 64 * rng.randrange(LARGE_GRID_CELLS)
+        if rng.random() < 0.5:
+            grid.block_area(x, y, 64 * rng.randint(1, 6), 64)
+        else:
+            grid.block_area(x, y, 64, 64 * rng.randint(1, 6))
+    return grid
+
+
+def main() -> None:
+    print('%-14s %8s %10s %12s %9s %8s' % (
+        'npc', 'enemies', 'frame (ms)', 'wall hits', 'searches', 'reached'))
+    for count in ENEMY_COUNTS:
+        for npc_type in NPC_TYPES:
+            run(npc_type, count)
+
+    print()
+    print('%-16s %8s %8s %12s %8s' % ('grid', 'reach', 'cells',
+                                      'search (ms)', 'kept'))
+    time_searches('farzomboz.tmx', Dungeon('farzomboz.tmx').occupancy)
+    time_searches('generated', large_grid())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Report the time and transient memory of one update and draw frame.
+
+A dungeon is filled with extra zombies and a steady stream of harmless
+bullets, then each frame runs Dungeon.update followed by DungeonView.draw.
+tracemalloc reports the peak memory allocated during a frame above what
+was held before it, which shrinks as per-frame temporaries such as Vector2
+and Rect objects are avoided. CPython does not expose a count of individual
+allocations. The rect properties of all sprites and the draw call are also
+timed on their own.
+
+Run from the src directory with `python -m benchmarks.frame_allocations`.
+"""
+import timeit
+import tracemalloc
+from random import Random
+
+from pygame.math import Vector2
+
+import model
+from controllers.dungeon_controller import Dungeon
+from data.constructors import build_map_object
+from projectiles import ProjectileData, ProjectileFactory
+from test.pygame_mock import MockTimer, initialize_everything
+from view import images
+from view.dungeon_view import DungeonView
+
+ENEMY_COUNT = 100
+BULLET_COUNT = 200
+FRAMES = 50
+
+
+def main() -> None:
+    groups = model.Groups()
+    timer = MockTimer()
+    initialize_everything(groups, timer)
+    dungeon = Dungeon('test_level.tmx')
+    view = DungeonView()
+    view.set_camera_range(dungeon.map.width, dungeon.map.height)
+
+    rng = Random(0)
+    player = dungeon.player
+    for _ in range(ENEMY_COUNT):
+        offset = Vector2(rng.uniform(-300, 300), rng.uniform(-300, 300))
+        build_map_object('zombie', player.pos + offset, player)
+    factory = ProjectileFactory(
+        ProjectileData(False, 0, 300, 10 ** 9, images.LITTLE_BULLET))
+
+    def frame() -> None:
+        # Bullets that hit a wall are replaced, keeping their number fixed.
+        for _ in range(BULLET_COUNT - len(groups.bullets)):
+            direction = Vector2(1, 0).rotate(rng.uniform(0, 360))
+            factory.build(player.pos, direction)
+        timer.current_time += 1
+        dungeon.update()
+        view.draw(player, dungeon.map)
+
+    for _ in range(5):
+        frame()
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(FRAMES):
+        tracemalloc.reset_peak()
+        held, _ = tracemalloc.get_traced_memory()
+        frame()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - held)
+    tracemalloc.stop()
+
+    frame_time = min(timeit.repeat(frame, number=FRAMES, repeat=3)) / FRAMES
+    print('enemies %d, bullets %d' % (len(groups.enemies),
+                                      len(groups.bullets)))
+    print('frame time (ms)           %8.2f' % (1000 * frame_time,))
+    print('median transient KiB      %8.1f' % (
+        sorted(peaks)[len(peaks) // 2] / 1024,))
+
+    sprites = groups.all_sprites.sprites()
+
+    def rects() -> None:
+        for sprite in sprites:
+            sprite.rect
+
+    def draw() -> None:
+        view.draw(player, dungeon.map)
+
+    for label, func, scale in (('all sprite rects (us)', rects, 1e6),
+                               ('draw (ms)', draw, 1e3)):
+        seconds = min(timeit.repeat(func, number=FRAMES, repeat=5)) / FRAMES
+        print('%-25s %8.2f' % (label, scale * seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Time night mode lighting with many lights against the frame budget.
+
+Dynamic lights mix the player, muzzle flashes and projectiles, all near the
+player. Static lights are spread over a large map.
+
+Run from the src directory with `python -m benchmarks.lighting`.
+"""
+import timeit
+from random import Random
+from typing import List
+
+import pygame as pg
+
+import settings
+from test.pygame_mock import initialize_pygame
+from view.lighting import Light, Lighting
+
+LIGHT_COUNTS = (1, 10, 50, 100)
+STATIC_LIGHT_COUNT = 200
+MAP_SIZE = 4000
+
+
+def _dynamic_lights(count: int, rng: Random) -> List[Light]:
+    lights = [((400, 300), settings.PLAYER_LIGHT_RADIUS)]
+    radii = (settings.MUZZLE_FLASH_LIGHT_RADIUS,
+             settings.PROJECTILE_LIGHT_RADIUS)
+    while len(lights) < count:
+        pos = (rng.randint(0, settings.WIDTH), rng.randint(0, settings.HEIGHT))
+        lights.append((pos, rng.choice(radii)))
+    return lights
+
+
+def main() -> None:
+    initialize_pygame()
+    screen = pg.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    rng = Random(0)
+    static_lights = [((rng.randint(0, MAP_SIZE), rng.randint(0, MAP_SIZE)),
+                      rng.choice((100, 175, 250)))
+                     for _ in range(STATIC_LIGHT_COUNT)]
+    budget = 1000 / settings.FPS
+
+    print('frame budget %.1f ms' % (budget,))
+    print('%8s %16s %16s' % ('lights', 'dynamic (ms)', '+ static (ms)'))
+    for count in LIGHT_COUNTS:
+        lights = _dynamic_lights(count, rng)
+        times = []
+        for lighting in (Lighting(), Lighting(static_lights)):
+            def frame() -> None:
+                lighting.render(screen, (-1000, -1000), lights)
+
+            frame()  # Bake the chunks on screen.
+            times.append(min(timeit.repeat(frame, number=20,
+                                           repeat=3)) / 20)
+        print('%8d %16.2f %16.2f' % (count, 1000 * times[0],
+                                     1000 * times[1]))
+
+
+if __name__ == '__main__':
+    main()
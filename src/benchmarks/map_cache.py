@@ -0,0 +1,43 @@
+"""Time loading each map with a cold and a warm map cache.
+
+A cold load parses the TMX file with pytmx and writes the cache entry, a
+warm load reads it back. A throwaway cache folder is used.
+
+Run from the src directory with `python -m benchmarks.map_cache`.
+"""
+import os
+import tempfile
+import timeit
+
+from map_cache import MapCache
+from test.pygame_mock import initialize_pygame
+from tilemap import TiledMap
+
+MAP_FILES = ('test_level.tmx', 'farzomboz.tmx', 'turnbased.tmx')
+REPEATS = 5
+
+
+def main() -> None:
+    initialize_pygame()
+    print('%-20s %10s %10s %12s' % ('map', 'cold (ms)', 'warm (ms)',
+                                    'entry (KiB)'))
+    for map_file in MAP_FILES:
+        with tempfile.TemporaryDirectory() as folder:
+            def cold() -> None:
+                for name in os.listdir(folder):
+                    os.remove(os.path.join(folder, name))
+                TiledMap(map_file, MapCache(folder))
+
+            def warm() -> None:
+                TiledMap(map_file, MapCache(folder))
+
+            cold_time = min(timeit.repeat(cold, number=1, repeat=REPEATS))
+            warm_time = min(timeit.repeat(warm, number=1, repeat=REPEATS))
+            size = sum(os.path.getsize(os.path.join(folder, name))
+                       for name in os.listdir(folder))
+        print('%-20s %10.1f %10.1f %12.0f' % (map_file, 1000 * cold_time,
+                                              1000 * warm_time, size / 1024))
+
+
+if __name__ == '__main__':
+    main()
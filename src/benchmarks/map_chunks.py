@@ -0,0 +1,109 @@
+"""Compare load time and peak memory of a full and a chunked map image.
+
+A 200x200 tile map with two random tile layers is generated. In 'full'
+mode the whole map is rendered into one surface, as TiledMap used to do on
+load. In 'chunked' mode a MapImage draws the first frame, then the camera
+sweeps across the map. Each mode runs in its own process so that its peak
+resident set size can be reported.
+
+Run from the src directory with `python -m benchmarks.map_chunks`.
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from random import Random
+
+import pygame as pg
+
+import settings
+from map_cache import MapCache
+from test.pygame_mock import initialize_pygame
+from tilemap import TiledMap
+from view.map_image import MapImage
+
+MAP_TILES = 200
+TILE_SIZE = 64
+SWEEP_FRAMES = 200
+_TILESET = os.path.join(os.path.dirname(__file__), '..', 'img',
+                        'spritesheet_tiles.png')
+
+
+def write_map(file_name: str) -> None:
+    rng = Random(0)
+    layers = []
+    for name in ('ground', 'detail'):
+        rows = [','.join(str(rng.randint(1, 8)) for _ in range(MAP_TILES))
+                for _ in range(MAP_TILES)]
+        layers.append(
+            ' <layer name="%s" width="%d" height="%d">\n'
+            '  <data encoding="csv">\n%s\n</data>\n </layer>\n'
+            % (name, MAP_TILES, MAP_TILES, ',\n'.join(rows)))
+    with open(file_name, 'w') as tmx:
+        tmx.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<map version="1.0" orientation="orthogonal" '
+            'renderorder="right-down" width="%d" height="%d" '
+            'tilewidth="%d" tileheight="%d" nextobjectid="1">\n'
+            ' <tileset firstgid="1" name="spritesheet_tiles" tilewidth="%d" '
+            'tileheight="%d" spacing="10" tilecount="540">\n'
+            '  <image source="%s" width="1988" height="1470"/>\n'
+            ' </tileset>\n%s</map>\n'
+            % (MAP_TILES, MAP_TILES, TILE_SIZE, TILE_SIZE, TILE_SIZE,
+               TILE_SIZE, os.path.abspath(_TILESET), ''.join(layers)))
+
+
+def run(mode: str, file_name: str) -> None:
+    initialize_pygame()
+    screen = pg.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    start = time.perf_counter()
+    # An absolute file name is used as is by TiledMap. The map is parsed,
+    # not read from the map cache.
+    with tempfile.TemporaryDirectory() as cache_folder:
+        tile_map = TiledMap(file_name, MapCache(cache_folder))
+    if mode == 'full':
+        image = tile_map.make_map_img()
+        screen.blit(image, (0, 0))
+    else:
+        chunks = MapImage(tile_map)
+        chunks.draw(screen, (0, 0))
+    load = time.perf_counter() - start
+
+    sweep = '-'
+    if mode == 'chunked':
+        start = time.perf_counter()
+        span = tile_map.width - screen.get_width()
+        for frame in range(SWEEP_FRAMES):
+            x = -span * frame // SWEEP_FRAMES
+            chunks.draw(screen, (x, x * screen.get_height() //
+                                 screen.get_width()))
+        seconds = (time.perf_counter() - start) / SWEEP_FRAMES
+        sweep = '%.2f' % (1000 * seconds,)
+
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print('%-8s %10.0f %14s %14.0f' % (mode, 1000 * load, sweep, peak_mib))
+
+
+def main() -> None:
+    if len(sys.argv) == 3:
+        run(sys.argv[1], sys.argv[2])
+        return
+    with tempfile.TemporaryDirectory() as folder:
+        file_name = os.path.join(folder, 'generated.tmx')
+        write_map(file_name)
+        print('%d x %d tiles of %d pixels' % (MAP_TILES, MAP_TILES,
+                                              TILE_SIZE))
+        print('%-8s %10s %14s %14s' % ('mode', 'load (ms)', 'frame (ms)',
+                                       'peak RSS (MiB)'))
+        sys.stdout.flush()
+        for mode in ('full', 'chunked'):
+            options = ['-W' + option for option in sys.warnoptions]
+            subprocess.run([sys.executable] + options +
+                           ['-m', 'benchmarks.map_chunks', mode, file_name],
+                           check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Time computing the move options of party members in a turn based map.
+
+First the active member is given each speed in SPEEDS, and its move options
+are computed with an empty and with a warm range cache. Then a party of
+PARTY_SIZE members takes ROUNDS rounds of turns without moving, as while
+the player looks through the turn order, which after the first round is
+served from the cache.
+
+Run from the src directory with `python -m benchmarks.move_options`.
+"""
+import time
+import timeit
+
+from pygame.math import Vector2
+
+import model
+from controllers.base import initialize_controller
+from controllers.turnbased_controller import TurnBasedController, \
+    TurnBasedDungeon
+from creatures.party_member import PartyMember
+from test.pygame_mock import MockTimer, initialize_everything
+
+MAP_FILE = 'turnbased.tmx'
+SPEEDS = (2, 5, 10)
+PARTY_SIZE = 36
+PARTY_SPEED = 6
+ROUNDS = 3
+
+
+def main() -> None:
+    initialize_everything(model.Groups(), MockTimer())
+    initialize_controller(None)
+    controller = TurnBasedController(TurnBasedDungeon(MAP_FILE), [])
+    view = controller._view
+    ranges = view._move_ranges
+    member = view._party.active_member
+    print('walls: %d' % (len(view.groups.walls),))
+    print('%6s %8s %10s %10s' % ('speed', 'options', 'cold (ms)',
+                                 'warm (ms)'))
+
+    def cold() -> None:
+        ranges._ranges.clear()
+        view._move_option_rects()
+
+    for speed in SPEEDS:
+        member.speed = speed
+        cold_time = min(timeit.repeat(cold, number=5, repeat=3)) / 5
+        warm_time = min(timeit.repeat(view._move_option_rects, number=5,
+                                      repeat=3)) / 5
+        print('%6d %8d %10.2f %10.3f' % (speed, len(view._move_options),
+                                         1000 * cold_time, 1000 * warm_time))
+
+    party = view._party
+    image = member.image
+    del party[:]
+    for index in range(PARTY_SIZE):
+        pos = Vector2(48 + 64 * (index % 6), 48 + 64 * (index // 6))
+        party.add_member(PartyMember(pos, image, PARTY_SPEED))
+    ranges._ranges.clear()
+    searches = ranges.searches
+    start = time.perf_counter()
+    for _ in range(ROUNDS * PARTY_SIZE):
+        view._move_option_rects()
+        party.next_member()
+    elapsed = time.perf_counter() - start
+    print('party of %d, speed %d, %d rounds: %.1f ms, %d searches' % (
+        PARTY_SIZE, PARTY_SPEED, ROUNDS, 1000 * elapsed,
+        ranges.searches - searches))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Time the projectile vs wall test of ProjectileGroup.step.
+
+Walls of one to four 64 pixel tiles are scattered over a square map, and
+projectiles over the same area. StaticGroup.overlaps_any, which only
+compares projectiles with the walls sharing a grid cell, is timed against
+a broadcast comparing every projectile with every wall.
+
+Run from the src directory with `python -m benchmarks.projectile_walls`.
+"""
+import timeit
+from random import Random
+from typing import Tuple
+
+import numpy as np
+import pygame as pg
+from pygame.sprite import Sprite
+
+from spatial import StaticGroup
+
+WALL_COUNTS = (58, 600, 2000)
+PROJECTILE_COUNTS = (300, 2000)
+TILE = 64
+# Walls cover about a tenth of the map.
+MAP_TILES_PER_WALL = 25
+
+
+class _Wall(Sprite):
+    def __init__(self, group: StaticGroup, rect: pg.Rect) -> None:
+        super().__init__(group)
+        self.rect = rect
+
+
+def _walls(count: int) -> StaticGroup:
+    rng = Random(count)
+    side = int((count * MAP_TILES_PER_WALL) ** 0.5)
+    walls = StaticGroup()
+    for _ in range(count):
+        _Wall(walls, pg.Rect(TILE * rng.randrange(side),
+                             TILE * rng.randrange(side),
+                             TILE * rng.randint(1, 4), TILE))
+    return walls
+
+
+def _projectiles(count: int, side: int) -> Tuple[np.ndarray, ...]:
+    rng = np.random.RandomState(count)
+    lefts = np.round(rng.uniform(0, side, count))
+    tops = np.round(rng.uniform(0, side, count))
+    return lefts, tops, lefts + 6, tops + 6
+
+
+def _broadcast(walls: StaticGroup, lefts: np.ndarray, tops: np.ndarray,
+               rights: np.ndarray, bottoms: np.ndarray) -> np.ndarray:
+    bounds = walls._bounds
+    hits = lefts[:, None] < bounds[:, 2]
+    hits &= rights[:, None] > bounds[:, 0]
+    hits &= tops[:, None] < bounds[:, 3]
+    hits &= bottoms[:, None] > bounds[:, 1]
+    return hits.any(axis=1)
+
+
+def main() -> None:
+    print('%8s %12s %12s %16s' % ('walls', 'projectiles', 'indexed (ms)',
+                                  'broadcast (ms)'))
+    for wall_count in WALL_COUNTS:
+        walls = _walls(wall_count)
+        walls.build_index()
+        side = TILE * int((wall_count * MAP_TILES_PER_WALL) ** 0.5)
+        for count in PROJECTILE_COUNTS:
+            bounds = _projectiles(count, side)
+            assert (walls.overlaps_any(*bounds) ==
+                    _broadcast(walls, *bounds)).all()
+            grid = min(timeit.repeat(lambda: walls.overlaps_any(*bounds),
+                                     number=20, repeat=3)) / 20
+            brute = min(timeit.repeat(lambda: _broadcast(walls, *bounds),
+                                      number=20, repeat=3)) / 20
+            print('%8d %12d %12.3f %16.3f' % (wall_count, count,
+                                              1000 * grid, 1000 * brute))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Time reading the image of rotated sprites with and without the cache.
+
+Run from the src directory with `python -m benchmarks.rotation_cache`.
+"""
+import timeit
+from random import Random
+
+from pygame.math import Vector2
+
+import model
+from data.constructors import build_map_object
+from projectiles import ProjectileData, ProjectileFactory
+from test.pygame_mock import MockTimer, initialize_everything
+from test.testing_utilities import make_player
+from view import images
+
+SPRITE_COUNT = 200
+
+
+def main() -> None:
+    groups = model.Groups()
+    timer = MockTimer()
+    initialize_everything(groups, timer)
+    player = make_player()
+    rng = Random(0)
+    factory = ProjectileFactory(
+        ProjectileData(False, 10, 300, 1000, images.LITTLE_BULLET,
+                       angled_image=True))
+    for _ in range(SPRITE_COUNT):
+        enemy = build_map_object('zombie', Vector2(0, 0), player)
+        enemy.motion.rot = rng.uniform(0, 360)
+        factory.build(Vector2(0, 0), Vector2(1, 0).rotate(rng.uniform(0, 360)))
+    player.motion.rot = 33.3
+    sprites = groups.all_sprites.sprites()
+
+    def frame() -> None:
+        for sprite in sprites:
+            sprite.image
+
+    print('%-10s %12s %10s' % ('step', 'frame (ms)', 'cached'))
+    for step in (None, 1, 2, 5):
+        cache = images.RotationCache(step or 1)
+        cache.enabled = step is not None
+        images.rotation_cache = cache
+        frame()
+        seconds = min(timeit.repeat(frame, number=20, repeat=3)) / 20
+        print('%-10s %12.2f %10d' % (step or 'exact', 1000 * seconds,
+                                     len(cache)))
+
+
+if __name__ == '__main__':
+    main()
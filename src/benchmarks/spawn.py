@@ -0,0 +1,49 @@
+"""Time spawning enemies, with behaviors built from scratch and copied.
+
+Run from the src directory with `python -m benchmarks.spawn`.
+"""
+import timeit
+
+from pygame.math import Vector2
+
+import model
+from creatures.enemies import Behavior, spawn_behavior
+from data.constructors import build_map_object
+from data.input_output import load_npc_data_kwargs
+from test.pygame_mock import MockTimer, initialize_everything
+from test.testing_utilities import make_player
+
+NPC_LABELS = ('zombie', 'red_zombie', 'turret')
+NUMBER = 2000
+
+
+def main() -> None:
+    groups = model.Groups()
+    initialize_everything(groups, MockTimer())
+    player = make_player()
+
+    print('%11s %13s %13s %8s %16s' % ('npc', 'built (us)', 'copied (us)',
+                                       'speedup', 'spawns/s'))
+    for label in NPC_LABELS:
+        behavior_dict = load_npc_data_kwargs(label)['behavior']
+
+        def built() -> None:
+            Behavior(behavior_dict, player)
+
+        def copied() -> None:
+            spawn_behavior(behavior_dict, player)
+
+        def spawn() -> None:
+            build_map_object(label, Vector2(0, 0), player)
+
+        slow = min(timeit.repeat(built, number=NUMBER, repeat=3)) / NUMBER
+        fast = min(timeit.repeat(copied, number=NUMBER, repeat=3)) / NUMBER
+        spawn_time = min(timeit.repeat(spawn, number=NUMBER,
+                                       repeat=3)) / NUMBER
+        groups.empty()
+        print('%11s %13.1f %13.1f %7.1fx %16.0f' % (
+            label, 1e6 * slow, 1e6 * fast, slow / fast, 1 / spawn_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Report how many wall objects each map has before and after merging.
+
+Run from the src directory with `python -m benchmarks.wall_counts`.
+"""
+from os import path, walk
+from typing import List
+
+from test.pygame_mock import initialize_pygame
+from tilemap import TiledMap
+
+
+def _map_files() -> List[str]:
+    map_folder = path.join(path.dirname(path.dirname(__file__)), 'maps')
+    map_files = []
+    for folder, _, file_names in walk(map_folder):
+        for file_name in file_names:
+            if file_name.endswith('.tmx'):
+                full_path = path.join(folder, file_name)
+                map_files.append(path.relpath(full_path, map_folder))
+    return sorted(map_files)
+
+
+def main() -> None:
+    initialize_pygame()
+    print('%-30s %8s %8s' % ('map', 'before', 'after'))
+    for map_file in _map_files():
+        try:
+            tile_map = TiledMap(map_file)
+        except ValueError as error:
+            print('%-30s skipped (%s)' % (map_file, error))
+            continue
+        print('%-30s %8d %8d' % (map_file, tile_map.raw_wall_count,
+                                 tile_map.wall_count))
+
+
+if __name__ == '__main__':
+    main()
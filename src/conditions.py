@@ -1,6 +1,8 @@
 from enum import Enum
 from random import random
-from typing import Any, Dict
+from typing import Any, Dict, Sequence, Union
+
+import numpy as np
 
 from model import GameObject, TimeAccess
 
@@ -19,6 +21,8 @@ class Conditions(Enum):
 class Condition(object):
     """Evaluates a boolean function on a Humanoid."""
 
+    __slots__ = ()
+
     def check(self, humanoid: Any) -> bool:
         raise NotImplementedError
 
@@ -35,6 +39,8 @@ class Condition(object):
 
 
 class _Not(Condition):
+    __slots__ = ('_cond',)
+
     def __init__(self, cond: Condition) -> None:
         self._cond = cond
 
@@ -43,6 +49,8 @@ class _Not(Condition):
 
 
 class _Or(Condition):
+    __slots__ = ('_cond_0', '_cond_1')
+
     def __init__(self, cond_0: Condition, cond_1: Condition) -> None:
         self._cond_0 = cond_0
         self._cond_1 = cond_1
@@ -52,6 +60,8 @@ class _Or(Condition):
 
 
 class _And(Condition):
+    __slots__ = ('_cond_0', '_cond_1')
+
     def __init__(self, cond_0: Condition, cond_1: Condition) -> None:
         self._cond_0 = cond_0
         self._cond_1 = cond_1
@@ -60,14 +70,64 @@ class _And(Condition):
         return self._cond_0.check(humanoid) and self._cond_1.check(humanoid)
 
 
+class TargetDistances(object):
+    """Squared distances from humanoids to their targets.
+
+    update computes the distances of every humanoid in one vectorized pass.
+    They are only valid while neither the humanoids nor their targets move,
+    so whoever calls update must call clear before anything moves.
+    """
+
+    __slots__ = ('_rows', '_dist_sq')
+
+    def __init__(self) -> None:
+        self._rows: Dict[Any, int] = {}
+        self._dist_sq = np.zeros(0)
+
+    def update(self, humanoids: Sequence[Any]) -> None:
+        positions = np.array([tuple(h.pos) for h in humanoids])
+        targets = np.array([tuple(h.target.pos) for h in humanoids])
+        disp = (positions - targets).reshape(-1, 2)
+        self._dist_sq = (disp * disp).sum(axis=1)
+        self._rows = {h: row for row, h in enumerate(humanoids)}
+
+    def clear(self) -> None:
+        self._rows.clear()
+
+    def get(self, humanoid: Any, target: Any) -> Union[float, None]:
+        """Squared distance from humanoid to target, if known."""
+        row = self._rows.get(humanoid)
+        if row is None or humanoid.target is not target:
+            return None
+        return self._dist_sq[row]
+
+
+target_distances = TargetDistances()
+
+
 class TargetClose(Condition):
-    def __init__(self, target: GameObject, close_threshold: float) -> None:
+    """Whether the humanoid is close to target.
+
+    A target of None stands for the humanoid's own target, so that the
+    condition can be shared by behaviors with different targets.
+    """
+    __slots__ = ('_target', '_close_threshold', '_threshold_sq')
+
+    def __init__(self, target: Union[GameObject, None],
+                 close_threshold: float) -> None:
         self._target = target
         self._close_threshold = close_threshold
+        self._threshold_sq = close_threshold ** 2
 
     def check(self, humanoid: Any) -> bool:
-        target_disp = humanoid.pos - self._target.pos
-        return target_disp.length() < self._close_threshold
+        target = self._target
+        if target is None:
+            target = humanoid.target
+        dist_sq = target_distances.get(humanoid, target)
+        if dist_sq is None:
+            target_disp = humanoid.pos - target.pos
+            dist_sq = target_disp.length_squared()
+        return dist_sq < self._threshold_sq
 
 
 class RandomEventAtRate(Condition, TimeAccess):
@@ -76,6 +136,8 @@ class RandomEventAtRate(Condition, TimeAccess):
     It is assumed that check is called at every time step.
     """
 
+    __slots__ = ('_rate',)
+
     def check(self, humanoid: Any) -> bool:
         return random() < self.timer.dt * self._rate
 
@@ -85,6 +147,8 @@ class RandomEventAtRate(Condition, TimeAccess):
 
 
 class CooldownCondition(Condition, TimeAccess):
+    __slots__ = ('_cool_down_time', '_last_use')
+
     def __init__(self, cool_down_time: int) -> None:
         self._cool_down_time = cool_down_time
         self._last_use = self.timer.current_time
@@ -105,6 +169,8 @@ class CooldownCondition(Condition, TimeAccess):
 
 
 class EnergyAvailable(Condition):
+    __slots__ = ('_energy_required',)
+
     def __init__(self, energy_required: int) -> None:
         self._energy_required = energy_required
 
@@ -113,22 +179,30 @@ class EnergyAvailable(Condition):
 
 
 class IsDamaged(Condition):
+    __slots__ = ()
+
     def check(self, humanoid: Any) -> bool:
         return humanoid.status.damaged
 
 
 class EnergyNotFull(Condition):
+    __slots__ = ()
+
     def check(self, humanoid: Any) -> bool:
         source = humanoid.energy_source
         return source.energy_available < source.max_energy
 
 
 class IsDead(Condition):
+    __slots__ = ()
+
     def check(self, humanoid: Any) -> bool:
         return humanoid.status.is_dead
 
 
 class AlwaysTrue(Condition):
+    __slots__ = ()
+
     def check(self, humanoid: Any) -> bool:
         return True
 
@@ -1,8 +1,7 @@
 from random import random
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, NamedTuple, Tuple, Set
 
 import pygame as pg
-from pygame.sprite import spritecollide, groupcollide
 
 import controllers.base
 import model
@@ -10,16 +9,18 @@ import mods
 import tilemap
 from controllers import keyboards
 from creatures.enemies import Enemy
-from creatures.humanoids import collide_hit_rect_with_rect, HumanoidData
+from creatures.humanoids import HumanoidData
 from creatures.players import Player
+from creatures.steering import EnemySteering
 from data import constructors
 from items import ItemObject
+from occupancy import OccupancyGrid
 from projectiles import Projectile
 from quests.resolutions import Resolution, RequiresTeleport
-from view import dungeon_view, sounds
+from view import dungeon_view, images, sounds
 
 
-class Dungeon(model.GroupsAccess):
+class Dungeon(model.GroupsAccess, model.TimeAccess):
     """Stores and updates GameObjects in a dungeon map."""
 
     def __init__(self, map_file: str) -> None:
@@ -28,6 +29,9 @@ class Dungeon(model.GroupsAccess):
         self.map = tilemap.TiledMap(map_file)
         self.labeled_sprites: Dict[str, Set[model.GameObject]] = {}
         self._init_map_objects()
+        # Walls at tile resolution, for enemies pursuing along paths.
+        self.occupancy = OccupancyGrid.from_map(self.map)
+        self._steering = EnemySteering(self.occupancy)
 
     def _init_map_objects(self) -> None:
 
@@ -41,6 +45,8 @@ class Dungeon(model.GroupsAccess):
         builder = constructors.build_map_object
         for obj in self.map.objects:
 
+            if obj.type == tilemap.ObjectType.LIGHT:
+                continue  # Lights are only drawn, see view.lighting.
             if obj.type == tilemap.ObjectType.PLAYER:
                 game_obj = self.player
             else:
@@ -54,22 +60,34 @@ class Dungeon(model.GroupsAccess):
                 else:
                     self.labeled_sprites[label].add(game_obj)
 
+        # Walls never move, so they are indexed once for collision queries.
+        self.groups.walls.build_index()
+
     def update(self) -> None:
 
+        # Projectiles are moved in batches, their own updates then do nothing.
+        dt = self.timer.dt
+        now = self.timer.current_time
+        self.groups.bullets.step(dt, now, self.groups.walls)
+        self.groups.enemy_projectiles.step(dt, now, self.groups.walls)
+
+        # Enemies query each other by position while updating. They are
+        # moved in a batch as well, their own updates then do nothing.
+        self.groups.enemies.build_index()
+        self._steering.update(self.groups.enemies, dt)
         self.groups.all_sprites.update()
 
         self._handle_collisions()
 
     def _handle_collisions(self) -> None:
+        contacts = self._find_contacts()
+
         # player hits items
-        items: List[ItemObject] = spritecollide(self.player, self.groups.items,
-                                                False)
-        for item in items:
+        for item in contacts.items:
             self.player.inventory.attempt_pickup(item)
 
         # obs hit player
-        hitters: List[Enemy] = spritecollide(self.player, self.groups.enemies,
-                                             False, collide_hit_rect_with_rect)
+        hitters = contacts.hitters
         for zombie in hitters:
             if random() < 0.7:
                 sounds.player_hit_sound()
@@ -81,20 +99,57 @@ class Dungeon(model.GroupsAccess):
             self.player.pos += knock_back.rotate(-hitters[0].motion.rot)
 
         # enemy projectiles hit player
-        projectiles: List[Projectile] = spritecollide(
-            self.player, self.groups.enemy_projectiles, True,
-            collide_hit_rect_with_rect)
-        for projectile in projectiles:
+        for projectile in contacts.projectiles:
             self.player.status.increment_health(-projectile.damage)
 
         # bullets hit hitting_mobs
-        hits: Dict[Enemy, List[Projectile]] = groupcollide(
-            self.groups.enemies, self.groups.bullets, False, True)
-        for mob, bullets in hits.items():
+        for mob, bullets in contacts.bullet_hits.items():
             mob.status.increment_health(
                 -sum(bullet.damage for bullet in bullets))
             mob.motion.stop()
 
+    def _find_contacts(self) -> '_Contacts':
+        """Find all colliding pairs using the grids of the dynamic groups.
+
+        Gives the same hits, in the same order, as spritecollide and
+        groupcollide. Projectiles that hit something are killed.
+        """
+        groups = self.groups
+        for group in (groups.items, groups.enemies, groups.bullets,
+                      groups.enemy_projectiles):
+            group.refresh_index()
+
+        hit_rect = self.player.motion.hit_rect
+        items: List[ItemObject] = groups.items.collide_rect(self.player.rect)
+        hitters: List[Enemy] = groups.enemies.collide_rect(hit_rect)
+        projectiles: List[Projectile] = \
+            groups.enemy_projectiles.collide_rect(hit_rect)
+        for projectile in projectiles:
+            projectile.kill()
+
+        # Each bullet is looked up in the enemy grid and counts for the
+        # first enemy it hits.
+        hits: Dict[Enemy, List[Projectile]] = {}
+        for bullet in groups.bullets.sprites():
+            mobs = groups.enemies.collide_rect(bullet.rect)
+            if mobs:
+                if mobs[0] in hits:
+                    hits[mobs[0]].append(bullet)
+                else:
+                    hits[mobs[0]] = [bullet]
+                bullet.kill()
+        bullet_hits = {mob: hits[mob]
+                       for mob in groups.enemies.in_group_order(hits)}
+
+        return _Contacts(items, hitters, projectiles, bullet_hits)
+
+
+class _Contacts(NamedTuple):
+    items: List[ItemObject]
+    hitters: List[Enemy]
+    projectiles: List[Projectile]
+    bullet_hits: Dict[Enemy, List[Projectile]]
+
 
 class DungeonController(controllers.base.Controller):
     """Manages interactions between a Dungeon, DungeonView, Resolutions, and
@@ -126,7 +181,7 @@ class DungeonController(controllers.base.Controller):
             res.can_resolve for res in self._teleport_resolutions)
         self._view.draw(self._dungeon.player, self._dungeon.map)
 
-        pg.display.flip()
+        self._view.update_display()
 
     def update(self) -> None:
 
@@ -151,6 +206,10 @@ class DungeonController(controllers.base.Controller):
 
         self.keyboard.bind_on_press(pg.K_n, self._view.toggle_night)
         self.keyboard.bind_on_press(pg.K_h, self._view.toggle_debug)
+        # Compare cached, quantized sprite rotations with exact ones.
+        self.keyboard.bind_on_press(pg.K_j, images.toggle_rotation_cache)
+        # Compare dirty rect rendering with full redraws.
+        self.keyboard.bind_on_press(pg.K_u, self._view.toggle_dirty_rects)
 
         # players controls
         self.keyboard.bind(pg.K_LEFT, player.translate_left)
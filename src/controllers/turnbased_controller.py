@@ -4,6 +4,7 @@ import controllers.base
 import model
 
 import tilemap
+from occupancy import OccupancyGrid
 
 from creatures.humanoids import HumanoidData
 from creatures.players import Player
@@ -20,6 +21,7 @@ class TurnBasedDungeon(model.GroupsAccess):
 
         # init_map
         self.map = tilemap.TiledMap(map_file)
+        self.occupancy = OccupancyGrid.from_map(self.map)
         self.labeled_sprites: Dict[str, Set[model.GameObject]] = {}
         self._init_map_objects()
 
@@ -35,6 +37,8 @@ class TurnBasedDungeon(model.GroupsAccess):
         builder = constructors.build_map_object
         for obj in self.map.objects:
 
+            if obj.type == tilemap.ObjectType.LIGHT:
+                continue  # Lights are only drawn, see view.lighting.
             if obj.type == tilemap.ObjectType.PLAYER:
                 game_obj = self.player
             else:
@@ -67,7 +71,8 @@ class TurnBasedController(controllers.base.Controller):
         # roll initiative
         self._party.prepare_for_combat()
 
-        self._view = turnbased_view.TurnBasedView(self._party)
+        self._view = turnbased_view.TurnBasedView(self._party,
+                                                  dungeon.occupancy)
         self._view.set_camera_range(self._dungeon.map.width,
                                     self._dungeon.map.height)
 
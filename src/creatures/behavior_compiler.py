@@ -0,0 +1,149 @@
+"""Compiles Behavior data into generated Python functions.
+
+The function built from a behavior dict does the work of
+Behavior.determine_state followed by Behavior.do_state_behavior, but with
+every condition inlined as an expression instead of a tree of Condition
+objects:
+
+    def behave(humanoid, target, effects):
+        ...
+        return state
+
+effects holds the Effect objects of the Behavior, listed state by state
+in the order of the behavior dict. Conditions joined by `and` are reordered
+so that cheap ones short-circuit expensive ones.
+"""
+from random import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from conditions import Conditions, target_distances
+
+BehaviorData = Dict[str, Any]
+BehaviorFunction = Callable[[Any, Any, Tuple[Any, ...]], str]
+
+# Relative cost of evaluating each condition.
+_COSTS = {Conditions.ALWAYS: 0,
+          Conditions.DEAD: 1,
+          Conditions.DAMAGED: 1,
+          Conditions.TARGET_CLOSE: 2,
+          Conditions.RANDOM_RATE: 3}
+
+# Compiled functions keyed by the repr of their behavior dict.
+_compiled: Dict[str, BehaviorFunction] = {}
+
+
+def compile_behavior(behavior_dict: BehaviorData) -> BehaviorFunction:
+    """The function for behavior_dict, compiled once per distinct dict."""
+    key = repr(behavior_dict)
+    if key not in _compiled:
+        namespace = {'random': random, 'target_distances': target_distances}
+        code = compile(behavior_source(behavior_dict), '<behavior>', 'exec')
+        exec(code, namespace)
+        _compiled[key] = namespace['behave']
+    return _compiled[key]
+
+
+def behavior_source(behavior_dict: BehaviorData) -> str:
+    default_state = None
+    priority_lines: List[str] = []
+    effect_lines: List[str] = []
+    labels: List[Conditions] = []
+    effect_index = 0
+
+    for state, state_data in behavior_dict.items():
+        assert 'conditions' in state_data
+        conditions_list = state_data['conditions']
+        if 'default' in conditions_list:
+            assert default_state is None, 'Cannot have more than one ' \
+                                          'default state.'
+            default_state = state
+        else:
+            priority_lines += _priority_lines(state, conditions_list, labels)
+
+        effect_datas = state_data['effects'] or {}
+        state_lines = []
+        for effect_data in effect_datas.values():
+            call = 'effects[%d].activate(humanoid)' % (effect_index,)
+            effect_index += 1
+            if effect_data is None or 'conditions' not in effect_data:
+                state_lines.append(call)
+                continue
+            terms = sorted((_condition(data, labels)
+                            for data in effect_data['conditions']),
+                           key=_first)
+            condition = ' and '.join(expr for _, expr in terms)
+            state_lines += ['if %s:' % (condition,), '    ' + call]
+        if state_lines:
+            keyword = 'elif' if effect_lines else 'if'
+            effect_lines.append('%s state == %r:' % (keyword, state))
+            effect_lines += ['    ' + line for line in state_lines]
+
+    lines = ['def behave(humanoid, target, effects):']
+    body: List[str] = []
+    # Effects do not move the humanoid or its target, so the distance
+    # between them is computed once.
+    if Conditions.TARGET_CLOSE in labels:
+        body += ['dist_sq = target_distances.get(humanoid, target)',
+                 'if dist_sq is None:',
+                 '    dist_sq = (humanoid.pos - target.pos).length_squared()']
+    if Conditions.RANDOM_RATE in labels:
+        body.append('dt = humanoid.timer.dt')
+    body += ['state = %r' % (default_state,), 'best = 0']
+    body += priority_lines
+    body.append('humanoid.status.state = state')
+    body += effect_lines
+    body.append('return state')
+    lines += ['    ' + line for line in body]
+    return '\n'.join(lines) + '\n'
+
+
+def _priority_lines(state: str, conditions_list: List[Dict],
+                    labels: List[Conditions]) -> List[str]:
+    """Lines making state the current state if its priority is highest."""
+    values = []
+    for cond_data in conditions_list:
+        assert len(cond_data.keys()) == 1
+        label_str = next(iter(cond_data.keys()))
+        _, expr = _condition(cond_data, labels)
+        values.append((expr, cond_data[label_str]['value']))
+
+    take_state = ['    best = %s' % ('priority' if len(values) > 1
+                                     else repr(values[0][1]),),
+                  '    state = %r' % (state,)]
+    if len(values) == 1:
+        expr, value = values[0]
+        return ['if %s and %r > best:' % (expr, value)] + take_state
+    lines = ['priority = 0']
+    for expr, value in values:
+        lines += ['if %s:' % (expr,), '    priority += %r' % (value,)]
+    return lines + ['if priority > best:'] + take_state
+
+
+def _condition(condition_data: Dict,
+               labels: List[Conditions]) -> Tuple[int, str]:
+    """The cost and Python expression of a condition in npcs.yml format."""
+    assert len(condition_data.keys()) == 1
+    label_str = next(iter(condition_data.keys()))
+    label = Conditions(label_str)
+    params = condition_data[label_str]
+    if label == Conditions.RANDOM_RATE:
+        expr = 'random() < dt * %r' % (params['rate'],)
+    elif label == Conditions.TARGET_CLOSE:
+        expr = 'dist_sq < %r' % (params['threshold'] ** 2,)
+    elif label == Conditions.DEAD:
+        expr = 'humanoid.status.is_dead'
+    elif label == Conditions.ALWAYS:
+        expr = 'True'
+    elif label == Conditions.DAMAGED:
+        expr = 'humanoid.status.damaged'
+    else:
+        raise NotImplementedError(
+            'Unrecognized condition label %s' % (label,))
+    if params is not None and 'logical_not' in params:
+        expr = 'not (%s)' % (expr,)
+    labels.append(label)
+    return _COSTS[label], expr
+
+
+def _first(pair: Tuple[int, str]) -> int:
+    return pair[0]
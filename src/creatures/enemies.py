@@ -1,12 +1,13 @@
-from typing import NamedTuple, Dict, Any
+from copy import copy
+from typing import NamedTuple, Dict, Any, Tuple
 
 import pygame as pg
-from pygame.math import Vector2, Vector3
+from pygame.math import Vector2
 
 import conditions
 import effects
-import settings
 from conditions import Condition, condition_from_data
+from creatures.behavior_compiler import compile_behavior
 from creatures.humanoids import Humanoid
 from creatures.players import Player
 from data.input_output import load_mod_data_kwargs
@@ -71,6 +72,39 @@ class Behavior(object):
         self._set_state_condition_values(behavior_dict, player)
         self._set_state_effects_conditions(behavior_dict, player)
 
+        # The compiled form of the state machine, see behavior_compiler.
+        self._target = player
+        self._effects = tuple(effect for state in behavior_dict
+                              for effect in self._state_effects_conditions[
+                                  state])
+        self._compiled = compile_behavior(behavior_dict)
+
+    def copy(self, target: Humanoid) -> 'Behavior':
+        """A Behavior sharing all structure with this one but mutable state,
+        pursuing target.
+
+        Only effects with mutable state are rebuilt (see
+        Effect.instantiate). Conditions and effects built without a target
+        use the target of the humanoid they act on, so this one should be
+        built without a target.
+        """
+        behavior = copy(self)
+        behavior._target = target
+        instances = {effect: effect.instantiate() for effect in self._effects}
+        behavior._effects = tuple(instances[e] for e in self._effects)
+        behavior._state_effects_conditions = {
+            state: {instances[e]: cond for e, cond in effects.items()}
+            for state, effects in self._state_effects_conditions.items()}
+        return behavior
+
+    def run(self, humanoid: Humanoid) -> str:
+        """Determine the state of humanoid and do its state behavior.
+
+        Same as determine_state followed by do_state_behavior, but runs the
+        compiled behavior function.
+        """
+        return self._compiled(humanoid, self._target, self._effects)
+
     def determine_state(self, humanoid: Humanoid) -> str:
 
         current_state = self.default_state
@@ -154,6 +188,8 @@ class Behavior(object):
             effect = effects.PlayRandomSound(sound_files)
         elif effect_label == Effects.FACE_AND_PURSUE:
             effect = effects.FaceAndPursueTarget(player)
+        elif effect_label == Effects.PURSUE_ALONG_PATHS:
+            effect = effects.PursueAlongPaths(player)
         elif effect_label == Effects.STOP_MOTION:
             effect = effects.StopMotion()
         elif effect_label == Effects.DROP_ITEM:
@@ -181,6 +217,22 @@ class Behavior(object):
         return condition_data[label_str]['value']
 
 
+# Fully built Behaviors without a target, by the id of their behavior dict.
+# NPC data is loaded once, so there is one dict, and one prototype, per NPC
+# type. Enemies spawn with a copy of these, bound to their target. The
+# prototypes do not hold any target, so players are not kept alive by them.
+_prototypes: Dict[int, Tuple[BehaviorData, Behavior]] = {}
+
+
+def spawn_behavior(behavior_dict: BehaviorData, player: Player) -> Behavior:
+    """A Behavior for a new enemy, copied from a cached prototype."""
+    key = id(behavior_dict)
+    # The dict is stored along with the prototype so its id is not reused.
+    if key not in _prototypes:
+        _prototypes[key] = (behavior_dict, Behavior(behavior_dict, None))
+    return _prototypes[key][1].copy(player)
+
+
 class Enemy(Humanoid):
     def __init__(self, pos: Vector2, player: Player, data: EnemyData) -> None:
 
@@ -194,31 +246,46 @@ class Enemy(Humanoid):
 
         pg.sprite.Sprite.__init__(self, mygroups)
 
-        self.behavior = Behavior(data.behavior_dict, player)
+        self.behavior = spawn_behavior(data.behavior_dict, player)
         self.status.state = self.behavior.default_state
 
         self.target = player
 
+        # Set by an EnemySteering pass while it runs this enemy's behavior.
+        self.steering: Any = None
+        # Whether an EnemySteering pass already moved the enemy this frame.
+        self.stepped = False
+
+    @property
+    def max_speed(self) -> float:
+        return self._data.max_speed
+
+    @property
+    def image_file(self) -> str:
+        return self._data.image_file
+
     @property
     def image(self) -> pg.Surface:
-        base_image = images.get_image(self._data.image_file)
-        image = pg.transform.rotate(base_image, self.motion.rot)
+        """The enemy image rotated by rot.
 
-        if self.status.damaged:
-            self._draw_health_bar(image, base_image.get_width())
-        return image
+        Health bars are drawn over it by the view."""
+        return images.get_rotated_image(self._data.image_file, self.motion.rot)
 
-    def _draw_health_bar(self, image: pg.Surface, full_width: int) -> None:
-        col = self._health_bar_color()
-        width = int(full_width * self.status.health / self.status.max_health)
-        health_bar = pg.Rect(0, 0, width, 7)
-        pg.draw.rect(image, col, health_bar)
+    @property
+    def health_fraction(self) -> float:
+        return float(self.status.health) / self.status.max_health
 
     def update(self) -> None:
-        self.status.state = self.behavior.determine_state(self)
-        self.behavior.do_state_behavior(self)
+        if self.stepped:
+            self.stepped = False
+            return
+        self.think()
 
         self.motion.update()
+        self.groups.enemies.update_position(self)
+
+    def think(self) -> None:
+        self.behavior.run(self)
 
     def _check_class_initialized(self) -> None:
         if not self.class_initialized:
@@ -227,7 +294,7 @@ class Enemy(Humanoid):
                 ' can be instantiated.')
 
     def _avoid_mobs(self) -> None:
-        for mob in self.groups.enemies:
+        for mob in self.groups.enemies.neighbors(self.pos, AVOID_RADIUS):
             if mob is self:
                 continue
             dist = self.pos - mob.pos
@@ -237,23 +304,9 @@ class Enemy(Humanoid):
     def update_acc(self) -> None:
         self.motion.acc = Vector2(1, 0).rotate(-self.motion.rot)
         self._avoid_mobs()
-        self.motion.acc.scale_to_length(self._data.max_speed)
+        self.motion.acc.scale_to_length(self.max_speed)
         self.motion.acc += self.motion.vel * -1
 
     @staticmethod
     def _target_close(target_dist: Vector2) -> bool:
-        return target_dist.length() < DETECT_RADIUS
-
-    def _health_bar_color(self) -> tuple:
-        health_fraction = float(self.status.health) / self.status.max_health
-        if health_fraction > 0.5:
-            frac = 2 * (1 - health_fraction)
-            vec = Vector3(settings.GREEN) * frac
-            vec += Vector3(settings.YELLOW) * (1 - frac)
-            col = tuple(vec)
-        else:
-            frac = 2 * health_fraction
-            vec = Vector3(settings.YELLOW) * frac
-            vec += Vector3(settings.RED) * (1 - frac)
-            col = tuple(vec)
-        return col
+        return target_dist.length_squared() < DETECT_RADIUS ** 2
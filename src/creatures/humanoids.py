@@ -3,16 +3,18 @@ from typing import Dict
 
 import pygame as pg
 from pygame.math import Vector2
-from pygame.sprite import Group
 
 import items
 import model as mdl
 import mods
+from spatial import StaticGroup
 
 
 class Backpack(object):
     """Stores the inactive mods available to a Humanoid."""
 
+    __slots__ = ('size', '_slots', '_slots_filled')
+
     def __init__(self) -> None:
 
         backpack_size = 8
@@ -62,6 +64,8 @@ class Backpack(object):
 class Inventory(object):
     """Stores and updates the mods available to a Humanoid."""
 
+    __slots__ = ('backpack', 'active_mods')
+
     def __init__(self) -> None:
         self.backpack = Backpack()
         self.active_mods: Dict[mods.ModLocation, mods.Mod] = {}
@@ -99,6 +103,8 @@ class Inventory(object):
 class Status(object):
     """Represents the current state of a Humanoid."""
 
+    __slots__ = ('_max_health', '_health', 'state')
+
     def __init__(self, max_health: int) -> None:
         self._max_health = max_health
         self._health = max_health
@@ -150,7 +156,7 @@ class Humanoid(mdl.GameObject, mdl.TimeAccess):
 
     @property
     def rect(self) -> pg.Rect:
-        self._base_rect.center = Vector2(self.pos)
+        self._base_rect.center = self.pos
         return self._base_rect
 
     @property
@@ -193,8 +199,11 @@ class Humanoid(mdl.GameObject, mdl.TimeAccess):
 class Motion(object):
     """Handles movement of Humanoids."""
 
+    __slots__ = ('_humanoid', '_timer', '_walls', 'vel', 'acc', 'rot',
+                 'hit_rect', '_direction', '_direction_rot')
+
     def __init__(self, humanoid: Humanoid, timer: mdl.Timer,
-                 walls: Group, hit_rect: pg.Rect) -> None:
+                 walls: StaticGroup, hit_rect: pg.Rect) -> None:
         self._humanoid = humanoid
         self._timer = timer
         self._walls = walls
@@ -204,9 +213,16 @@ class Motion(object):
         self.rot = 0
         self.hit_rect = hit_rect
 
+        self._direction = Vector2(1, 0)
+        self._direction_rot = 0
+
     @property
     def direction(self) -> Vector2:
-        return Vector2(1, 0).rotate(-self.rot)
+        """Unit vector along rot. It is shared, so must not be modified."""
+        if self.rot != self._direction_rot:
+            self._direction = Vector2(1, 0).rotate(-self.rot)
+            self._direction_rot = self.rot
+        return self._direction
 
     @property
     def rect(self) -> pg.Rect:
@@ -222,14 +238,14 @@ class Motion(object):
 
     def update(self) -> None:
         self._update_trajectory()
-        self._collide_with_walls()
+        self.collide_with_walls()
 
     def _update_trajectory(self) -> None:
         dt = self._timer.dt
         self.vel += self.acc * dt
         self.pos += self.vel * dt
 
-    def _collide_with_walls(self) -> None:
+    def collide_with_walls(self) -> None:
         self.hit_rect.centerx = self.pos.x
         self._collide_walls_in_direction('x')
         self.hit_rect.centery = self.pos.y
@@ -252,10 +268,8 @@ class Motion(object):
 
     def _collide_walls_in_direction(self, x_or_y: str) -> None:
         assert x_or_y == 'x' or x_or_y == 'y'
-        group = self._walls
         if x_or_y == 'x':
-            hits = pg.sprite.spritecollide(self._humanoid, group, False,
-                                           collide_hit_rect_with_rect)
+            hits = self._walls.collide_rect(self.hit_rect)
             if hits:
                 if hits[0].rect.centerx > self.hit_rect.centerx:
                     self.pos.x = hits[
@@ -266,8 +280,7 @@ class Motion(object):
                 self.stop_x()
                 self.hit_rect.centerx = self.pos.x
         if x_or_y == 'y':
-            hits = pg.sprite.spritecollide(self._humanoid, group, False,
-                                           collide_hit_rect_with_rect)
+            hits = self._walls.collide_rect(self.hit_rect)
             if hits:
                 if hits[0].rect.centery > self.hit_rect.centery:
                     self.pos.y = hits[
@@ -286,6 +299,8 @@ def collide_hit_rect_with_rect(humanoid: Humanoid,
 
 
 class EnergySource(object):
+    __slots__ = ('_max_energy', '_recharge_rate', '_current_energy')
+
     def __init__(self, max_energy: float, recharge_rate: float) -> None:
         self._max_energy = max_energy
         self._recharge_rate = recharge_rate
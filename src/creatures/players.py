@@ -4,6 +4,7 @@ from typing import Tuple
 import pygame as pg
 from pygame.math import Vector2
 
+import settings
 from creatures.humanoids import Humanoid, EnergySource
 from view import images
 
@@ -18,6 +19,8 @@ DAMAGE_ALPHA = list(range(0, 255, 55))
 
 
 class Player(Humanoid):
+    light_radius = settings.PLAYER_LIGHT_RADIUS
+
     def __init__(self, pos: Vector2) -> None:
         super().__init__(PLAYER_HIT_RECT, pos, PLAYER_HEALTH)
         pg.sprite.Sprite.__init__(self, self.groups.all_sprites)
@@ -38,8 +41,7 @@ class Player(Humanoid):
 
     @property
     def image(self) -> pg.Surface:
-        base_image = images.get_image(images.PLAYER_IMG)
-        return pg.transform.rotate(base_image, self.motion.rot)
+        return images.get_rotated_image(images.PLAYER_IMG, self.motion.rot)
 
     # translate_direction = slide in that direction
     def translate_up(self) -> None:
@@ -0,0 +1,126 @@
+"""Batched movement of all enemies with NumPy."""
+from typing import Any, Dict, List, Set, Union
+
+import numpy as np
+from pygame.math import Vector2
+
+from conditions import target_distances
+from creatures.enemies import AVOID_RADIUS, DETECT_RADIUS
+from navigation import FlowField
+from occupancy import OccupancyGrid
+from spatial import MobileGroup, pairs_within
+
+# Length of the paths searched from a target. Enemies notice a target
+# within DETECT_RADIUS, and this leaves room for the walls in between.
+PATH_REACH = 2 * DETECT_RADIUS
+
+
+class EnemySteering(object):
+    """Moves every enemy in a group in one vectorized pass.
+
+    update first runs each enemy's behavior, with the distances read by
+    TargetClose conditions taken from one table. While it does, pursue
+    effects do not steer the enemy themselves but register the pursuit
+    here. Then pursuit, mob avoidance, damping and integration are computed
+    on arrays for all enemies at once, mirroring Enemy.update_acc and
+    Motion.update. Wall collisions are resolved per enemy afterwards.
+
+    Enemies moved this way skip their next own update.
+
+    Given the map's OccupancyGrid, enemies may also pursue along paths
+    around walls. All enemies pursuing a target then share one FlowField,
+    updated at most once per frame.
+    """
+
+    def __init__(self, grid: Union[OccupancyGrid, None] = None) -> None:
+        # The point each pursuing enemy heads for.
+        self._aims: Dict[Any, Any] = {}
+        self._grid = grid
+        self._fields: Dict[Any, FlowField] = {}
+        self._fresh_fields: Set[Any] = set()
+
+    def pursue(self, enemy: Any, target: Any) -> None:
+        self._aims[enemy] = target.pos
+
+    def pursue_along_paths(self, enemy: Any, target: Any) -> None:
+        grid = self._grid
+        if grid is None:
+            self.pursue(enemy, target)
+            return
+        if target not in self._fresh_fields:
+            if target not in self._fields:
+                self._fields[target] = FlowField(grid, PATH_REACH)
+            self._fields[target].update(target.pos)
+            self._fresh_fields.add(target)
+        waypoint = self._fields[target].waypoint(enemy.pos)
+        self._aims[enemy] = target.pos if waypoint is None else waypoint
+
+    def update(self, enemies: MobileGroup, dt: float) -> None:
+        self._aims.clear()
+        self._fresh_fields.clear()
+        thinkers = enemies.sprites()
+        # Nothing moves while the enemies think, so their distances to
+        # their targets are computed once up front.
+        target_distances.update(thinkers)
+        for enemy in thinkers:
+            enemy.steering = self
+            enemy.think()
+            enemy.steering = None
+        target_distances.clear()
+
+        movers: List[Any] = enemies.sprites()
+        if not movers:
+            return
+        pos = np.array([tuple(enemy.pos) for enemy in movers])
+        vel = np.array([tuple(enemy.motion.vel) for enemy in movers])
+        acc = np.array([tuple(enemy.motion.acc) for enemy in movers])
+        rot = np.array([enemy.motion.rot for enemy in movers], dtype=float)
+
+        aims = self._aims
+        pursuing = np.array([enemy in aims for enemy in movers])
+        if pursuing.any():
+            acc[pursuing], rot[pursuing] = self._pursuit(
+                movers, pos, vel, pursuing)
+
+        vel += acc * dt
+        pos += vel * dt
+
+        for k, enemy in enumerate(movers):
+            motion = enemy.motion
+            if pursuing[k]:
+                motion.rot = float(rot[k])
+                motion.acc = Vector2(*acc[k])
+            motion.vel = Vector2(*vel[k])
+            enemy.pos = Vector2(*pos[k])
+            motion.collide_with_walls()
+            enemies.update_position(enemy)
+            enemy.stepped = True
+
+    def _pursuit(self, movers: List[Any], pos: np.ndarray, vel: np.ndarray,
+                 pursuing: np.ndarray) -> Any:
+        """Accelerations and rotations of the pursuing enemies."""
+        chasers = np.flatnonzero(pursuing)
+        target_pos = np.array([tuple(self._aims[movers[k]])
+                               for k in chasers])
+        disp = target_pos - pos[chasers]
+        # Same angle as disp.angle_to(Vector2(1, 0)).
+        rot = -np.degrees(np.arctan2(disp[:, 1], disp[:, 0]))
+        radians = np.radians(-rot)
+        acc = np.stack([np.cos(radians), np.sin(radians)], axis=1)
+
+        # Push away from every other enemy within AVOID_RADIUS.
+        avoid = np.zeros_like(pos)
+        i, j = pairs_within(pos, AVOID_RADIUS)
+        away = pos[i] - pos[j]
+        away /= np.hypot(away[:, 0], away[:, 1])[:, None]
+        np.add.at(avoid, i, away)
+        acc += avoid[chasers]
+
+        max_speeds = np.array([movers[k].max_speed for k in chasers],
+                              dtype=float)
+        lengths = np.hypot(acc[:, 0], acc[:, 1])
+        scale = np.divide(max_speeds, lengths, out=np.zeros_like(lengths),
+                          where=lengths > 0)
+        acc *= scale[:, None]
+        acc -= vel[chasers]
+        return acc, rot
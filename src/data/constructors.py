@@ -6,7 +6,7 @@ from pygame.sprite import Sprite
 from creatures.enemies import EnemyData, Enemy
 from data.input_output import load_item_data_kwargs, load_npc_data_kwargs, \
     is_npc_type, is_item_type
-from items import ItemFromData, ItemData
+from items import ItemFromData, ItemData, dropped_item_pool
 from model import Zone, Obstacle
 from tilemap import ObjectType
 
@@ -36,3 +36,16 @@ def build_map_object(label: Union[ObjectType, str], pos: Vector2 = None,
         return Obstacle(top_left, dimensions[0], dimensions[1])
     else:
         raise ValueError('Unrecognized object of type %s.' % (label,))
+
+
+def build_dropped_object(label: str, pos: Vector2) -> Sprite:
+    """Build an object dropped during play, e.g. by a dying projectile.
+
+    Dropped items are drawn from a pool and return to it once picked up.
+    Items placed on the map are built with build_map_object instead, since
+    quests may hold on to them.
+    """
+    if is_item_type(label):
+        data = ItemData(**load_item_data_kwargs(label))
+        return dropped_item_pool.acquire(data, pos)
+    return build_map_object(label, pos)
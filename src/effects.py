@@ -1,13 +1,14 @@
 from enum import Enum
 from random import uniform, choice
-from typing import Any, List
+from typing import Any, List, Union
 
 from pygame.math import Vector2
 from pygame.transform import rotate
 
 from conditions import CooldownCondition
 from model import GameObject
-from projectiles import ProjectileData, ProjectileFactory, MuzzleFlash
+from projectiles import ProjectileData, ProjectileFactory, \
+    muzzle_flash_pool
 from view import images, sounds
 from view.screen import ScreenAccess
 
@@ -16,6 +17,7 @@ class Effects(Enum):
     EQUIP_AND_USE_MOD = 'equip and use mod'
     RANDOM_SOUND = 'random sound'
     FACE_AND_PURSUE = 'face and pursue target'
+    PURSUE_ALONG_PATHS = 'pursue target along paths'
     STOP_MOTION = 'stop motion'
     DROP_ITEM = 'drop item'
     KILL = 'kill'
@@ -27,16 +29,29 @@ class Effects(Enum):
 class Effect(object):
     """Implements an effect on a Humanoid."""
 
+    __slots__ = ()
+
     def activate(self, humanoid: Any) -> None:
         raise NotImplementedError
 
+    def instantiate(self) -> 'Effect':
+        """The effect to use in a new copy of the Behavior owning this one.
+
+        Effects without mutable state are shared between copies.
+        """
+        return self
+
 
 class StopMotion(Effect):
+    __slots__ = ()
+
     def activate(self, humanoid: Any) -> None:
         humanoid.motion.stop()
 
 
 class EquipAndUseMod(Effect):
+    __slots__ = ('_mod',)
+
     def activate(self, humanoid: Any) -> None:
         humanoid.inventory.equip(self._mod)
         humanoid.ability_caller(self._mod.loc)()
@@ -44,8 +59,14 @@ class EquipAndUseMod(Effect):
     def __init__(self, mod: Any) -> None:
         self._mod = mod
 
+    def instantiate(self) -> 'EquipAndUseMod':
+        # The mod holds a cooldown and remaining uses, so it is not shared.
+        return EquipAndUseMod(self._mod.copy())
+
 
 class UpdateLastUse(Effect):
+    __slots__ = ('_cool_down_condition',)
+
     def __init__(self, cool_down_condition: CooldownCondition) -> None:
         self._cool_down_condition = cool_down_condition
 
@@ -54,6 +75,8 @@ class UpdateLastUse(Effect):
 
 
 class Heal(Effect):
+    __slots__ = ('_heal_amount',)
+
     def __init__(self, heal_amount: int) -> None:
         self._heal_amount = heal_amount
 
@@ -62,6 +85,8 @@ class Heal(Effect):
 
 
 class Recharge(Effect):
+    __slots__ = ('_recharge_amount',)
+
     def __init__(self, recharge_amount: int) -> None:
         self._recharge_amount = recharge_amount
 
@@ -70,6 +95,8 @@ class Recharge(Effect):
 
 
 class ExpendEnergy(Effect):
+    __slots__ = ('_energy_required',)
+
     def __init__(self, energy_required: int) -> None:
         self._energy_required = energy_required
 
@@ -79,6 +106,8 @@ class ExpendEnergy(Effect):
 
 
 class PlaySound(Effect):
+    __slots__ = ('_sound_file',)
+
     def __init__(self, sound_file: str) -> None:
         self._sound_file = sound_file
 
@@ -87,6 +116,8 @@ class PlaySound(Effect):
 
 
 class DrawOnScreen(Effect, ScreenAccess):
+    __slots__ = ('_to_draw_file', '_angled')
+
     def __init__(self, to_draw_file: str, angled: bool = False) -> None:
         super().__init__()
         self._to_draw_file = to_draw_file
@@ -103,6 +134,8 @@ class DrawOnScreen(Effect, ScreenAccess):
 
 
 class PlayRandomSound(Effect):
+    __slots__ = ('_sound_files',)
+
     def __init__(self, sound_files: List[str]) -> None:
         assert sound_files, 'At least one sound file must be specified.'
         self._sound_files = sound_files
@@ -113,6 +146,8 @@ class PlayRandomSound(Effect):
 
 
 class Kickback(Effect):
+    __slots__ = ('_kickback',)
+
     def __init__(self, kickback: int) -> None:
         self._kickback = kickback
 
@@ -122,6 +157,8 @@ class Kickback(Effect):
 
 
 class MakeProjectile(Effect):
+    __slots__ = ('_factory', '_spread', '_count')
+
     def __init__(self, projectile_data: ProjectileData, spread: int,
                  projectile_count: int) -> None:
         self._factory = ProjectileFactory(projectile_data)
@@ -142,44 +179,88 @@ class MakeProjectile(Effect):
 
 
 class MuzzleFlashEffect(Effect):
+    __slots__ = ()
+
     def activate(self, humanoid: Any) -> None:
         direction = humanoid.motion.direction
         direction = direction.rotate(20)
-        MuzzleFlash(humanoid.pos + 22 * direction)
+        muzzle_flash_pool.acquire(humanoid.pos + 22 * direction)
 
 
 class DropItem(Effect):
+    __slots__ = ('item_label',)
+
     def __init__(self, item_label: str) -> None:
         self.item_label = item_label
 
     def activate(self, humanoid: Any) -> None:
         # TODO(dvirk): I need to import locally to avoid circular import
         # errors. Is this bad?
-        from data.constructors import build_map_object
-        build_map_object(self.item_label, humanoid.pos)
+        from data.constructors import build_dropped_object
+        build_dropped_object(self.item_label, humanoid.pos)
 
 
 class FaceAndPursueTarget(Effect):
-    def __init__(self, target: GameObject) -> None:
+    """Pursues target.
+
+    A target of None stands for the humanoid's own target, so that the
+    effect can be shared by behaviors with different targets.
+    """
+    __slots__ = ('_target',)
+
+    def __init__(self, target: Union[GameObject, None]) -> None:
         self._target = target
 
     def activate(self, humanoid: Any) -> None:
-        target_disp = self._target.pos - humanoid.pos
+        target = self._target
+        if target is None:
+            target = humanoid.target
+        if humanoid.steering is not None:
+            # Pursuit is computed for all enemies at once by the steering.
+            humanoid.steering.pursue(humanoid, target)
+            return
+        target_disp = target.pos - humanoid.pos
         humanoid.motion.rot = target_disp.angle_to(Vector2(1, 0))
         # TODO(dvirk): update_acc is only a method for Enemy. This is a bit
         # kludgy.
         humanoid.update_acc()
 
 
+class PursueAlongPaths(FaceAndPursueTarget):
+    """Pursues the target around walls, along shortest paths read from a
+    flow field shared by every enemy pursuing it.
+
+    Without a steering pass, the target is pursued in a straight line.
+    """
+    __slots__ = ()
+
+    def activate(self, humanoid: Any) -> None:
+        if humanoid.steering is not None:
+            target = self._target
+            if target is None:
+                target = humanoid.target
+            humanoid.steering.pursue_along_paths(humanoid, target)
+            return
+        super().activate(humanoid)
+
+
 class FaceTarget(Effect):
-    def __init__(self, target: GameObject) -> None:
+    """Turns toward target, or toward the humanoid's target if None."""
+    __slots__ = ('_target',)
+
+    def __init__(self, target: Union[GameObject, None]) -> None:
         self._target = target
 
     def activate(self, humanoid: Any) -> None:
-        target_disp = self._target.pos - humanoid.pos
+        target = self._target
+        if target is None:
+            target = humanoid.target
+        target_disp = target.pos - humanoid.pos
         humanoid.motion.rot = target_disp.angle_to(Vector2(1, 0))
 
 
 class Kill(Effect):
+    __slots__ = ()
+
     def activate(self, humanoid: Any) -> None:
         humanoid.kill()
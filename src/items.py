@@ -7,6 +7,7 @@ from pygame.math import Vector2
 from data.input_output import load_mod_data_kwargs
 from model import TimeAccess, GameObject
 from mods import Mod, BOB_RANGE, BOB_PERIOD, BOB_SPEED, ModData
+from pools import ObjectPool
 from view import images
 
 BaseItemData = namedtuple('BaseItemData', ('mod_data', 'image_file'))
@@ -39,6 +40,17 @@ class ItemObject(GameObject, TimeAccess):
         self._bob_period = BOB_PERIOD
         self._bob_speed = BOB_SPEED
 
+    def reset(self, mod: Mod, pos: Vector2) -> None:
+        """Place a picked up item back on the map holding a new mod."""
+        assert not self.alive()
+        self.pos = Vector2(pos.x, pos.y)
+        self._mod = mod
+        self._step = 0.0
+        self._bob_direction = 1
+        self._base_rect.size = self.image.get_size()
+        pg.sprite.Sprite.__init__(self, [self.groups.all_sprites,
+                                         self.groups.items])
+
     @property
     def mod(self) -> Mod:
         return self._mod
@@ -73,6 +85,14 @@ class ItemFromData(ItemObject):
         self._image_file = item_data.image_file
         super().__init__(mod, pos)
 
+    def reset(self, item_data: ItemData,  # type: ignore
+              pos: Vector2) -> None:
+        self._image_file = item_data.image_file
+        super().reset(Mod(item_data.mod_data), pos)
+
     @property
     def image(self) -> pg.Surface:
         return images.get_image(self._image_file)
+
+
+dropped_item_pool = ObjectPool('dropped_items', ItemFromData)
@@ -0,0 +1,159 @@
+"""An on-disk cache of parsed TMX maps, keyed by the content of their files."""
+import hashlib
+import json
+import os
+import zipfile
+from os import path
+from typing import Any, Dict, List, NamedTuple, Tuple, Union, cast
+from xml.etree import ElementTree
+
+import numpy as np
+import pygame as pg
+
+import settings
+
+# Changed whenever the cached format or the meaning of its contents changes.
+CACHE_VERSION = 2
+
+
+class MapData(NamedTuple):
+    """What TiledMap uses of a TMX map.
+
+    Each object is a dict of x, y, width, height, name and, if the object
+    has them, labels. Layers are the visible tile layers, as arrays of
+    indices into tiles, and tiles[0] is None for cells without a tile.
+    wall_tiles are the indices of tiles whose 'wall' property is set.
+    """
+    width: int
+    height: int
+    tile_width: int
+    tile_height: int
+    objects: List[Dict[str, Any]]
+    layers: List[np.ndarray]
+    tiles: List[Union[pg.Surface, None]]
+    wall_tiles: List[int]
+
+
+def map_files(tmx_file: str) -> List[str]:
+    """The TMX file followed by the tileset and image files it uses."""
+    files = [tmx_file]
+    _add_sources(tmx_file, files)
+    return files
+
+
+def _add_sources(xml_file: str, files: List[str]) -> None:
+    folder = path.dirname(xml_file)
+    root = ElementTree.parse(xml_file).getroot()
+    for image in root.iter('image'):
+        files.append(path.join(folder, image.attrib['source']))
+    for tileset in root.iter('tileset'):
+        source = tileset.get('source')
+        if source is not None:
+            tileset_file = path.join(folder, source)
+            files.append(tileset_file)
+            _add_sources(tileset_file, files)
+
+
+class MapCache(object):
+    """Stores MapData in folder, one file per map.
+
+    An entry is keyed by a hash of the map, tileset and image files, so a
+    change to any of them makes the entry miss. Tiles are stored as raw
+    RGB or RGBA pixels next to the layer arrays in a compressed npz file.
+    Failing to read or write the cache is never an error, the map is then
+    simply parsed again.
+    """
+
+    def __init__(self, folder: str) -> None:
+        self.folder = folder
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, tmx_file: str) -> Union[MapData, None]:
+        try:
+            with np.load(self._entry(tmx_file)) as entry:
+                data = _decode(entry)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def save(self, tmx_file: str, data: MapData) -> None:
+        entry = self._entry(tmx_file)
+        prefix = entry[:entry.rindex('-') + 1]
+        temp_file = entry + '.tmp'
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            # Entries for older versions of this map are never hit again.
+            for name in os.listdir(self.folder):
+                if path.join(self.folder, name).startswith(prefix):
+                    os.remove(path.join(self.folder, name))
+            with open(temp_file, 'wb') as stream:
+                np.savez_compressed(stream, **_encode(data))
+            os.replace(temp_file, entry)
+        except OSError:
+            pass
+
+    def _entry(self, tmx_file: str) -> str:
+        content = hashlib.sha1(str(CACHE_VERSION).encode())
+        for file_name in map_files(tmx_file):
+            with open(file_name, 'rb') as stream:
+                content.update(stream.read())
+        location = hashlib.sha1(path.abspath(tmx_file).encode())
+        name = path.splitext(path.basename(tmx_file))[0]
+        return path.join(self.folder, '%s-%s-%s.npz' % (
+            name, location.hexdigest()[:8], content.hexdigest()))
+
+
+def _encode(data: MapData) -> Dict[str, Any]:
+    # Only tiles[0], which stands for cells without a tile, is None.
+    tiles = cast(List[pg.Surface], data.tiles[1:])
+    formats = [_tile_format(tile) for tile in tiles]
+    header = {'version': CACHE_VERSION, 'width': data.width,
+              'height': data.height, 'tile_width': data.tile_width,
+              'tile_height': data.tile_height, 'objects': data.objects,
+              'tiles': formats, 'wall_tiles': data.wall_tiles}
+    pixels = b''.join(pg.image.tostring(tile, mode)
+                      for tile, (_, mode, _) in zip(tiles, formats))
+    arrays = {'header': np.frombuffer(json.dumps(header).encode(), np.uint8),
+              'pixels': np.frombuffer(pixels, np.uint8)}
+    for index, layer in enumerate(data.layers):
+        arrays['layer%d' % (index,)] = layer
+    return arrays
+
+
+def _tile_format(tile: pg.Surface) -> Tuple[Tuple[int, int], str, Any]:
+    """Size, pixel format and colorkey, so that a tile is decoded with the
+    same flags that pytmx gave it."""
+    mode = 'RGBA' if tile.get_flags() & pg.SRCALPHA else 'RGB'
+    colorkey = tile.get_colorkey()
+    return tile.get_size(), mode, colorkey and tuple(colorkey)
+
+
+def _decode(entry: Any) -> MapData:
+    header = json.loads(entry['header'].tobytes().decode())
+    if header['version'] != CACHE_VERSION:
+        raise ValueError('Cache entry has version %s.' % (header['version'],))
+    pixels = entry['pixels']
+    tiles: List[Union[pg.Surface, None]] = [None]
+    start = 0
+    for (width, height), mode, colorkey in header['tiles']:
+        end = start + len(mode) * width * height
+        tile = pg.image.frombuffer(pixels[start:end], (width, height), mode)
+        if mode == 'RGBA':
+            tile = tile.convert_alpha()
+        else:
+            tile = tile.convert()
+        if colorkey:
+            tile.set_colorkey(colorkey, pg.RLEACCEL)
+        tiles.append(tile)
+        start = end
+    layers = [entry['layer%d' % (index,)]
+              for index in range(len(entry.files) - 2)]
+    return MapData(header['width'], header['height'], header['tile_width'],
+                   header['tile_height'], header['objects'], layers, tiles,
+                   header['wall_tiles'])
+
+
+cache = MapCache(settings.MAP_CACHE_FOLDER)
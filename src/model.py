@@ -1,20 +1,26 @@
 from collections import namedtuple
+from typing import Any
 
 import pygame as pg
 from pygame.math import Vector2
 from pygame.sprite import Group, LayeredUpdates, Sprite
 
+from projectile_system import ProjectileGroup
+from spatial import DynamicGroup, MobileGroup, StaticGroup
+
 _GroupsBase = namedtuple('_GroupsBase',
                          ('walls', 'bullets', 'enemy_projectiles',
-                          'items', 'enemies', 'zones', 'all_sprites'))
+                          'items', 'enemies', 'zones', 'all_sprites',
+                          'effects'))
 
 
 class Groups(_GroupsBase):
     """Immutable container object for groups in the game."""
 
     def __new__(cls) -> _GroupsBase:
-        args = [Group() for _ in range(6)]
-        args += [LayeredUpdates()]
+        args = [StaticGroup(), ProjectileGroup(), ProjectileGroup()]
+        args += [DynamicGroup(), MobileGroup(), Group()]
+        args += [LayeredUpdates(), Group()]
         return super(Groups, cls).__new__(cls, *args)  # type: ignore
 
     def empty(self) -> None:
@@ -26,6 +32,7 @@ class Groups(_GroupsBase):
         self.items.empty()
         self.zones.empty()
         self.enemy_projectiles.empty()
+        self.effects.empty()
 
 
 class Timer(object):
@@ -51,6 +58,8 @@ def initialize(groups: Groups, timer: 'Timer') -> None:
 class GroupsAccess(object):
     """An object with access to a `groups' class variable."""
 
+    __slots__ = ()
+
     _groups: Groups = None
 
     @property
@@ -71,9 +80,21 @@ class GroupsAccess(object):
 class GameObject(GroupsAccess, pg.sprite.Sprite):
     """In-game object with a rect for collisions and an image. """
 
+    # The pools.ObjectPool the object came from, if any. Pooled objects are
+    # released back to their pool when killed.
+    pool: Any = None
+    # Radius of the light the object gives off in night mode, if any.
+    light_radius = 0
+
     def __init__(self, pos: Vector2) -> None:
         self.pos = Vector2(pos.x, pos.y)
 
+    def kill(self) -> None:
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
     @property
     def image(self) -> pg.Surface:
         raise NotImplementedError
@@ -103,6 +124,8 @@ class Zone(GroupsAccess, Sprite):
 class TimeAccess(object):
     """An object with access to the game's Timer object. """
 
+    __slots__ = ()
+
     _timer: Timer = None
 
     @classmethod
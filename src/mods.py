@@ -63,6 +63,10 @@ class Mod(object):
 
         self._ability = GenericAbility(data.ability_data)
 
+    def copy(self) -> 'Mod':
+        """A mod with the same data and an unused ability."""
+        return Mod(self._data)
+
     @property
     def loc(self) -> ModLocation:
         return self._data.location
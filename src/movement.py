@@ -0,0 +1,102 @@
+"""Cells reachable by turn based moves, found by a bounded Dijkstra search."""
+import heapq
+import math
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Tuple
+
+from occupancy import Cell, OccupancyGrid
+
+DIAGONAL_COST = math.sqrt(2)
+# Move ranges kept, least recently used dropped first.
+MAX_RANGES = 256
+
+# Moves to neighboring cells, as column step, row step and cost.
+STEPS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+         (1, 1, DIAGONAL_COST), (1, -1, DIAGONAL_COST),
+         (-1, 1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST)]
+# Tolerance for comparing a path cost to the speed.
+_EPSILON = 1e-9
+
+
+def is_open(grid: OccupancyGrid, cell: Cell,
+            occupied: FrozenSet[Cell] = frozenset()) -> bool:
+    """Whether a move may end in cell."""
+    return (cell not in occupied and grid.contains(cell) and
+            not grid.is_blocked(cell))
+
+
+def can_step(grid: OccupancyGrid, cell: Cell, dx: int, dy: int,
+             occupied: FrozenSet[Cell] = frozenset()) -> bool:
+    """Whether a move from cell to its neighbor at (dx, dy) is allowed.
+
+    A diagonal move may not cut the corner of a cell that cannot be
+    entered.
+    """
+    x, y = cell
+    if not is_open(grid, (x + dx, y + dy), occupied):
+        return False
+    return not (dx and dy) or (is_open(grid, (x + dx, y), occupied) and
+                               is_open(grid, (x, y + dy), occupied))
+
+
+class MoveRanges(object):
+    """Finds every cell within a movement budget of a starting cell.
+
+    Moves go to the 8 neighboring cells, at a cost of 1 for a straight step
+    and DIAGONAL_COST for a diagonal one. A diagonal step may not cut the
+    corner of a blocked or occupied cell. Blocked cells, occupied cells
+    and cells outside the grid are never entered.
+
+    Ranges are memoized by start cell, speed, grid version and occupied
+    cells, so a member whose surroundings did not change since its last
+    turn gets its range back without a search.
+    """
+
+    def __init__(self, grid: OccupancyGrid,
+                 max_ranges: int = MAX_RANGES) -> None:
+        self.grid = grid
+        self.max_ranges = max_ranges
+        self._ranges: OrderedDict = OrderedDict()
+        self.searches = 0
+
+    def reachable(self, start: Cell, speed: float,
+                  occupied: FrozenSet[Cell] = frozenset()
+                  ) -> Dict[Cell, float]:
+        """The cost of reaching each reachable cell, including start.
+
+        The returned dict is shared by later calls and must not be changed.
+        """
+        key = (start, speed, self.grid.version, occupied)
+        ranges = self._ranges
+        if key in ranges:
+            ranges.move_to_end(key)
+            return ranges[key]
+        costs = self._search(start, speed, occupied)
+        ranges[key] = costs
+        if len(ranges) > self.max_ranges:
+            ranges.popitem(last=False)
+        return costs
+
+    def _search(self, start: Cell, speed: float,
+                occupied: FrozenSet[Cell]) -> Dict[Cell, float]:
+        self.searches += 1
+        grid = self.grid
+        costs = {start: 0.0}
+        frontier: List[Tuple[float, Cell]] = [(0.0, start)]
+        while frontier:
+            cost, cell = heapq.heappop(frontier)
+            if cost > costs[cell]:
+                continue
+            x, y = cell
+            for dx, dy, step_cost in STEPS:
+                new_cost = cost + step_cost
+                if new_cost > speed + _EPSILON:
+                    continue
+                neighbor = (x + dx, y + dy)
+                if neighbor in costs and costs[neighbor] <= new_cost:
+                    continue
+                if not can_step(grid, cell, dx, dy, occupied):
+                    continue
+                costs[neighbor] = new_cost
+                heapq.heappush(frontier, (new_cost, neighbor))
+        return costs
@@ -0,0 +1,82 @@
+"""Flow fields that lead pursuers around walls toward a shared target."""
+import math
+from typing import Dict, Tuple, Union
+
+from movement import STEPS, MoveRanges, can_step
+from occupancy import Cell, OccupancyGrid, Point
+
+# Searches kept for targets returning to a cell they were in before.
+FIELDS_KEPT = 16
+
+
+class FlowField(object):
+    """The next cell on a shortest path to a target, from every cell near it.
+
+    update searches the grid from the target's cell, with the moves of turn
+    based movement, whenever the target enters another cell or the grid
+    changes. The search stops at paths longer than reach pixels, so its
+    cost and the memory kept for it do not grow with the map. Pursuers then
+    read their next cell in constant time, and each cell's next cell is
+    only worked out the first time it is read.
+    """
+
+    def __init__(self, grid: OccupancyGrid, reach: float,
+                 fields_kept: int = FIELDS_KEPT) -> None:
+        self.grid = grid
+        # The search budget, in straight steps between cells.
+        self._speed = reach / min(grid.cell_width, grid.cell_height)
+        self._ranges = MoveRanges(grid, fields_kept)
+        self._target_cell: Union[Cell, None] = None
+        self._costs: Dict[Cell, float] = {}
+        self._next: Dict[Cell, Union[Cell, None]] = {}
+
+    @property
+    def searches(self) -> int:
+        return self._ranges.searches
+
+    def update(self, target_pos: Point) -> None:
+        cell = self.grid.cell_of(target_pos)
+        costs = self._ranges.reachable(cell, self._speed)
+        if costs is not self._costs:
+            self._target_cell = cell
+            self._costs = costs
+            self._next = {}
+
+    def waypoint(self, pos: Point) -> Union[Tuple[float, float], None]:
+        """The center of the next cell on the way from pos to the target.
+
+        None if pos is next to or in the target's cell, or if there is no
+        path within reach, in which case the target itself should be headed
+        for.
+        """
+        cell = self.grid.cell_of(pos)
+        if cell not in self._next:
+            self._next[cell] = self._next_cell(cell)
+        next_cell = self._next[cell]
+        if next_cell is None or next_cell == self._target_cell:
+            return None
+        return ((next_cell[0] + 0.5) * self.grid.cell_width,
+                (next_cell[1] + 0.5) * self.grid.cell_height)
+
+    def _next_cell(self, cell: Cell) -> Union[Cell, None]:
+        costs = self._costs
+        if cell == self._target_cell:
+            return None
+        x, y = cell
+        best: Union[Cell, None] = None
+        best_cost = math.inf
+        if cell in costs:
+            for dx, dy, step_cost in STEPS:
+                neighbor = (x + dx, y + dy)
+                cost = costs.get(neighbor, math.inf) + step_cost
+                if cost < best_cost and can_step(self.grid, cell, dx, dy):
+                    best, best_cost = neighbor, cost
+        elif self.grid.is_blocked(cell):
+            # Pursuers pushed into a blocked cell leave by the neighbor
+            # closest to the target.
+            for dx, dy, _ in STEPS:
+                neighbor = (x + dx, y + dy)
+                cost = costs.get(neighbor, math.inf)
+                if cost < best_cost:
+                    best, best_cost = neighbor, cost
+        return best
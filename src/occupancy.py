@@ -0,0 +1,121 @@
+"""Tile resolution walkability grid with line traversal."""
+import math
+from typing import Iterator, Tuple
+
+import numpy as np
+
+import tilemap
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float]
+
+# Tolerance for comparing fractions of a segment.
+_EPSILON = 1e-9
+
+
+class OccupancyGrid(object):
+    """Marks the map cells that cannot be walked through.
+
+    A cell is blocked if any wall object overlaps it or if it holds a tile
+    flagged as a wall. Cells outside the map are open. Line checks visit
+    only the cells a segment passes through, so they never scan the walls.
+    version changes whenever cells are blocked, so that results computed
+    from the grid can be cached.
+    """
+
+    def __init__(self, columns: int, rows: int,
+                 cell_size: Tuple[int, int]) -> None:
+        self.cell_width, self.cell_height = cell_size
+        # Indexed by row and column.
+        self.blocked = np.zeros((rows, columns), dtype=bool)
+        self.version = 0
+
+    @classmethod
+    def from_map(cls, tile_map: tilemap.TiledMap) -> 'OccupancyGrid':
+        rows, columns = tile_map.wall_tile_mask.shape
+        grid = cls(columns, rows, tile_map.tile_size)
+        grid.blocked |= tile_map.wall_tile_mask
+        grid.version += 1
+        for obj in tile_map.objects:
+            if obj.type == tilemap.ObjectType.WALL:
+                grid.block_area(obj.x, obj.y, obj.width, obj.height)
+        return grid
+
+    def block_area(self, x: float, y: float, width: float,
+                   height: float) -> None:
+        """Block every cell overlapping the given area."""
+        rows, columns = self.blocked.shape
+        first_x = max(0, math.floor(x / self.cell_width))
+        first_y = max(0, math.floor(y / self.cell_height))
+        stop_x = min(columns, math.ceil((x + width) / self.cell_width))
+        stop_y = min(rows, math.ceil((y + height) / self.cell_height))
+        if first_x < stop_x and first_y < stop_y:
+            self.blocked[first_y:stop_y, first_x:stop_x] = True
+            self.version += 1
+
+    def cell_of(self, point: Point) -> Cell:
+        return (math.floor(point[0] / self.cell_width),
+                math.floor(point[1] / self.cell_height))
+
+    def contains(self, cell: Cell) -> bool:
+        rows, columns = self.blocked.shape
+        return 0 <= cell[0] < columns and 0 <= cell[1] < rows
+
+    def is_blocked(self, cell: Cell) -> bool:
+        x, y = cell
+        rows, columns = self.blocked.shape
+        return 0 <= x < columns and 0 <= y < rows and \
+            self.blocked.item(y, x)
+
+    def line_is_clear(self, start: Point, end: Point) -> bool:
+        """Whether no cell touched by the segment from start to end is
+        blocked."""
+        for cell in self.cells_on_line(start, end):
+            if self.is_blocked(cell):
+                return False
+        return True
+
+    def cells_on_line(self, start: Point, end: Point) -> Iterator[Cell]:
+        """The cells the segment from start to end passes through, in order.
+
+        Cells are stepped through as in Amanatides and Woo's voxel
+        traversal. Where the segment crosses a cell corner exactly, both
+        cells beside the corner are included, so that a line cannot slip
+        diagonally between two blocked cells.
+        """
+        x, y = self.cell_of(start)
+        end_x, end_y = self.cell_of(end)
+        yield x, y
+
+        dx = (end[0] - start[0]) / self.cell_width
+        dy = (end[1] - start[1]) / self.cell_height
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Fractions of the segment that cross one cell, and that reach the
+        # next cell boundary.
+        delta_x = abs(1 / dx) if dx else math.inf
+        delta_y = abs(1 / dy) if dy else math.inf
+        next_x = next_y = math.inf
+        if dx:
+            offset = start[0] / self.cell_width - x
+            next_x = (1 - offset if dx > 0 else offset) * delta_x
+        if dy:
+            offset = start[1] / self.cell_height - y
+            next_y = (1 - offset if dy > 0 else offset) * delta_y
+
+        while (x, y) != (end_x, end_y) and \
+                min(next_x, next_y) <= 1 + _EPSILON:
+            if abs(next_x - next_y) < _EPSILON:
+                yield x + step_x, y
+                yield x, y + step_y
+                x += step_x
+                y += step_y
+                next_x += delta_x
+                next_y += delta_y
+            elif next_x < next_y:
+                x += step_x
+                next_x += delta_x
+            else:
+                y += step_y
+                next_y += delta_y
+            yield x, y
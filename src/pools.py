@@ -0,0 +1,69 @@
+"""Pools that recycle short-lived GameObjects instead of reallocating them.
+
+A pooled object is handed back to its pool when it is killed (see
+GameObject.kill). acquire then reinitializes a released object with its
+reset method, or builds a new one if none is free.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple
+
+DEFAULT_MAX_FREE = 512
+
+
+class PoolStats(NamedTuple):
+    hits: int
+    misses: int
+    free: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ObjectPool(object):
+    """Recycles objects built by factory.
+
+    Objects must define reset, taking the same arguments as factory.
+    """
+
+    def __init__(self, name: str, factory: Callable[..., Any],
+                 max_free: int = DEFAULT_MAX_FREE) -> None:
+        assert name not in _pools, 'Pool %s already exists.' % (name,)
+        self.name = name
+        self._factory = factory
+        self._max_free = max_free
+        self._free: List[Any] = []
+        self._hits = 0
+        self._misses = 0
+        _pools[name] = self
+
+    def acquire(self, *args: Any) -> Any:
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self._hits += 1
+        else:
+            obj = self._factory(*args)
+            self._misses += 1
+        obj.pool = self
+        return obj
+
+    def release(self, obj: Any) -> None:
+        if len(self._free) < self._max_free:
+            self._free.append(obj)
+
+    def clear(self) -> None:
+        self._free.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> PoolStats:
+        return PoolStats(self._hits, self._misses, len(self._free))
+
+
+_pools: Dict[str, ObjectPool] = {}
+
+
+def pool_stats() -> Dict[str, PoolStats]:
+    return {name: pool.stats for name, pool in _pools.items()}
@@ -0,0 +1,193 @@
+"""Struct-of-arrays storage and batched updates for projectiles."""
+from typing import Any, Dict, List
+
+import numpy as np
+import pygame as pg
+from pygame.math import Vector2
+from pygame.sprite import Group, Sprite
+
+from spatial import StaticGroup
+
+_INITIAL_CAPACITY = 64
+
+
+def _round_like_rect(values: np.ndarray) -> np.ndarray:
+    """Round halves away from zero, as pg.Rect does for a float center."""
+    return np.where(values >= 0, np.floor(values + 0.5),
+                    np.ceil(values - 0.5))
+
+
+class ProjectileGroup(Group):
+    """A Group of projectiles whose motion state lives in NumPy arrays.
+
+    While a projectile is in the group, its position, velocity, spawn time
+    and ProjectileData index are stored in row `slot` of the group arrays,
+    and the projectile reads and writes them there. On removal the position
+    and velocity are handed back to the projectile.
+
+    step integrates every projectile at once and kills those that hit a
+    wall or outlived their max_lifetime. A projectile's own update is
+    skipped once after each step, so stepping the group and then updating
+    all sprites moves each projectile once.
+    """
+
+    def __init__(self, *sprites: Sprite) -> None:
+        self._count = 0
+        self._sprites: List[Any] = []
+        self._pos = np.zeros((_INITIAL_CAPACITY, 2))
+        self._vel = np.zeros((_INITIAL_CAPACITY, 2))
+        self._spawn_time = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._data_index = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._size = np.zeros((_INITIAL_CAPACITY, 2), dtype=np.int64)
+        self._ordinal = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._stepped = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._next_ordinal = 0
+
+        # Distinct ProjectileData of the members, indexed by _data_index.
+        self._datas: List[Any] = []
+        self._data_indices: Dict[Any, int] = {}
+        self._max_lifetimes = np.zeros(0)
+
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, *args: Any) -> None:
+        super().add_internal(sprite, *args)
+        assert sprite.slot_group is None, 'Projectile already has a slot.'
+        if self._count == len(self._pos):
+            self._grow()
+        slot = self._count
+        self._count += 1
+        self._sprites.append(sprite)
+
+        self._pos[slot] = sprite.pos
+        self._vel[slot] = sprite.velocity
+        self._spawn_time[slot] = sprite.spawn_time
+        self._data_index[slot] = self._index_of(sprite.data)
+        self._size[slot] = sprite.base_size
+        self._ordinal[slot] = self._next_ordinal
+        self._stepped[slot] = False
+        self._next_ordinal += 1
+
+        sprite.slot_group = self
+        sprite.slot = slot
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        slot = sprite.slot
+        sprite.slot_group = None
+        sprite.pos = Vector2(*self._pos[slot])
+        sprite.velocity = Vector2(*self._vel[slot])
+
+        last = self._count - 1
+        if slot != last:
+            for array in (self._pos, self._vel, self._spawn_time,
+                          self._data_index, self._size, self._ordinal,
+                          self._stepped):
+                array[slot] = array[last]
+            moved = self._sprites[last]
+            self._sprites[slot] = moved
+            moved.slot = slot
+        self._sprites.pop()
+        self._count = last
+
+    def position(self, slot: int) -> Vector2:
+        return Vector2(self._pos.item(slot, 0), self._pos.item(slot, 1))
+
+    def center_rect(self, slot: int, rect: pg.Rect) -> None:
+        """Center rect on the position in slot, without building a Vector2."""
+        rect.centerx = self._pos.item(slot, 0)
+        rect.centery = self._pos.item(slot, 1)
+
+    def set_position(self, slot: int, pos: Vector2) -> None:
+        self._pos[slot] = pos
+
+    def velocity(self, slot: int) -> Vector2:
+        return Vector2(self._vel.item(slot, 0), self._vel.item(slot, 1))
+
+    def set_velocity(self, slot: int, velocity: Vector2) -> None:
+        self._vel[slot] = velocity
+
+    def spawn_time(self, slot: int) -> int:
+        return int(self._spawn_time[slot])
+
+    def consume_step(self, slot: int) -> bool:
+        """Whether the projectile was moved by the last step.
+
+        The flag is cleared, so this returns True once per step.
+        """
+        stepped = bool(self._stepped[slot])
+        self._stepped[slot] = False
+        return stepped
+
+    def step(self, dt: float, current_time: int, walls: StaticGroup) -> None:
+        count = self._count
+        if count == 0:
+            return
+        self._pos[:count] += self._vel[:count] * dt
+        self._stepped[:count] = True
+
+        hit_wall = walls.overlaps_any(*self._bounds())
+        lifetime = current_time - self._spawn_time[:count]
+        expired = lifetime > self._max_lifetimes[self._data_index[:count]]
+
+        dead = np.flatnonzero(hit_wall | expired)
+        for sprite in [self._sprites[slot] for slot in dead]:
+            sprite.kill()
+
+    def refresh_index(self) -> None:
+        """Present for parity with DynamicGroup. The arrays are always
+        current, so there is nothing to refresh."""
+        pass
+
+    def collide_rect(self, rect: pg.Rect) -> List[Sprite]:
+        """Projectiles whose rect overlaps rect, in group order.
+
+        Every projectile is tested, so this suits a few queries per frame,
+        such as the player's. Many rects are better looked up one
+        projectile at a time in a grid of the rects.
+        """
+        if self._count == 0:
+            return []
+        lefts, tops, rights, bottoms = self._bounds()
+        hits = np.flatnonzero((lefts < rect.right) & (rights > rect.left) &
+                              (tops < rect.bottom) & (bottoms > rect.top))
+        hits = hits[np.argsort(self._ordinal[hits])]
+        return [self._sprites[slot] for slot in hits]
+
+    def in_rect(self, rect: pg.Rect) -> List[Sprite]:
+        """Projectiles whose position lies in rect, in group order."""
+        if self._count == 0:
+            return []
+        xs = self._pos[:self._count, 0]
+        ys = self._pos[:self._count, 1]
+        inside = np.flatnonzero((xs >= rect.left) & (xs < rect.right) &
+                                (ys >= rect.top) & (ys < rect.bottom))
+        inside = inside[np.argsort(self._ordinal[inside])]
+        return [self._sprites[slot] for slot in inside]
+
+    def _bounds(self) -> List[np.ndarray]:
+        """Left, top, right and bottom of the rect of every projectile."""
+        count = self._count
+        sizes = self._size[:count]
+        centers = _round_like_rect(self._pos[:count])
+        top_lefts = centers - sizes // 2
+        bottom_rights = top_lefts + sizes
+        return [top_lefts[:, 0], top_lefts[:, 1], bottom_rights[:, 0],
+                bottom_rights[:, 1]]
+
+    def _index_of(self, data: Any) -> int:
+        if data not in self._data_indices:
+            self._data_indices[data] = len(self._datas)
+            self._datas.append(data)
+            self._max_lifetimes = np.array(
+                [d.max_lifetime for d in self._datas], dtype=float)
+        return self._data_indices[data]
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._pos)
+        for name in ('_pos', '_vel', '_spawn_time', '_data_index', '_size',
+                     '_ordinal', '_stepped'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
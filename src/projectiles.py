@@ -1,22 +1,40 @@
 from collections import namedtuple
 from random import uniform, randint
+from typing import Tuple
 
 import pygame as pg
 from pygame.math import Vector2
-from pygame.transform import rotate
 
 import settings
 from model import TimeAccess, GameObject
+from pools import ObjectPool
+from projectile_system import ProjectileGroup
 from view import images
 
 
 class Projectile(GameObject, TimeAccess):
     """A projectile fired from weapon. Projectile size is subclass dependent.
+
+    While in a ProjectileGroup, the motion state of a projectile is stored in
+    the group's arrays (see projectile_system).
     """
 
+    light_radius = settings.PROJECTILE_LIGHT_RADIUS
+
     def __init__(self, pos: Vector2, direction: Vector2,
                  hits_player: bool = False) -> None:
+        self.slot_group: ProjectileGroup = None
+        self.slot = -1
         super().__init__(pos)
+
+        self._base_rect = self.image.get_rect().copy()
+        self._launch(direction, hits_player)
+
+    def _launch(self, direction: Vector2, hits_player: bool) -> None:
+        assert direction.is_normalized()
+        self.velocity = direction * self.speed * uniform(0.9, 1.1)
+        self._spawn_time = self.timer.current_time
+
         if hits_player:
             groups_list = [self.groups.all_sprites,
                            self.groups.enemy_projectiles]
@@ -24,22 +42,57 @@ class Projectile(GameObject, TimeAccess):
             groups_list = [self.groups.all_sprites, self.groups.bullets]
         pg.sprite.Sprite.__init__(self, groups_list)
 
-        self._base_rect = self.image.get_rect().copy()
+    @property
+    def pos(self) -> Vector2:
+        if self.slot_group is None:
+            return self._pos
+        return self.slot_group.position(self.slot)
+
+    @pos.setter
+    def pos(self, value: Vector2) -> None:
+        if self.slot_group is None:
+            self._pos = value
+        else:
+            self.slot_group.set_position(self.slot, value)
 
-        assert direction.is_normalized()
-        self.velocity = direction * self.speed * uniform(0.9, 1.1)
-        self.spawn_time = self.timer.current_time
+    @property
+    def velocity(self) -> Vector2:
+        if self.slot_group is None:
+            return self._velocity
+        return self.slot_group.velocity(self.slot)
+
+    @velocity.setter
+    def velocity(self, value: Vector2) -> None:
+        if self.slot_group is None:
+            self._velocity = value
+        else:
+            self.slot_group.set_velocity(self.slot, value)
+
+    @property
+    def spawn_time(self) -> int:
+        return self._spawn_time
+
+    @property
+    def base_size(self) -> Tuple[int, int]:
+        return self._base_rect.size
 
     def update(self) -> None:
+        # Skip if the group already moved this projectile in a batch.
+        if self.slot_group is not None and \
+                self.slot_group.consume_step(self.slot):
+            return
         self.pos += self.velocity * self.timer.dt
-        if pg.sprite.spritecollideany(self, self.groups.walls):
+        if self.groups.walls.collide_any(self.rect):
             self.kill()
         if self._lifetime_exceeded:
             self.kill()
 
     @property
     def rect(self) -> pg.Rect:
-        self._base_rect.center = self.pos
+        if self.slot_group is None:
+            self._base_rect.center = self._pos
+        else:
+            self.slot_group.center_rect(self.slot, self._base_rect)
         return self._base_rect
 
     @property
@@ -51,6 +104,10 @@ class Projectile(GameObject, TimeAccess):
     def image(self) -> pg.Surface:
         raise NotImplementedError
 
+    @property
+    def data(self) -> 'ProjectileData':
+        raise NotImplementedError
+
     @property
     def max_lifetime(self) -> int:
         raise NotImplementedError
@@ -89,6 +146,10 @@ class SimpleProjectile(Projectile):
         self._data = data
         super().__init__(pos, direction, data.hits_player)
 
+    @property
+    def data(self) -> ProjectileData:
+        return self._data
+
     @property
     def damage(self) -> int:
         return self._data.damage
@@ -115,30 +176,40 @@ class FancyProjectile(SimpleProjectile):
 
         super().__init__(pos, direction, data)
 
+    def reset(self, pos: Vector2, direction: Vector2,
+              data: ProjectileData) -> None:
+        """Fire a killed projectile again, as if newly constructed."""
+        assert not self.alive()
+        self._init_image(data, direction)
+        self._data = data
+        self.pos = Vector2(pos.x, pos.y)
+        self._base_rect.size = self.image.get_size()
+        self._launch(direction, data.hits_player)
+
     def _init_image(self, data: ProjectileData,
                     direction: Vector2) -> None:
-        self._base_image = images.get_image(data.image_file)
+        self._image_angle = 0.0
         if data.angled_image:
-            angle = direction.angle_to(Vector2(0, 0))
-            self._base_image = rotate(self._base_image, angle)
-        if data.rotating_image:
-            self._process_image = self._rotate_image
-        else:
-            self._process_image = lambda x: x
-
-    def _rotate_image(self, image: pg.Surface) -> pg.Surface:
-        angle = self.timer.current_time // 2 % 360
-        return pg.transform.rotate(image, angle)
+            self._image_angle = direction.angle_to(Vector2(0, 0))
+        self._spins = data.rotating_image
 
     @property
     def image(self) -> pg.Surface:
-        return self._process_image(self._base_image)
+        angle = self._image_angle
+        if self._spins:
+            angle += self.timer.current_time // 2 % 360
+        if angle == 0:
+            return images.get_image(self._data.image_file)
+        return images.get_rotated_image(self._data.image_file, angle)
 
     def kill(self) -> None:
         super().kill()
         if self._data.drops_on_kill is not None:
-            from data.constructors import build_map_object
-            build_map_object(self._data.drops_on_kill, self.pos)
+            from data.constructors import build_dropped_object
+            build_dropped_object(self._data.drops_on_kill, self.pos)
+
+
+projectile_pool = ObjectPool('projectiles', FancyProjectile)
 
 
 class ProjectileFactory(object):
@@ -147,18 +218,31 @@ class ProjectileFactory(object):
 
     def build(self, pos: Vector2,
               direction: Vector2) -> SimpleProjectile:
-        projectile = FancyProjectile(pos, direction, self._data)
+        projectile = projectile_pool.acquire(pos, direction, self._data)
 
         return projectile
 
 
 class MuzzleFlash(GameObject, TimeAccess):
+    light_radius = settings.MUZZLE_FLASH_LIGHT_RADIUS
+
     def __init__(self, pos: Vector2) -> None:
-        pg.sprite.Sprite.__init__(self, self.groups.all_sprites)
         super().__init__(pos)
         self._rect = self.image.get_rect().copy()
+        self._show()
+
+    def reset(self, pos: Vector2) -> None:
+        """Show a faded out flash again at pos."""
+        assert not self.alive()
+        self.pos = Vector2(pos.x, pos.y)
+        self._rect.size = self.image.get_size()
+        self._show()
+
+    def _show(self) -> None:
         self._rect.center = self.pos
         self._spawn_time = self.timer.current_time
+        pg.sprite.Sprite.__init__(self, [self.groups.all_sprites,
+                                         self.groups.effects])
 
     def update(self) -> None:
         if self._fade_out():
@@ -177,3 +261,6 @@ class MuzzleFlash(GameObject, TimeAccess):
     @property
     def rect(self) -> pg.Rect:
         return self._rect
+
+
+muzzle_flash_pool = ObjectPool('muzzle_flashes', MuzzleFlash)
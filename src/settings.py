@@ -1,3 +1,5 @@
+from os import path
+
 # define some colors (R, G, B)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -32,6 +34,14 @@ GRIDHEIGHT = HEIGHT / TILESIZE
 FLASH_DURATION = 50
 NIGHT_COLOR = (20, 20, 20)
 LIGHT_RADIUS = (500, 500)
+# Radii of the lights carried by game objects in night mode. The light mask
+# is drawn unscaled at the player's radius.
+PLAYER_LIGHT_RADIUS = 175
+MUZZLE_FLASH_LIGHT_RADIUS = 100
+PROJECTILE_LIGHT_RADIUS = 30
+
+# Parsed maps are cached here, see map_cache.MapCache.
+MAP_CACHE_FOLDER = path.join(path.expanduser('~'), '.cache', 'swmp', 'maps')
 
 # Layers
 WALL_LAYER = 1
@@ -0,0 +1,427 @@
+"""Uniform-grid spatial indexing used to avoid brute force collision scans."""
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+import pygame as pg
+from pygame.sprite import Group, Sprite
+
+DEFAULT_CELL_SIZE = 128
+# Below this many rect and sprite pairs, StaticGroup.overlaps_any compares
+# every pair at once, which beats the grid lookup's fixed overhead.
+BROADCAST_PAIRS = 100000
+
+Cell = Tuple[int, int]
+# Inclusive range of cells touched by a rect: x_min, y_min, x_max, y_max.
+Span = Tuple[int, int, int, int]
+
+
+class SpatialHash(object):
+    """Buckets items into the square cells of a uniform grid.
+
+    An item is stored in every cell its rect touches. Queries return the
+    items sharing at least one cell with the query rect, so callers must
+    still test candidates for an exact overlap.
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        assert cell_size > 0
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[Any]] = {}
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def cells_in_rect(self, rect: pg.Rect) -> List[Cell]:
+        size = self.cell_size
+        x_min = rect.left // size
+        y_min = rect.top // size
+        x_max = max(rect.right - 1, rect.left) // size
+        y_max = max(rect.bottom - 1, rect.top) // size
+        return [(x, y) for x in range(x_min, x_max + 1)
+                for y in range(y_min, y_max + 1)]
+
+    def insert(self, item: Any, rect: pg.Rect) -> None:
+        for cell in self.cells_in_rect(rect):
+            if cell in self._cells:
+                self._cells[cell].append(item)
+            else:
+                self._cells[cell] = [item]
+
+    def query(self, rect: pg.Rect) -> List[Any]:
+        """Items sharing a cell with rect. An item may be listed twice."""
+        cells = self._cells
+        found: List[Any] = []
+        for cell in self.cells_in_rect(rect):
+            if cell in cells:
+                found.extend(cells[cell])
+        return found
+
+
+class StaticGroup(Group):
+    """A Group of sprites whose rects do not move, e.g. walls.
+
+    Overlap queries are answered from a SpatialHash. The hash is rebuilt
+    lazily the first time it is queried after the group membership changes,
+    so walls loaded from a map are indexed once. Queries return sprites in
+    the same order as pg.sprite.spritecollide would.
+    """
+
+    def __init__(self, *sprites: Sprite,
+                 cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        self._index = SpatialHash(cell_size)
+        # Wall bounds as columns of left, top, right, bottom.
+        self._bounds = np.zeros((0, 4))
+        # The grid again, for vectorized queries. _cell_walls lists the
+        # index of every wall in each cell it touches, sorted by cell key,
+        # with the keys in _cell_keys. _key_origin is the first column and
+        # row of the grid and _key_rows its number of rows.
+        self._cell_keys = np.zeros(0, dtype=np.int64)
+        self._cell_walls = np.zeros(0, dtype=np.int64)
+        self._key_origin = (0, 0)
+        self._key_rows = 0
+        self._index_stale = True
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, *args: Any) -> None:
+        super().add_internal(sprite, *args)
+        self._index_stale = True
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        self._index_stale = True
+
+    def build_index(self) -> None:
+        self._index.clear()
+        memberships: List[Tuple[Cell, int]] = []
+        for order, sprite in enumerate(self.sprites()):
+            self._index.insert((order, sprite), sprite.rect)
+            memberships.extend((cell, order) for cell in
+                               self._index.cells_in_rect(sprite.rect))
+        self._bounds = np.array(
+            [(s.rect.left, s.rect.top, s.rect.right, s.rect.bottom)
+             for s in self.sprites()], dtype=float).reshape(-1, 4)
+
+        cells = np.array([cell for cell, _ in memberships],
+                         dtype=np.int64).reshape(-1, 2)
+        walls = np.array([order for _, order in memberships], dtype=np.int64)
+        if len(cells):
+            self._key_origin = (int(cells[:, 0].min()),
+                                int(cells[:, 1].min()))
+            self._key_rows = int(cells[:, 1].max()) - self._key_origin[1] + 1
+        keys = self._cell_key(cells[:, 0], cells[:, 1])
+        by_key = np.argsort(keys, kind='stable')
+        self._cell_keys = keys[by_key]
+        self._cell_walls = walls[by_key]
+        self._index_stale = False
+
+    def collide_rect(self, rect: pg.Rect) -> List[Sprite]:
+        """All sprites whose rect overlaps rect."""
+        if self._index_stale:
+            self.build_index()
+        hits: Dict[int, Sprite] = {}
+        for order, sprite in self._index.query(rect):
+            if order not in hits and rect.colliderect(sprite.rect):
+                hits[order] = sprite
+        return [hits[order] for order in sorted(hits)]
+
+    def collide_any(self, rect: pg.Rect) -> Union[Sprite, None]:
+        """The first sprite found overlapping rect, or None."""
+        if self._index_stale:
+            self.build_index()
+        for _, sprite in self._index.query(rect):
+            if rect.colliderect(sprite.rect):
+                return sprite
+        return None
+
+    def overlaps_any(self, lefts: np.ndarray, tops: np.ndarray,
+                     rights: np.ndarray, bottoms: np.ndarray) -> np.ndarray:
+        """For each rect given by the bound arrays, whether it hits a sprite.
+
+        This is the vectorized form of collide_any. Each rect is only
+        compared with the sprites sharing a grid cell with it.
+        """
+        if self._index_stale:
+            self.build_index()
+        walls = self._bounds
+        if len(walls) == 0:
+            return np.zeros(len(lefts), dtype=bool)
+        if len(walls) * len(lefts) <= BROADCAST_PAIRS:
+            pairs = lefts[:, None] < walls[:, 2]
+            pairs &= rights[:, None] > walls[:, 0]
+            pairs &= tops[:, None] < walls[:, 3]
+            pairs &= bottoms[:, None] > walls[:, 1]
+            return pairs.any(axis=1)
+
+        hits = np.zeros(len(lefts), dtype=bool)
+        size = self._index.cell_size
+        first_x = np.floor_divide(lefts, size).astype(np.int64)
+        first_y = np.floor_divide(tops, size).astype(np.int64)
+        last_x = np.floor_divide(np.maximum(rights - 1, lefts),
+                                 size).astype(np.int64)
+        last_y = np.floor_divide(np.maximum(bottoms - 1, tops),
+                                 size).astype(np.int64)
+        origin_x, origin_y = self._key_origin
+        # Rects are usually smaller than a cell, so this visits few offsets.
+        for dx in range(int((last_x - first_x).max()) + 1):
+            for dy in range(int((last_y - first_y).max()) + 1):
+                x = first_x + dx
+                y = first_y + dy
+                rects = np.flatnonzero(
+                    (x <= last_x) & (y <= last_y) & (x >= origin_x) &
+                    (y >= origin_y) & (y < origin_y + self._key_rows))
+                keys = self._cell_key(x[rects], y[rects])
+                starts = np.searchsorted(self._cell_keys, keys, 'left')
+                counts = np.searchsorted(self._cell_keys, keys,
+                                         'right') - starts
+                total = counts.sum()
+                if total == 0:
+                    continue
+                # Position of each pair within the run of its cell.
+                run_offsets = np.arange(total) - np.repeat(
+                    np.cumsum(counts) - counts, counts)
+                pair_rects = np.repeat(rects, counts)
+                pair_walls = walls[self._cell_walls[
+                    np.repeat(starts, counts) + run_offsets]]
+                overlap = lefts[pair_rects] < pair_walls[:, 2]
+                overlap &= rights[pair_rects] > pair_walls[:, 0]
+                overlap &= tops[pair_rects] < pair_walls[:, 3]
+                overlap &= bottoms[pair_rects] > pair_walls[:, 1]
+                hits[pair_rects[overlap]] = True
+        return hits
+
+    def _cell_key(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        origin_x, origin_y = self._key_origin
+        return (x - origin_x) * self._key_rows + (y - origin_y)
+
+
+class DynamicGroup(Group):
+    """A Group of moving sprites with a uniform grid over their rects.
+
+    refresh_index must be called after sprites move and before querying.
+    It only re-buckets the sprites whose rect now touches different cells,
+    along with sprites added since the last refresh. Sprites removed from
+    the group leave the grid immediately.
+    """
+
+    def __init__(self, *sprites: Sprite,
+                 cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._rect_cells: Dict[Cell, Dict[Sprite, int]] = {}
+        self._spans: Dict[Sprite, Span] = {}
+        # Insertion counter used to report query results in group order.
+        self._ordinals: Dict[Sprite, int] = {}
+        self._next_ordinal = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, *args: Any) -> None:
+        super().add_internal(sprite, *args)
+        self._ordinals[sprite] = self._next_ordinal
+        self._next_ordinal += 1
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        if sprite in self._spans:
+            self._unbucket(sprite, self._spans.pop(sprite))
+        del self._ordinals[sprite]
+
+    def refresh_index(self) -> None:
+        spans = self._spans
+        for sprite in self.spritedict:
+            span = self._span(sprite.rect)
+            old_span = spans.get(sprite)
+            if span == old_span:
+                continue
+            if old_span is not None:
+                self._unbucket(sprite, old_span)
+            spans[sprite] = span
+            self._bucket(sprite, span)
+
+    def collide_rect(self, rect: pg.Rect) -> List[Sprite]:
+        """Sprites whose rect overlaps rect, in group order."""
+        x_min, y_min, x_max, y_max = self._span(rect)
+        cells = self._rect_cells
+        hits: Dict[int, Sprite] = {}
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                if (x, y) not in cells:
+                    continue
+                for sprite, ordinal in cells[(x, y)].items():
+                    if ordinal not in hits and \
+                            rect.colliderect(sprite.rect):
+                        hits[ordinal] = sprite
+        return [hits[ordinal] for ordinal in sorted(hits)]
+
+    def in_group_order(self, sprites: Iterable[Sprite]) -> List[Sprite]:
+        """The given members of the group, sorted in group order."""
+        return sorted(sprites, key=self._ordinals.__getitem__)
+
+    def _span(self, rect: pg.Rect) -> Span:
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                max(rect.right - 1, rect.left) // size,
+                max(rect.bottom - 1, rect.top) // size)
+
+    def _bucket(self, sprite: Sprite, span: Span) -> None:
+        ordinal = self._ordinals[sprite]
+        cells = self._rect_cells
+        x_min, y_min, x_max, y_max = span
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                if (x, y) in cells:
+                    cells[(x, y)][sprite] = ordinal
+                else:
+                    cells[(x, y)] = {sprite: ordinal}
+
+    def _unbucket(self, sprite: Sprite, span: Span) -> None:
+        cells = self._rect_cells
+        x_min, y_min, x_max, y_max = span
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                cell = cells[(x, y)]
+                del cell[sprite]
+                if not cell:
+                    del cells[(x, y)]
+
+
+class MobileGroup(DynamicGroup):
+    """A DynamicGroup that can also be queried for sprites near a point.
+
+    build_index buckets every sprite by its pos. A sprite that moves after
+    that must call update_position so the index stays exact. Until the
+    index is built, or after a sprite is added, neighbors falls back to
+    returning every sprite in the group.
+    """
+
+    def __init__(self, *sprites: Sprite,
+                 cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        self._cells: Dict[Cell, Dict[Sprite, int]] = {}
+        self._sprite_cells: Dict[Sprite, Cell] = {}
+        self._index_stale = True
+        super().__init__(*sprites, cell_size=cell_size)
+
+    def add_internal(self, sprite: Sprite, *args: Any) -> None:
+        super().add_internal(sprite, *args)
+        self._index_stale = True
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        if not self._index_stale:
+            cell = self._sprite_cells.pop(sprite)
+            del self._cells[cell][sprite]
+
+    def build_index(self) -> None:
+        self._cells.clear()
+        self._sprite_cells.clear()
+        for sprite, ordinal in self._ordinals.items():
+            cell = self._cell_at(sprite.pos)
+            self._sprite_cells[sprite] = cell
+            if cell in self._cells:
+                self._cells[cell][sprite] = ordinal
+            else:
+                self._cells[cell] = {sprite: ordinal}
+        self._index_stale = False
+
+    def update_position(self, sprite: Sprite) -> None:
+        if self._index_stale or sprite not in self._sprite_cells:
+            return
+        old_cell = self._sprite_cells[sprite]
+        new_cell = self._cell_at(sprite.pos)
+        if new_cell == old_cell:
+            return
+        order = self._cells[old_cell].pop(sprite)
+        self._sprite_cells[sprite] = new_cell
+        if new_cell in self._cells:
+            self._cells[new_cell][sprite] = order
+        else:
+            self._cells[new_cell] = {sprite: order}
+
+    def neighbors(self, pos: Any, radius: float) -> List[Sprite]:
+        """Sprites possibly within radius of pos, in group order.
+
+        Every sprite within radius is returned, along with some that are
+        slightly further away.
+        """
+        if self._index_stale:
+            return self.sprites()
+        size = self.cell_size
+        x_min = int((pos[0] - radius) // size)
+        x_max = int((pos[0] + radius) // size)
+        y_min = int((pos[1] - radius) // size)
+        y_max = int((pos[1] + radius) // size)
+        cells = self._cells
+        found: List[Tuple[int, Sprite]] = []
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                if (x, y) in cells:
+                    found.extend((order, sprite) for sprite, order in
+                                 cells[(x, y)].items())
+        found.sort(key=_first)
+        return [sprite for _, sprite in found]
+
+    def in_rect(self, rect: pg.Rect) -> List[Sprite]:
+        """Sprites whose pos lies in rect, in group order."""
+        if self._index_stale:
+            return [sprite for sprite in self.sprites()
+                    if rect.collidepoint(sprite.pos)]
+        size = self.cell_size
+        cells = self._cells
+        found: List[Tuple[int, Sprite]] = []
+        for x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                if (x, y) in cells:
+                    found.extend((order, sprite) for sprite, order in
+                                 cells[(x, y)].items()
+                                 if rect.collidepoint(sprite.pos))
+        found.sort(key=_first)
+        return [sprite for _, sprite in found]
+
+    def _cell_at(self, pos: Any) -> Cell:
+        size = self.cell_size
+        return int(pos[0] // size), int(pos[1] // size)
+
+
+def _first(pair: Tuple[int, Any]) -> int:
+    return pair[0]
+
+
+def pairs_within(points: np.ndarray,
+                 radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Index arrays i, j of all ordered pairs of points closer than radius.
+
+    Coincident points, and so i == j, are excluded. Points are sorted into
+    grid cells of side radius, so only points in adjacent cells are
+    compared.
+    """
+    count = len(points)
+    empty = np.zeros(0, dtype=np.int64)
+    if count < 2:
+        return empty, empty
+    cells = np.floor(points / radius).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    width = cells[:, 1].max() + 2
+    keys = cells[:, 0] * width + cells[:, 1]
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    firsts = []
+    seconds = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            targets = keys + dx * width + dy
+            starts = np.searchsorted(sorted_keys, targets, 'left')
+            counts = np.searchsorted(sorted_keys, targets, 'right') - starts
+            total = counts.sum()
+            if total == 0:
+                continue
+            # Position of each pair within the run of its first point.
+            run_offsets = np.arange(total) - np.repeat(
+                np.cumsum(counts) - counts, counts)
+            firsts.append(np.repeat(np.arange(count), counts))
+            seconds.append(order[np.repeat(starts, counts) + run_offsets])
+    if not firsts:
+        return empty, empty
+    i = np.concatenate(firsts)
+    j = np.concatenate(seconds)
+    dist_sq = ((points[i] - points[j]) ** 2).sum(axis=1)
+    close = (dist_sq > 0) & (dist_sq < radius * radius)
+    return i[close], j[close]
@@ -1,15 +1,22 @@
 import os
+import tempfile
 from typing import List
 
 import pygame
 
 import creatures.enemies
+import map_cache
 import model
 from controllers.base import initialize_controller
 from view import images, sounds
 from view.screen import ScreenAccess
 
 
+# Maps parsed by tests are cached here, and not in the user's cache folder.
+# The folder is removed when the interpreter exits.
+_map_cache_folder = tempfile.TemporaryDirectory(prefix='swmp-test-maps-')
+
+
 class Key(object):
     def __init__(self, n_keys: int) -> None:
         self.pressed = [0] * n_keys
@@ -59,6 +66,7 @@ def initialize_pygame() -> None:
 
     images.initialize_images()
     sounds.initialize_sounds()
+    map_cache.cache = map_cache.MapCache(_map_cache_folder.name)
 
 
 def initialize_everything(groups: model.Groups = None,
@@ -1,11 +1,14 @@
+import gc
 import unittest
+import weakref
 
 from pygame.math import Vector2
 
 import model
 from creatures.enemies import Behavior, Enemy, EnemyData
 from data.input_output import load_npc_data_kwargs
-from conditions import TargetClose
+from conditions import TargetClose, target_distances
+from data.constructors import build_map_object
 from test.pygame_mock import MockTimer, initialize_everything
 from test.testing_utilities import make_player
 
@@ -102,6 +105,98 @@ class HumanoidsTest(unittest.TestCase):
         self.assertEqual(enemy.status.state, 'dead')
         self.assertEqual(len(self.groups.enemies), 0)
 
+    def test_target_close_reads_distance_table(self) -> None:
+        player = make_player()
+        zombies = [build_map_object('zombie', Vector2(x, 0), player)
+                   for x in (100, 399, 401, 600)]
+        close = TargetClose(player, 400)
+        expected = [close.check(zombie) for zombie in zombies]
+        self.assertEqual(expected, [True, True, False, False])
+
+        target_distances.update(zombies)
+        self.assertEqual(target_distances.get(zombies[0], player), 100 ** 2)
+        self.assertIsNone(target_distances.get(zombies[0], zombies[1]))
+        self.assertEqual([close.check(z) for z in zombies], expected)
+
+        # The table is trusted until cleared, even if things move.
+        zombies[0].pos = Vector2(1000, 0)
+        self.assertTrue(close.check(zombies[0]))
+        target_distances.clear()
+        self.assertFalse(close.check(zombies[0]))
+
+    def test_spawned_behaviors_share_stateless_parts(self) -> None:
+        player = make_player()
+        first, second = [build_map_object('turret', Vector2(100, 0), player)
+                         for _ in range(2)]
+        first_effects = first.behavior._effects
+        second_effects = second.behavior._effects
+        self.assertIs(first.behavior._state_conditions_values,
+                      second.behavior._state_conditions_values)
+        self.assertIs(first.behavior._compiled, second.behavior._compiled)
+
+        # The turret's equip and use mod effect is the second one.
+        self.assertIs(first_effects[0], second_effects[0])
+        self.assertIsNot(first_effects[1], second_effects[1])
+        self.assertIsNot(first_effects[1]._mod, second_effects[1]._mod)
+        self.assertEqual(first_effects[1]._mod, second_effects[1]._mod)
+
+        # Firing one turret does not put the other on cooldown.
+        self.timer.current_time += 100000
+        first.update()
+        self.assertEqual(len(self.groups.enemy_projectiles), 1)
+        second.update()
+        self.assertEqual(len(self.groups.enemy_projectiles), 2)
+
+    def test_spawned_behavior_matches_new_behavior(self) -> None:
+        player = make_player()
+        behavior_dict = load_npc_data_kwargs('red_zombie')['behavior']
+        fresh = Behavior(behavior_dict, player)
+        spawned = build_map_object('red_zombie', Vector2(0, 0),
+                                   player).behavior
+        self.assertEqual(spawned._state_conditions_values.keys(),
+                         fresh._state_conditions_values.keys())
+        self.assertEqual([type(e) for e in spawned._effects],
+                         [type(e) for e in fresh._effects])
+        for state, effects in spawned._state_effects_conditions.items():
+            self.assertEqual(set(effects), {
+                e for e in spawned._effects
+                if e in spawned._state_effects_conditions[state]})
+            self.assertEqual(len(effects),
+                             len(fresh._state_effects_conditions[state]))
+
+    def test_spawned_behaviors_do_not_keep_their_target_alive(self) -> None:
+        player = make_player()
+        enemies = [build_map_object(label, Vector2(100, 0), player)
+                   for label in ('zombie', 'hunter_zombie', 'turret')]
+        for enemy in enemies:
+            enemy.update()
+            enemy.kill()
+        player.kill()
+        player_ref = weakref.ref(player)
+        del player, enemies, enemy
+        gc.collect()
+        self.assertIsNone(player_ref())
+
+    def test_spawned_behaviors_pursue_their_own_target(self) -> None:
+        first, second = make_player(), make_player()
+        first.pos = Vector2(100, 300)
+        second.pos = Vector2(1000, 0)
+        zombies = [build_map_object('zombie', Vector2(100, 0), player)
+                   for player in (first, second)]
+        self.assertIs(zombies[0].behavior._state_conditions_values,
+                      zombies[1].behavior._state_conditions_values)
+        self.assertIs(zombies[0].behavior._target, first)
+        self.assertIs(zombies[1].behavior._target, second)
+
+        states = [zombie.behavior.determine_state(zombie)
+                  for zombie in zombies]
+        self.assertEqual(states, ['active', 'passive'])
+        zombie = zombies[0]
+        zombie.status.state = 'active'
+        zombie.behavior.do_state_behavior(zombie)
+        self.assertEqual(zombie.motion.rot,
+                         Vector2(0, 300).angle_to(Vector2(1, 0)))
+
     def test_enemy_construction_with_behavior(self) -> None:
         player = make_player()
 
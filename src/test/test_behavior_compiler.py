@@ -0,0 +1,128 @@
+import random
+import unittest
+from contextlib import ExitStack
+from unittest import mock
+from itertools import product
+from typing import Any, List
+
+from pygame.math import Vector2
+from parameterized import parameterized
+
+import model
+from creatures.behavior_compiler import behavior_source, compile_behavior
+from creatures.enemies import Behavior
+from creatures.humanoids import Status
+from data.input_output import load_npc_data_kwargs
+from test.pygame_mock import MockTimer, initialize_everything
+
+_NPC_LABELS = ('zombie', 'red_zombie', 'turret')
+
+# Exercises logical_not, conjunctions, summed priorities and ties.
+_SYNTHETIC = {
+    'idle': {'conditions': ['default'],
+             'effects': {'stop motion': None}},
+    'hurt': {'conditions': [{'damaged': {'value': 2}},
+                            {'target close': {'threshold': 100,
+                                              'value': 1}}],
+             'effects': {
+                 'face target': {
+                     'conditions': [{'target close': {'threshold': 50}},
+                                    {'damaged': None}]},
+                 'stop motion': {
+                     'conditions': [{'target close': {'threshold': 70,
+                                                      'logical_not': None}},
+                                    {'always': None}]}}},
+    'far': {'conditions': [{'target close': {'threshold': 200,
+                                             'logical_not': None,
+                                             'value': 3}}],
+            'effects': None},
+    'dead': {'conditions': [{'dead': {'value': 100}}],
+             'effects': {'kill': None}}}
+
+
+class _Thing(object):
+    def __init__(self, pos: Vector2) -> None:
+        self.pos = pos
+
+
+class _Humanoid(_Thing):
+    def __init__(self, pos: Vector2, health: int, target: Any,
+                 timer: MockTimer) -> None:
+        super().__init__(pos)
+        self.status = Status(100)
+        self.status.increment_health(health - 100)
+        self.target = target
+        self.timer = timer
+
+
+def setUpModule() -> None:
+    initialize_everything(model.Groups(), MockTimer())
+
+
+class BehaviorCompilerTest(unittest.TestCase):
+    def _assert_parity(self, behavior_dict: Any) -> None:
+        target = _Thing(Vector2(0, 0))
+        behavior = Behavior(behavior_dict, target)
+        calls: List[Any] = []
+
+        def record(effect: Any, humanoid: Any) -> None:
+            calls.append(effect)
+
+        with ExitStack() as stack:
+            for effect_type in {type(e) for e in behavior._effects}:
+                stack.enter_context(
+                    mock.patch.object(effect_type, 'activate', record))
+            self._compare_runs(behavior, target, calls)
+
+    def _compare_runs(self, behavior: Behavior, target: Any,
+                      calls: List[Any]) -> None:
+        timer = MockTimer()
+        distances = (0, 40, 60, 90, 150, 250, 450, 600)
+        # Enough seeds that the random rate effects fire now and then.
+        for dist, health, seed in product(distances, (100, 50, 0),
+                                          range(30)):
+            humanoid = _Humanoid(Vector2(dist, 0), health, target, timer)
+
+            random.seed(seed)
+            state = behavior.determine_state(humanoid)
+            humanoid.status.state = state
+            behavior.do_state_behavior(humanoid)
+            expected = list(calls)
+            calls.clear()
+
+            humanoid.status.state = None
+            random.seed(seed)
+            self.assertEqual(behavior.run(humanoid), state)
+            self.assertEqual(humanoid.status.state, state)
+            self.assertEqual(calls, expected)
+            calls.clear()
+
+    @parameterized.expand(_NPC_LABELS)
+    def test_npc_parity(self, label: str) -> None:
+        self._assert_parity(load_npc_data_kwargs(label)['behavior'])
+
+    def test_synthetic_parity(self) -> None:
+        self._assert_parity(_SYNTHETIC)
+
+    def test_compiled_once_per_behavior_data(self) -> None:
+        behavior_dict = load_npc_data_kwargs('zombie')['behavior']
+        self.assertIs(compile_behavior(behavior_dict),
+                      compile_behavior(dict(behavior_dict)))
+        self.assertIsNot(compile_behavior(behavior_dict),
+                         compile_behavior(_SYNTHETIC))
+
+    def test_conjunctions_short_circuit_cheapest_first(self) -> None:
+        source = behavior_source(_SYNTHETIC)
+        self.assertIn('if humanoid.status.damaged and dist_sq < 2500:',
+                      source)
+        self.assertIn('if True and not (dist_sq < 4900):', source)
+
+    def test_unknown_condition_raises(self) -> None:
+        behavior_dict = {'idle': {'conditions': [{'cooldown': {'value': 1}}],
+                                  'effects': None}}
+        with self.assertRaises(NotImplementedError):
+            behavior_source(behavior_dict)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,18 @@
 import unittest
+from random import Random
 from unittest.mock import Mock
 
 from pygame.math import Vector2
+from pygame.sprite import spritecollide
 
 import mods
-from creatures.humanoids import HumanoidData, Status, Inventory
+from creatures.humanoids import HumanoidData, Status, Inventory, \
+    collide_hit_rect_with_rect
 from data.constructors import build_map_object
+from projectiles import ProjectileData, SimpleProjectile
 from src.test.pygame_mock import initialize_pygame
 from src.test.testing_utilities import make_dungeon_controller, make_player
+from view import images
 from view.dungeon_view import DungeonView
 
 
@@ -115,6 +120,54 @@ class DungeonControllerTest(unittest.TestCase):
         # ensure nothing on the arms
         self.assertNotIn(mods.ModLocation.ARMS, inventory.active_mods)
 
+    def test_find_contacts_matches_brute_force(self) -> None:
+        dungeon = make_dungeon_controller()._dungeon
+        player = dungeon.player
+        groups = dungeon.groups
+        rng = Random(2)
+
+        def near_player() -> Vector2:
+            offset = Vector2(rng.uniform(-150, 150), rng.uniform(-150, 150))
+            return player.pos + offset
+
+        for _ in range(30):
+            build_map_object('zombie', near_player(), player)
+        for _ in range(10):
+            build_map_object('pistol', near_player())
+        bullet_data = ProjectileData(False, 10, 100, 1000,
+                                     images.LITTLE_BULLET)
+        enemy_data = ProjectileData(True, 5, 100, 1000, images.LITTLE_BULLET)
+        for _ in range(300):
+            SimpleProjectile(near_player(), Vector2(1, 0), bullet_data)
+        for _ in range(100):
+            SimpleProjectile(near_player(), Vector2(1, 0), enemy_data)
+
+        expected_items = spritecollide(player, groups.items, False)
+        expected_hitters = spritecollide(player, groups.enemies, False,
+                                         collide_hit_rect_with_rect)
+        expected_projectiles = spritecollide(player,
+                                             groups.enemy_projectiles, False,
+                                             collide_hit_rect_with_rect)
+        remaining = groups.bullets.sprites()
+        expected_bullet_hits = {}
+        for mob in groups.enemies:
+            hit = [b for b in remaining if mob.rect.colliderect(b.rect)]
+            if hit:
+                expected_bullet_hits[mob] = hit
+                remaining = [b for b in remaining if b not in hit]
+        self.assertTrue(expected_items and expected_hitters)
+        self.assertTrue(expected_projectiles and expected_bullet_hits)
+
+        contacts = dungeon._find_contacts()
+
+        self.assertEqual(contacts.items, expected_items)
+        self.assertEqual(contacts.hitters, expected_hitters)
+        self.assertEqual(contacts.projectiles, expected_projectiles)
+        self.assertEqual(contacts.bullet_hits, expected_bullet_hits)
+        self.assertEqual(groups.bullets.sprites(), remaining)
+        for projectile in expected_projectiles:
+            self.assertFalse(projectile.alive())
+
 
 if __name__ == '__main__':
     unittest.main()
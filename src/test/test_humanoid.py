@@ -1,6 +1,7 @@
 import math
 import unittest
 from itertools import product
+from random import Random
 from typing import Tuple
 
 from pygame.math import Vector2
@@ -184,6 +185,38 @@ class HumanoidsTest(unittest.TestCase):
 
         self.assertLess(final_dist, initial_dist)
 
+    def test_avoid_mobs_same_with_and_without_index(self) -> None:
+        player = make_player()
+        rng = Random(1)
+        for _ in range(60):
+            pos = Vector2(rng.uniform(0, 300), rng.uniform(0, 300))
+            build_map_object('zombie', pos, player)
+
+        zombies = self.groups.enemies.sprites()
+        for zombie in zombies:
+            zombie.motion.rot = rng.uniform(0, 360)
+
+        brute_force = []
+        for zombie in zombies:
+            zombie.update_acc()
+            brute_force.append(Vector2(zombie.motion.acc))
+
+        self.groups.enemies.build_index()
+        for zombie, expected in zip(zombies, brute_force):
+            zombie.update_acc()
+            self.assertEqual(zombie.motion.acc, expected)
+
+    def test_simulation_objects_have_no_instance_dict(self) -> None:
+        zombie = make_zombie()
+        behavior = zombie.behavior
+        objects = [zombie.motion, zombie.status, zombie.inventory,
+                   zombie.inventory.backpack]
+        objects += list(behavior._effects)
+        for conditions in behavior._state_conditions_values.values():
+            objects += list(conditions)
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj))
+
     def test_mob_damage_and_death(self) -> None:
         groups = self.groups
         mob = make_zombie()
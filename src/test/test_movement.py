@@ -0,0 +1,74 @@
+import math
+import unittest
+
+from movement import MoveRanges
+from occupancy import OccupancyGrid
+
+
+class MoveRangesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = OccupancyGrid(20, 20, (32, 32))
+        self.ranges = MoveRanges(self.grid)
+
+    def test_open_grid_costs(self) -> None:
+        self.assertEqual(set(self.ranges.reachable((5, 5), 1)),
+                         {(5, 5), (4, 5), (6, 5), (5, 4), (5, 6)})
+
+        costs = self.ranges.reachable((5, 5), 2)
+        self.assertEqual(len(costs), 13)
+        self.assertEqual(costs[(5, 5)], 0)
+        self.assertEqual(costs[(7, 5)], 2)
+        self.assertAlmostEqual(costs[(6, 6)], math.sqrt(2))
+        self.assertNotIn((7, 7), costs)
+
+    def test_walls_force_detours(self) -> None:
+        # A wall from (6, 0) down to (6, 7) between start and goal.
+        self.grid.block_area(6 * 32, 0, 32, 8 * 32)
+        costs = self.ranges.reachable((5, 5), 8)
+
+        self.assertNotIn((6, 5), costs)
+        # Down to row 8, across and back up, as the wall's corner cannot be
+        # cut.
+        self.assertEqual(costs[(7, 7)], 6)
+        self.assertEqual(costs[(7, 5)], 8)
+        self.assertNotIn((7, 4), costs)
+
+    def test_diagonal_moves_do_not_cut_corners(self) -> None:
+        self.grid.block_area(6 * 32, 5 * 32, 32, 32)
+        costs = self.ranges.reachable((5, 5), 2)
+        self.assertEqual(costs[(6, 6)], 2)
+
+    def test_occupied_and_outside_cells_are_not_entered(self) -> None:
+        costs = self.ranges.reachable((0, 0), 4, frozenset({(1, 0)}))
+        self.assertNotIn((1, 0), costs)
+        self.assertNotIn((-1, 0), costs)
+        self.assertNotIn((0, -1), costs)
+        self.assertEqual(costs[(2, 0)], 4)
+
+    def test_ranges_are_memoized_until_grid_changes(self) -> None:
+        first = self.ranges.reachable((5, 5), 3)
+        self.assertIs(self.ranges.reachable((5, 5), 3), first)
+        self.assertEqual(self.ranges.searches, 1)
+
+        self.ranges.reachable((5, 5), 3, frozenset({(9, 9)}))
+        self.assertEqual(self.ranges.searches, 2)
+
+        self.grid.block_area(0, 0, 32, 32)
+        self.assertIsNot(self.ranges.reachable((5, 5), 3), first)
+        self.assertEqual(self.ranges.searches, 3)
+
+    def test_least_recently_used_range_is_dropped(self) -> None:
+        ranges = MoveRanges(self.grid, max_ranges=2)
+        ranges.reachable((1, 1), 2)
+        ranges.reachable((2, 2), 2)
+        ranges.reachable((1, 1), 2)
+        ranges.reachable((3, 3), 2)
+        self.assertEqual(ranges.searches, 3)
+        ranges.reachable((1, 1), 2)
+        self.assertEqual(ranges.searches, 3)
+        ranges.reachable((2, 2), 2)
+        self.assertEqual(ranges.searches, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
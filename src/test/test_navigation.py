@@ -0,0 +1,77 @@
+import unittest
+from typing import List
+
+from navigation import FlowField
+from occupancy import Cell, OccupancyGrid
+
+
+class FlowFieldTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = OccupancyGrid(10, 10, (10, 10))
+        # A wall along column 5, open only in row 9.
+        self.grid.block_area(50, 0, 10, 90)
+        self.field = FlowField(self.grid, 1000)
+
+    def _path(self, start: tuple) -> list:
+        """The cells of the waypoints from start until the target."""
+        cells: List[Cell] = []
+        pos = start
+        waypoint = self.field.waypoint(pos)
+        while waypoint is not None and len(cells) < 50:
+            cells.append(self.grid.cell_of(waypoint))
+            waypoint = self.field.waypoint(waypoint)
+        return cells
+
+    def test_waypoints_lead_around_walls(self) -> None:
+        self.field.update((85, 15))
+        path = self._path((15, 15))
+
+        self.assertIn((5, 9), path)
+        for cell in path:
+            self.assertFalse(self.grid.is_blocked(cell))
+        # The last waypoint is next to the target's cell.
+        x, y = path[-1]
+        self.assertLessEqual(max(abs(x - 8), abs(y - 1)), 1)
+
+    def test_target_is_headed_for_when_close(self) -> None:
+        self.field.update((85, 15))
+        self.assertIsNone(self.field.waypoint((84, 17)))
+        self.assertIsNone(self.field.waypoint((75, 25)))
+        self.assertIsNotNone(self.field.waypoint((65, 35)))
+
+    def test_one_search_per_target_cell(self) -> None:
+        self.field.update((85, 15))
+        self.field.update((81, 19))
+        self.assertEqual(self.field.searches, 1)
+
+        self.field.update((85, 25))
+        self.assertEqual(self.field.searches, 2)
+        # Returning to an earlier cell reuses its search.
+        self.field.update((85, 15))
+        self.assertEqual(self.field.searches, 2)
+
+        self.grid.block_area(0, 0, 10, 10)
+        self.field.update((85, 15))
+        self.assertEqual(self.field.searches, 3)
+
+    def test_pursuers_in_blocked_cells_step_out(self) -> None:
+        self.field.update((85, 15))
+        cell = self.grid.cell_of(self.field.waypoint((55, 75)))
+        self.assertFalse(self.grid.is_blocked(cell))
+        self.assertEqual(cell[0], 6)
+
+    def test_unreachable_target_is_headed_for(self) -> None:
+        self.grid.block_area(50, 90, 10, 10)
+        self.field.update((85, 15))
+        self.assertIsNone(self.field.waypoint((15, 15)))
+
+    def test_search_stops_at_reach(self) -> None:
+        field = FlowField(self.grid, 30)
+        field.update((15, 15))
+        self.assertIsNotNone(field.waypoint((35, 35)))
+        self.assertIsNone(field.waypoint((15, 85)))
+        self.assertLessEqual(len(field._costs), 49)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from occupancy import OccupancyGrid
+from test.pygame_mock import initialize_pygame
+from tilemap import TiledMap, _is_wall_tile
+
+
+def setUpModule() -> None:
+    initialize_pygame()
+
+
+class OccupancyGridTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = OccupancyGrid(10, 8, (32, 32))
+
+    def test_block_area_blocks_overlapped_cells(self) -> None:
+        self.grid.block_area(40, 10, 30, 5)
+        self.assertEqual(set(zip(*self.grid.blocked.nonzero())),
+                         {(0, 1), (0, 2)})
+
+        self.grid.block_area(-50, 250, 100, 500)
+        self.assertTrue(self.grid.is_blocked((0, 7)))
+        self.assertTrue(self.grid.is_blocked((1, 7)))
+        self.assertFalse(self.grid.is_blocked((2, 7)))
+
+    def test_cells_outside_grid_are_open(self) -> None:
+        self.grid.blocked[:] = True
+        self.assertFalse(self.grid.is_blocked((-1, 0)))
+        self.assertFalse(self.grid.is_blocked((10, 0)))
+
+    def test_cells_on_line_are_in_order(self) -> None:
+        cells = list(self.grid.cells_on_line((16, 16), (112, 56)))
+        self.assertEqual(cells, [(0, 0), (1, 0), (1, 1), (2, 1), (3, 1)])
+
+        backwards = list(self.grid.cells_on_line((112, 56), (16, 16)))
+        self.assertEqual(backwards, cells[::-1])
+
+    def test_corner_crossing_includes_both_neighbors(self) -> None:
+        cells = list(self.grid.cells_on_line((16, 16), (80, 80)))
+        self.assertEqual(cells, [(0, 0), (1, 0), (0, 1), (1, 1), (2, 1),
+                                 (1, 2), (2, 2)])
+
+        self.grid.block_area(32, 0, 32, 32)
+        self.grid.block_area(0, 32, 32, 32)
+        self.assertFalse(self.grid.line_is_clear((16, 16), (80, 80)))
+
+    def test_thin_wall_blocks_its_whole_cell(self) -> None:
+        self.grid.block_area(150, 0, 2, 256)
+        self.assertFalse(self.grid.line_is_clear((16, 100), (300, 140)))
+        self.assertFalse(self.grid.line_is_clear((16, 100), (140, 240)))
+        self.assertTrue(self.grid.line_is_clear((16, 100), (120, 240)))
+
+    def test_line_within_one_cell(self) -> None:
+        self.assertEqual(list(self.grid.cells_on_line((3, 4), (20, 30))),
+                         [(0, 0)])
+
+    def test_from_map_blocks_wall_objects(self) -> None:
+        tile_map = TiledMap('test_turnbased.tmx')
+        grid = OccupancyGrid.from_map(tile_map)
+
+        self.assertEqual(grid.blocked.shape, (25, 50))
+        # The wall spans x from 700 to 821 and y from -15 to 415.
+        self.assertTrue(grid.is_blocked((21, 0)))
+        self.assertTrue(grid.is_blocked((25, 12)))
+        self.assertFalse(grid.is_blocked((26, 0)))
+        self.assertFalse(grid.is_blocked((21, 13)))
+        self.assertEqual(grid.blocked.sum(), 5 * 13)
+
+    def test_wall_tile_property(self) -> None:
+        self.assertTrue(_is_wall_tile({'wall': True}))
+        self.assertTrue(_is_wall_tile({'wall': 'true'}))
+        self.assertFalse(_is_wall_tile({'wall': 'false'}))
+        self.assertFalse(_is_wall_tile({'labels': 'door'}))
+        self.assertFalse(_is_wall_tile(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
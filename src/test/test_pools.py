@@ -0,0 +1,57 @@
+import unittest
+from typing import Any
+
+from pools import ObjectPool, pool_stats
+
+
+class _Thing(object):
+    pool: Any = None
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.resets = 0
+
+    def reset(self, value: int) -> None:
+        self.value = value
+        self.resets += 1
+
+
+class ObjectPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = ObjectPool('test_pool_%d' % (id(self),), _Thing,
+                               max_free=2)
+
+    def test_acquire_builds_then_reuses(self) -> None:
+        first = self.pool.acquire(1)
+        self.assertIs(first.pool, self.pool)
+        self.assertEqual(self.pool.stats, (0, 1, 0))
+
+        self.pool.release(first)
+        self.assertEqual(self.pool.stats.free, 1)
+
+        second = self.pool.acquire(2)
+        self.assertIs(second, first)
+        self.assertEqual(second.value, 2)
+        self.assertEqual(second.resets, 1)
+        self.assertEqual(self.pool.stats, (1, 1, 0))
+        self.assertEqual(self.pool.stats.hit_rate, 0.5)
+
+    def test_release_beyond_max_free_is_dropped(self) -> None:
+        things = [self.pool.acquire(k) for k in range(3)]
+        for thing in things:
+            self.pool.release(thing)
+        self.assertEqual(self.pool.stats.free, 2)
+
+        self.pool.clear()
+        self.assertEqual(self.pool.stats, (0, 0, 0))
+
+    def test_pool_stats_lists_pool(self) -> None:
+        self.assertIn(self.pool.name, pool_stats())
+
+    def test_duplicate_name_raises(self) -> None:
+        with self.assertRaises(AssertionError):
+            ObjectPool(self.pool.name, _Thing)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,14 @@
 import unittest
 
 from pygame.math import Vector2
+from pygame.rect import Rect
+from pygame.sprite import Sprite
 
 import model
 from data.input_output import load_projectile_data_kwargs
+from items import dropped_item_pool
 from projectiles import ProjectileData, SimpleProjectile, ProjectileFactory, \
-    FancyProjectile
+    FancyProjectile, projectile_pool
 from test.pygame_mock import initialize_pygame,  MockTimer
 from view import images
 
@@ -108,6 +111,111 @@ class ProjectilesTest(unittest.TestCase):
             self.assertEqual(len(self.groups.enemy_projectiles), k + 1)
             self.assertEqual(len(self.groups.bullets), 0)
 
+    def test_killed_factory_projectiles_are_reused(self) -> None:
+        bullet_data = ProjectileData(False, 10, 100, 100,
+                                     images.LITTLE_BULLET)
+        enemy_data = ProjectileData(True, 5, 50, 100, images.LITTLE_BULLET)
+
+        bullet = ProjectileFactory(bullet_data).build(Vector2(0, 0),
+                                                      Vector2(1, 0))
+        bullet.kill()
+        hits = projectile_pool.stats.hits
+
+        self.timer.current_time += 7
+        reused = ProjectileFactory(enemy_data).build(Vector2(5, 6),
+                                                     Vector2(0, 1))
+        self.assertIs(reused, bullet)
+        self.assertEqual(projectile_pool.stats.hits, hits + 1)
+        self.assertEqual(reused.pos, Vector2(5, 6))
+        self.assertEqual(reused.damage, 5)
+        self.assertEqual(reused.spawn_time, self.timer.current_time)
+        self.assertEqual(reused.velocity.x, 0)
+        self.assertIn(reused, self.groups.enemy_projectiles)
+        self.assertNotIn(reused, self.groups.bullets)
+
+    def test_killing_twice_releases_once(self) -> None:
+        data = ProjectileData(False, 10, 100, 100, images.LITTLE_BULLET)
+        projectile_pool.clear()
+        bullet = ProjectileFactory(data).build(Vector2(0, 0), Vector2(1, 0))
+        bullet.kill()
+        bullet.kill()
+        self.assertEqual(projectile_pool.stats.free, 1)
+
+    def test_dropped_items_are_reused(self) -> None:
+        dropper_data = ProjectileData(False, 10, 10, 10,
+                                      images.LITTLE_BULLET,
+                                      drops_on_kill='rock')
+        dropped_item_pool.clear()
+        FancyProjectile(Vector2(0, 0), Vector2(1, 0), dropper_data).kill()
+        rock = self.groups.items.sprites()[0]
+        rock.kill()
+
+        FancyProjectile(Vector2(3, 4), Vector2(1, 0), dropper_data).kill()
+        self.assertEqual(self.groups.items.sprites(), [rock])
+        self.assertEqual(dropped_item_pool.stats, (1, 1, 0))
+
+    def test_group_step_moves_projectiles(self) -> None:
+        data = ProjectileData(False, 10, 100, 1000, images.LITTLE_BULLET)
+        directions = [Vector2(1, 0), Vector2(0, 1), Vector2(-1, 0)]
+        bullets = [SimpleProjectile(Vector2(5, 5), d, data)
+                   for d in directions]
+        velocities = [Vector2(b.velocity) for b in bullets]
+
+        self.groups.bullets.step(self.timer.dt, 0, self.groups.walls)
+        for bullet, velocity in zip(bullets, velocities):
+            self.assertEqual(bullet.pos, Vector2(5, 5) + velocity * 0.1)
+            self.assertEqual(bullet.velocity, velocity)
+
+        # A sprite update right after a step does not move it again.
+        bullets[0].update()
+        self.assertEqual(bullets[0].pos, Vector2(5, 5) + velocities[0] * 0.1)
+        bullets[0].update()
+        self.assertEqual(bullets[0].pos, Vector2(5, 5) + velocities[0] * 0.2)
+
+    def test_group_step_kills_expired_and_wall_hits(self) -> None:
+        wall = Sprite(self.groups.walls)
+        wall.rect = Rect(50, -50, 10, 100)
+        data = ProjectileData(False, 10, 100, 100, images.LITTLE_BULLET)
+        old = SimpleProjectile(Vector2(-500, 0), Vector2(1, 0), data)
+        near_wall = SimpleProjectile(Vector2(45, 0), Vector2(1, 0), data)
+        self.timer.current_time = 50
+        young = SimpleProjectile(Vector2(-500, 0), Vector2(1, 0), data)
+
+        self.timer.current_time = 120
+        self.groups.bullets.step(self.timer.dt, self.timer.current_time,
+                                 self.groups.walls)
+
+        self.assertEqual(self.groups.bullets.sprites(), [young])
+        self.assertFalse(old.alive())
+        self.assertFalse(near_wall.alive())
+
+    def test_group_step_drops_on_kill(self) -> None:
+        dropper_data = ProjectileData(False, 10, 10, 10,
+                                      images.LITTLE_BULLET,
+                                      drops_on_kill='rock')
+        FancyProjectile(Vector2(0, 0), Vector2(1, 0), dropper_data)
+
+        self.groups.bullets.step(self.timer.dt, 11, self.groups.walls)
+        self.assertEqual(len(self.groups.bullets), 0)
+        self.assertEqual(len(self.groups.items), 1)
+
+    def test_group_keeps_state_when_members_removed(self) -> None:
+        data = ProjectileData(True, 10, 100, 1000, images.LITTLE_BULLET)
+        projectiles = [SimpleProjectile(Vector2(k, 2 * k), Vector2(1, 0),
+                                        data) for k in range(200)]
+        for projectile in projectiles[::3]:
+            projectile.kill()
+
+        for k, projectile in enumerate(projectiles):
+            self.assertEqual(projectile.pos, Vector2(k, 2 * k))
+            self.assertEqual(projectile.alive(), k % 3 != 0)
+
+        group = self.groups.enemy_projectiles
+        rect = Rect(-1, -1, 30, 60)
+        expected = [p for p in group if rect.colliderect(p.rect)]
+        self.assertTrue(expected)
+        self.assertEqual(group.collide_rect(rect), expected)
+
     def test_projectile_data_eq(self) -> None:
         rock_data_0 = ProjectileData(**load_projectile_data_kwargs('rock'))
         rock_data_1 = ProjectileData(**load_projectile_data_kwargs('rock'))
@@ -0,0 +1,195 @@
+import unittest
+from random import Random
+from unittest import mock
+
+import numpy as np
+import pygame as pg
+from pygame.math import Vector2
+from pygame.sprite import Sprite, spritecollide, spritecollideany
+
+import spatial
+from spatial import DynamicGroup, MobileGroup, SpatialHash, StaticGroup
+
+
+def _make_sprite(group: StaticGroup, x: int, y: int, w: int,
+                 h: int) -> Sprite:
+    sprite = Sprite(group)
+    sprite.rect = pg.Rect(x, y, w, h)
+    return sprite
+
+
+def _make_mobile(group: MobileGroup, x: float, y: float) -> Sprite:
+    sprite = Sprite(group)
+    sprite.pos = Vector2(x, y)
+    return sprite
+
+
+class SpatialHashTest(unittest.TestCase):
+    def test_cells_in_rect(self) -> None:
+        index = SpatialHash(10)
+        cells = index.cells_in_rect(pg.Rect(5, -5, 10, 10))
+        self.assertEqual(set(cells), {(0, -1), (0, 0), (1, -1), (1, 0)})
+
+    def test_rect_on_cell_boundary_uses_one_cell(self) -> None:
+        index = SpatialHash(10)
+        self.assertEqual(index.cells_in_rect(pg.Rect(10, 10, 10, 10)),
+                         [(1, 1)])
+
+    def test_query_only_returns_nearby_items(self) -> None:
+        index = SpatialHash(10)
+        index.insert('near', pg.Rect(0, 0, 5, 5))
+        index.insert('far', pg.Rect(100, 100, 5, 5))
+
+        found = index.query(pg.Rect(2, 2, 1, 1))
+        self.assertEqual(found, ['near'])
+
+    def test_clear(self) -> None:
+        index = SpatialHash(10)
+        index.insert('item', pg.Rect(0, 0, 5, 5))
+        index.clear()
+        self.assertEqual(index.query(pg.Rect(0, 0, 5, 5)), [])
+
+
+class StaticGroupTest(unittest.TestCase):
+    def test_collide_rect_matches_spritecollide(self) -> None:
+        walls = StaticGroup(cell_size=32)
+        for k in range(20):
+            _make_sprite(walls, 17 * k, 11 * k, 40, 25)
+        _make_sprite(walls, 0, 0, 400, 10)
+
+        probe = Sprite()
+        for x in range(-20, 400, 13):
+            for y in range(-20, 250, 17):
+                probe.rect = pg.Rect(x, y, 30, 30)
+                expected = spritecollide(probe, walls, False)
+                self.assertEqual(walls.collide_rect(probe.rect), expected)
+                any_hit = spritecollideany(probe, walls)
+                self.assertEqual(walls.collide_any(probe.rect) is None,
+                                 any_hit is None)
+
+    def test_overlaps_any_matches_collide_any(self) -> None:
+        rng = Random(3)
+        walls = StaticGroup(cell_size=32)
+        for _ in range(60):
+            _make_sprite(walls, rng.randint(-100, 400), rng.randint(-100, 400),
+                         rng.randint(1, 120), rng.randint(1, 40))
+        rects = [pg.Rect(rng.randint(-200, 500), rng.randint(-200, 500),
+                         rng.randint(1, 80), rng.randint(1, 80))
+                 for _ in range(500)]
+        bounds = np.array([(r.left, r.top, r.right, r.bottom)
+                           for r in rects], dtype=float)
+
+        hits = walls.overlaps_any(*bounds.T)
+        with mock.patch.object(spatial, 'BROADCAST_PAIRS', 0):
+            grid_hits = walls.overlaps_any(*bounds.T)
+
+        expected = [walls.collide_any(rect) is not None for rect in rects]
+        self.assertEqual(hits.tolist(), expected)
+        self.assertEqual(grid_hits.tolist(), expected)
+        self.assertTrue(any(expected) and not all(expected))
+        self.assertEqual(StaticGroup().overlaps_any(*bounds.T).tolist(),
+                         [False] * len(rects))
+
+    def test_index_follows_membership(self) -> None:
+        walls = StaticGroup()
+        rect = pg.Rect(0, 0, 10, 10)
+        self.assertEqual(walls.collide_rect(rect), [])
+
+        wall = _make_sprite(walls, 5, 5, 10, 10)
+        self.assertEqual(walls.collide_rect(rect), [wall])
+
+        wall.kill()
+        self.assertIsNone(walls.collide_any(rect))
+
+        _make_sprite(walls, 5, 5, 10, 10)
+        walls.empty()
+        self.assertEqual(walls.collide_rect(rect), [])
+
+
+class DynamicGroupTest(unittest.TestCase):
+    def test_collide_rect_follows_moving_sprites(self) -> None:
+        group = DynamicGroup(cell_size=20)
+        near = _make_sprite(group, 0, 0, 10, 10)
+        far = _make_sprite(group, 200, 200, 10, 10)
+        group.refresh_index()
+        probe = pg.Rect(5, 5, 10, 10)
+        self.assertEqual(group.collide_rect(probe), [near])
+
+        far.rect = pg.Rect(8, 8, 10, 10)
+        near.rect = pg.Rect(300, 0, 10, 10)
+        group.refresh_index()
+        self.assertEqual(group.collide_rect(probe), [far])
+
+    def test_collide_rect_in_group_order(self) -> None:
+        group = DynamicGroup(cell_size=8)
+        sprites = [_make_sprite(group, 3 * k, 0, 30, 30) for k in range(10)]
+        sprites[4].kill()
+        group.add(sprites[4])
+        group.refresh_index()
+
+        probe = Sprite()
+        probe.rect = pg.Rect(20, 20, 5, 5)
+        self.assertEqual(group.collide_rect(probe.rect),
+                         spritecollide(probe, group, False))
+        self.assertIs(group.collide_rect(probe.rect)[-1], sprites[4])
+
+    def test_removed_sprites_leave_grid(self) -> None:
+        group = DynamicGroup()
+        sprite = _make_sprite(group, 0, 0, 10, 10)
+        group.refresh_index()
+        group.empty()
+        self.assertEqual(group.collide_rect(sprite.rect), [])
+
+    def test_grid_only_keeps_occupied_cells(self) -> None:
+        group = DynamicGroup(cell_size=20)
+        sprite = _make_sprite(group, 0, 0, 10, 10)
+        for x in range(0, 1000, 20):
+            sprite.rect = pg.Rect(x, 0, 10, 10)
+            group.refresh_index()
+        self.assertEqual(len(group._rect_cells), 1)
+        sprite.kill()
+        self.assertEqual(group._rect_cells, {})
+
+
+class MobileGroupTest(unittest.TestCase):
+    def test_unindexed_group_returns_everything(self) -> None:
+        group = MobileGroup(cell_size=10)
+        sprites = [_make_mobile(group, 100 * k, 0) for k in range(3)]
+        self.assertEqual(group.neighbors(Vector2(0, 0), 5), sprites)
+
+        group.build_index()
+        _make_mobile(group, 500, 500)
+        self.assertEqual(len(group.neighbors(Vector2(0, 0), 5)), 4)
+
+    def test_neighbors_contains_all_sprites_in_radius(self) -> None:
+        rng = Random(0)
+        group = MobileGroup(cell_size=16)
+        sprites = [_make_mobile(group, rng.uniform(-100, 100),
+                                rng.uniform(-100, 100)) for _ in range(200)]
+        group.build_index()
+
+        for sprite in sprites[:50]:
+            # Move some sprites after the index is built.
+            sprite.pos += Vector2(rng.uniform(-40, 40), rng.uniform(-40, 40))
+            group.update_position(sprite)
+        sprites[-1].kill()
+
+        for probe in sprites[:100]:
+            expected = [s for s in group.sprites()
+                        if (s.pos - probe.pos).length() < 25]
+            found = group.neighbors(probe.pos, 25)
+            self.assertLess(len(found), len(group))
+            self.assertEqual(
+                [s for s in found if (s.pos - probe.pos).length() < 25],
+                expected)
+
+    def test_removed_sprites_are_not_neighbors(self) -> None:
+        group = MobileGroup(cell_size=10)
+        sprite = _make_mobile(group, 0, 0)
+        group.build_index()
+        sprite.kill()
+        self.assertEqual(group.neighbors(Vector2(0, 0), 5), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+from random import Random
+
+import numpy as np
+from pygame.math import Vector2
+
+import model
+from creatures.steering import EnemySteering
+from data.constructors import build_map_object
+from effects import FaceAndPursueTarget
+from occupancy import OccupancyGrid
+from spatial import pairs_within
+from src.test.pygame_mock import MockTimer, initialize_pygame
+from src.test.testing_utilities import make_player
+
+
+def setUpModule() -> None:
+    initialize_pygame()
+    model.initialize(SteeringTest.groups, SteeringTest.timer)
+
+
+class SteeringTest(unittest.TestCase):
+    groups = model.Groups()
+    timer = MockTimer()
+
+    def tearDown(self) -> None:
+        self.groups.empty()
+        self.timer.reset()
+
+    def test_batch_matches_scalar_pursuit(self) -> None:
+        player = make_player()
+        rng = Random(3)
+        for _ in range(80):
+            pos = Vector2(rng.uniform(-200, 200), rng.uniform(-200, 200))
+            zombie = build_map_object('zombie', pos, player)
+            zombie.motion.vel = Vector2(rng.uniform(-50, 50),
+                                        rng.uniform(-50, 50))
+        zombies = self.groups.enemies.sprites()
+
+        # Scalar pursuit from the positions before anyone moves.
+        pursue = FaceAndPursueTarget(player)
+        dt = self.timer.dt
+        expected = []
+        for zombie in zombies:
+            pursue.activate(zombie)
+            motion = zombie.motion
+            vel = motion.vel + motion.acc * dt
+            expected.append((motion.rot, Vector2(motion.acc), vel,
+                             zombie.pos + vel * dt))
+            motion.acc = Vector2(0, 0)
+
+        self.groups.enemies.build_index()
+        EnemySteering().update(self.groups.enemies, dt)
+
+        for zombie, (rot, acc, vel, pos) in zip(zombies, expected):
+            self.assertAlmostEqual(zombie.motion.rot, rot)
+            self.assertLess((zombie.motion.acc - acc).length(), 1e-6)
+            self.assertLess((zombie.motion.vel - vel).length(), 1e-6)
+            self.assertLess((zombie.pos - pos).length(), 1e-6)
+
+    def test_stepped_enemies_skip_one_update(self) -> None:
+        player = make_player()
+        zombie = build_map_object('zombie', Vector2(100, 0), player)
+        self.groups.enemies.build_index()
+        EnemySteering().update(self.groups.enemies, self.timer.dt)
+        moved_to = Vector2(zombie.pos)
+        self.assertLess(moved_to.x, 100)
+
+        zombie.update()
+        self.assertEqual(zombie.pos, moved_to)
+        zombie.update()
+        self.assertNotEqual(zombie.pos, moved_to)
+
+    def test_passive_enemies_keep_their_acceleration(self) -> None:
+        player = make_player()
+        zombie = build_map_object('zombie', Vector2(450, 0), player)
+        zombie.motion.acc = Vector2(0, 10)
+        EnemySteering().update(self.groups.enemies, self.timer.dt)
+        self.assertEqual(zombie.motion.acc, Vector2(0, 10))
+        self.assertEqual(zombie.motion.vel, Vector2(0, 1))
+
+    def test_pursuit_along_paths_shares_one_search(self) -> None:
+        player = make_player()
+        player.pos = Vector2(350, 50)
+        grid = OccupancyGrid(10, 10, (64, 64))
+        # A wall between the zombies and the player, open below row 3.
+        grid.block_area(256, 0, 64, 256)
+        for k in range(4):
+            build_map_object('hunter_zombie', Vector2(200, 40 + 60 * k),
+                             player)
+        steering = EnemySteering(grid)
+        self.groups.enemies.build_index()
+        steering.update(self.groups.enemies, self.timer.dt)
+
+        self.assertEqual(steering._fields[player].searches, 1)
+        for zombie in self.groups.enemies:
+            # Heading down toward the gap, not right into the wall.
+            aim = Vector2(steering._aims[zombie]) - zombie.pos
+            self.assertGreater(aim.y, abs(aim.x))
+            self.assertGreater(zombie.motion.vel.y, 0)
+
+    def test_pursuit_along_paths_without_grid_is_straight(self) -> None:
+        player = make_player()
+        zombie = build_map_object('hunter_zombie', Vector2(100, 0), player)
+        self.groups.enemies.build_index()
+        EnemySteering().update(self.groups.enemies, self.timer.dt)
+        self.assertLess(zombie.pos.x, 100)
+        self.assertAlmostEqual(zombie.pos.y, 0)
+
+    def test_pairs_within(self) -> None:
+        rng = np.random.RandomState(0)
+        points = rng.uniform(-100, 100, (150, 2))
+        points[1] = points[0]
+        i, j = pairs_within(points, 20)
+        found = set(zip(i.tolist(), j.tolist()))
+        expected = {(a, b) for a in range(150) for b in range(150)
+                    if 0 < np.hypot(*(points[a] - points[b])) < 20}
+        self.assertEqual(found, expected)
+        self.assertEqual(len(found), len(i))
+
+
+if __name__ == '__main__':
+    unittest.main()
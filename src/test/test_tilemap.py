@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections import namedtuple
+from typing import List
+
+import pygame as pg
+
+import map_cache
+import settings
+from test.pygame_mock import initialize_pygame
+from tilemap import MapObject, ObjectType, TiledMap, merge_wall_objects
+
+_TileObject = namedtuple('_TileObject', ('x', 'y', 'width', 'height', 'name'))
+
+
+def setUpModule() -> None:
+    initialize_pygame()
+
+
+def _wall(x: float, y: float, w: float, h: float) -> MapObject:
+    return MapObject(_TileObject(x, y, w, h, ObjectType.WALL))
+
+
+def _covered_points(objects: List[MapObject]) -> set:
+    rects = [pg.Rect(o.x, o.y, o.width, o.height) for o in objects
+             if o.type == ObjectType.WALL]
+    return {(x, y) for x in range(-10, 200, 4) for y in range(-10, 200, 4)
+            if any(r.collidepoint(x, y) for r in rects)}
+
+
+class MergeWallsTest(unittest.TestCase):
+    def test_grid_of_tiles_becomes_one_wall(self) -> None:
+        walls = [_wall(32 * i, 32 * j, 32, 32) for i in range(4)
+                 for j in range(2)]
+        merged = merge_wall_objects(walls)
+
+        self.assertEqual(len(merged), 1)
+        self.assertEqual((merged[0].x, merged[0].y), (0, 0))
+        self.assertEqual((merged[0].width, merged[0].height), (128, 64))
+        self.assertEqual(merged[0].center, pg.math.Vector2(64, 32))
+
+    def test_overlapping_and_contained_walls_merge(self) -> None:
+        walls = [_wall(0, 0, 50, 20), _wall(30, 0, 50, 20),
+                 _wall(10, 5, 10, 10)]
+        merged = merge_wall_objects(walls)
+
+        self.assertEqual(len(merged), 1)
+        self.assertEqual((merged[0].x, merged[0].width), (0, 80))
+
+    def test_l_shape_is_not_merged(self) -> None:
+        walls = [_wall(0, 0, 100, 20), _wall(0, 20, 20, 100)]
+        self.assertEqual(len(merge_wall_objects(walls)), 2)
+
+    def test_covered_area_is_unchanged(self) -> None:
+        walls = [_wall(0, 0, 40, 40), _wall(40, 0, 40, 40),
+                 _wall(80, 0, 40, 20), _wall(0, 40, 80, 40),
+                 _wall(150, 150, 20, 20), _wall(30, 100, 20, 60)]
+        merged = merge_wall_objects(walls)
+
+        self.assertLess(len(merged), len(walls))
+        self.assertEqual(_covered_points(merged), _covered_points(walls))
+
+    def test_labeled_and_fractional_walls_are_kept(self) -> None:
+        labeled = _wall(0, 0, 32, 32)
+        labeled.labels = {'door'}
+        fractional = _wall(32.5, 0, 32, 32)
+        walls = [labeled, fractional, _wall(64, 0, 32, 32)]
+
+        merged = merge_wall_objects(walls)
+        self.assertEqual(len(merged), 3)
+        self.assertIn(labeled, merged)
+        self.assertIn(fractional, merged)
+
+    def test_non_walls_keep_order(self) -> None:
+        zone = MapObject(_TileObject(0, 0, 5, 5, ObjectType.ZONE))
+        player = MapObject(_TileObject(0, 0, 5, 5, ObjectType.PLAYER))
+        merged = merge_wall_objects([zone, _wall(0, 0, 5, 5), player])
+        self.assertEqual(merged[:2], [zone, player])
+
+    def test_tiled_map_counts_walls(self) -> None:
+        tile_map = TiledMap('test_level.tmx')
+        self.assertLessEqual(tile_map.wall_count, tile_map.raw_wall_count)
+        walls = [o for o in tile_map.objects if o.type == ObjectType.WALL]
+        self.assertEqual(len(walls), tile_map.wall_count)
+
+    def test_render_area_matches_full_render(self) -> None:
+        tile_map = TiledMap('test_level.tmx')
+        full = tile_map.make_map_img()
+        area = pg.Rect(100, 30, 250, 200)
+        part = pg.Surface(area.size)
+        tile_map.render_area(part, area)
+
+        self.assertEqual(pg.image.tostring(part, 'RGB'),
+                         pg.image.tostring(full.subsurface(area), 'RGB'))
+
+
+class MapCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self._folder.cleanup)
+        self.folder = self._folder.name
+
+    def _cache(self) -> map_cache.MapCache:
+        return map_cache.MapCache(os.path.join(self.folder, 'cache'))
+
+    def _copy_map(self) -> str:
+        """Copy test_level.tmx and its tileset image, return the map file."""
+        src = os.path.dirname(os.path.dirname(__file__))
+        for folder in ('maps', 'img'):
+            os.makedirs(os.path.join(self.folder, folder))
+        tmx_file = os.path.join(self.folder, 'maps', 'test_level.tmx')
+        shutil.copy(os.path.join(src, 'maps', 'test_level.tmx'), tmx_file)
+        shutil.copy(os.path.join(src, 'img', 'spritesheet_tiles.png'),
+                    os.path.join(self.folder, 'img'))
+        return tmx_file
+
+    def test_cached_map_matches_parsed_map(self) -> None:
+        cold_cache = self._cache()
+        parsed = TiledMap('test_level.tmx', cold_cache)
+        warm_cache = self._cache()
+        cached = TiledMap('test_level.tmx', warm_cache)
+
+        self.assertEqual((cold_cache.hits, cold_cache.misses), (0, 1))
+        self.assertEqual((warm_cache.hits, warm_cache.misses), (1, 0))
+        self.assertEqual(cached.rect, parsed.rect)
+        self.assertEqual(cached.wall_count, parsed.wall_count)
+        self.assertEqual(cached.raw_wall_count, parsed.raw_wall_count)
+        self.assertEqual(
+            [(o.type, o.center, o.labels) for o in cached.objects],
+            [(o.type, o.center, o.labels) for o in parsed.objects])
+        self.assertEqual(pg.image.tostring(cached.make_map_img(), 'RGB'),
+                         pg.image.tostring(parsed.make_map_img(), 'RGB'))
+
+    def test_changed_map_or_tileset_misses(self) -> None:
+        tmx_file = self._copy_map()
+        cache = self._cache()
+        TiledMap(tmx_file, cache)
+        TiledMap(tmx_file, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        with open(tmx_file, 'a') as stream:
+            stream.write('<!-- edited -->\n')
+        TiledMap(tmx_file, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        # The entry for the old map was replaced.
+        self.assertEqual(len(os.listdir(cache.folder)), 1)
+
+        image_file = os.path.join(self.folder, 'img', 'spritesheet_tiles.png')
+        self.assertIn(os.path.abspath(image_file),
+                      map(os.path.abspath, map_cache.map_files(tmx_file)))
+        entry = cache._entry(tmx_file)
+        with open(image_file, 'ab') as stream:
+            stream.write(b'edited')
+        self.assertNotEqual(cache._entry(tmx_file), entry)
+
+    def test_corrupt_entry_is_parsed_again(self) -> None:
+        tmx_file = self._copy_map()
+        cache = self._cache()
+        TiledMap(tmx_file, cache)
+        with open(cache._entry(tmx_file), 'wb') as stream:
+            stream.write(b'not a cache entry')
+
+        tile_map = TiledMap(tmx_file, cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(tile_map.wall_count,
+                         TiledMap(tmx_file, cache).wall_count)
+        self.assertEqual(cache.hits, 1)
+
+    def test_tests_do_not_write_to_the_user_cache(self) -> None:
+        folder = map_cache.cache.folder
+        self.assertNotEqual(folder, settings.MAP_CACHE_FOLDER)
+        self.assertTrue(folder.startswith(tempfile.gettempdir()))
+
+
+if __name__ == '__main__':
+    unittest.main()
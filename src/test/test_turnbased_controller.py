@@ -1,4 +1,6 @@
 import unittest
+from unittest import mock
+
 from pygame import Rect
 from src.test.pygame_mock import initialize_pygame
 from src.test.testing_utilities import make_turnbased_controller
@@ -19,23 +21,24 @@ class TurnBasedControllerTest(unittest.TestCase):
         ctrl = make_turnbased_controller()
         ctrl.draw()
 
-        top_left = Rect(0, 0, 20, 20)
-        top_right = Rect(1000, 0, 20, 20)
-        bottom_left = Rect(0, 1000, 20, 20)
-        bottom_right = Rect(1000, 1000, 20, 20)
+        line_is_clear = ctrl._view._occupancy.line_is_clear
+        top_left = Rect(0, 0, 20, 20).center
+        top_right = Rect(1000, 0, 20, 20).center
+        bottom_left = Rect(0, 1000, 20, 20).center
+        bottom_right = Rect(1000, 1000, 20, 20).center
 
         # The test level has a wall halfway down vertically
-        self.assertFalse(ctrl._view._path_is_clear(top_left, top_right))
-        self.assertFalse(ctrl._view._path_is_clear(top_right, top_left))
+        self.assertFalse(line_is_clear(top_left, top_right))
+        self.assertFalse(line_is_clear(top_right, top_left))
 
-        self.assertTrue(ctrl._view._path_is_clear(top_right, bottom_right))
-        self.assertTrue(ctrl._view._path_is_clear(bottom_right, top_right))
+        self.assertTrue(line_is_clear(top_right, bottom_right))
+        self.assertTrue(line_is_clear(bottom_right, top_right))
 
-        self.assertTrue(ctrl._view._path_is_clear(top_left, bottom_left))
-        self.assertTrue(ctrl._view._path_is_clear(bottom_left, top_left))
+        self.assertTrue(line_is_clear(top_left, bottom_left))
+        self.assertTrue(line_is_clear(bottom_left, top_left))
 
-        self.assertTrue(ctrl._view._path_is_clear(bottom_right, bottom_left))
-        self.assertTrue(ctrl._view._path_is_clear(bottom_left, bottom_right))
+        self.assertTrue(line_is_clear(bottom_right, bottom_left))
+        self.assertTrue(line_is_clear(bottom_left, bottom_right))
 
     def test_try_move_member(self) -> None:
         ctrl = make_turnbased_controller()
@@ -49,4 +52,55 @@ class TurnBasedControllerTest(unittest.TestCase):
 
         # TODO - we should be checking if the active member moved
         # need to implement actions first
-        self.assertIsNone(ctrl._view._move_options)
\ No newline at end of file
+        self.assertIsNone(ctrl._view._move_options)
+
+    def test_move_overlay_rebuilt_only_when_active_member_changes(
+            self) -> None:
+        ctrl = make_turnbased_controller()
+        ctrl.draw()
+        overlay = ctrl._view._move_overlay
+        self.assertIsNotNone(overlay)
+
+        ctrl.draw()
+        self.assertIs(ctrl._view._move_overlay, overlay)
+
+        ctrl._view._party.next_member()
+        ctrl.draw()
+        self.assertIsNot(ctrl._view._move_overlay, overlay)
+
+    def test_move_ranges_reused_across_turns(self) -> None:
+        ctrl = make_turnbased_controller()
+        party = ctrl._view._party
+        ranges = ctrl._view._move_ranges
+        for _ in range(2 * len(party)):
+            ctrl.draw()
+            party.next_member()
+        self.assertEqual(ranges.searches, len(party))
+
+    def test_move_options_avoid_other_members(self) -> None:
+        ctrl = make_turnbased_controller()
+        ctrl.draw()
+        view = ctrl._view
+        others = [m.rect for m in view._party
+                  if m is not view._party.active_member]
+        self.assertTrue(view._move_options)
+        for rect in view._move_options:
+            self.assertNotIn(rect, others)
+
+    def test_initiative_tracker_renders_on_state_change(self) -> None:
+        ctrl = make_turnbased_controller()
+        tracker = ctrl._view._initiative_tracker
+        with mock.patch.object(tracker, '_render',
+                               wraps=tracker._render) as render:
+            ctrl.draw()
+            ctrl.draw()
+            self.assertEqual(render.call_count, 1)
+
+            ctrl._view._party.next_member()
+            ctrl.draw()
+            self.assertEqual(render.call_count, 2)
+
+            party = ctrl._view._party
+            party[0].initiative += 1
+            ctrl.draw()
+            self.assertEqual(render.call_count, 3)
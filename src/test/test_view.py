@@ -1,11 +1,16 @@
 import unittest
+from unittest import mock
 
 import pygame
 
 import mods
 import settings
+import tilemap
 from test.pygame_mock import initialize_pygame
-from view import dungeon_view
+from test.testing_utilities import make_dungeon_controller, make_item, \
+    make_player, make_zombie
+from view import draw_utils, dungeon_view, health_bars, hud, images, \
+    lighting, map_image
 
 
 def setUpModule() -> None:
@@ -63,3 +68,356 @@ class ViewTest(unittest.TestCase):
         self.view.toggle_hide_backpack()
 
         self.assertTrue(self.view.hud_collide_point((x, y)))
+
+
+class RotationCacheTest(unittest.TestCase):
+    def test_angles_are_quantized_to_step(self) -> None:
+        cache = images.RotationCache(step=5)
+        image = cache.rotated(images.PLAYER_IMG, 31)
+        self.assertIs(cache.rotated(images.PLAYER_IMG, 29), image)
+        self.assertIs(cache.rotated(images.PLAYER_IMG, 390), image)
+        self.assertEqual(len(cache), 1)
+
+    def test_angle_near_zero_returns_base_image(self) -> None:
+        cache = images.RotationCache(step=5)
+        base = images.get_image(images.PLAYER_IMG)
+        self.assertIs(cache.rotated(images.PLAYER_IMG, 1), base)
+        self.assertIs(cache.rotated(images.PLAYER_IMG, 359), base)
+
+    def test_least_recently_used_image_is_dropped(self) -> None:
+        cache = images.RotationCache(step=1, max_size=2)
+        first = cache.rotated(images.PLAYER_IMG, 10)
+        cache.rotated(images.PLAYER_IMG, 20)
+        self.assertIs(cache.rotated(images.PLAYER_IMG, 10), first)
+        cache.rotated(images.PLAYER_IMG, 30)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.rotated(images.PLAYER_IMG, 10), first)
+        self.assertNotIn((images.PLAYER_IMG, 20), cache._images)
+
+    def test_disabled_cache_rotates_exactly(self) -> None:
+        cache = images.RotationCache(step=45)
+        cache.enabled = False
+        exact = pygame.transform.rotate(
+            images.get_image(images.PLAYER_IMG), 30)
+        image = cache.rotated(images.PLAYER_IMG, 30)
+
+        self.assertEqual(image.get_size(), exact.get_size())
+        self.assertEqual(len(cache), 0)
+
+    def test_damaged_enemy_image_is_cached_rotation(self) -> None:
+        enemy = make_zombie()
+        enemy.motion.rot = 90
+        enemy.status.increment_health(-10)
+
+        cached = images.get_rotated_image(enemy.image_file, 90)
+        self.assertIs(enemy.image, cached)
+
+
+class HealthBarsTest(unittest.TestCase):
+    def test_bars_are_cached_by_quantized_fraction(self) -> None:
+        bars = health_bars.HealthBars(levels=10)
+        bar = bars.bar(40, 0.51)
+        self.assertIs(bars.bar(40, 0.49), bar)
+        self.assertEqual(bar.get_size(), (20, health_bars.BAR_HEIGHT))
+        self.assertIsNot(bars.bar(30, 0.5), bar)
+        self.assertEqual(len(bars), 2)
+
+    def test_bar_color_turns_red_as_health_runs_out(self) -> None:
+        self.assertEqual(health_bars.bar_color(0.5), settings.YELLOW)
+        self.assertEqual(health_bars.bar_color(0), settings.RED)
+
+    def test_view_draws_bar_over_damaged_enemy(self) -> None:
+        screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+        view = dungeon_view.DungeonView()
+        enemy = make_zombie()
+        enemy.pos = pygame.math.Vector2(100, 100)
+        screen.fill(settings.BLACK)
+
+        view._draw_health_bars([enemy], 0, 0)
+        top_left = enemy.image.get_rect(center=(100, 100)).topleft
+        self.assertEqual(screen.get_at(top_left)[:3], settings.BLACK)
+
+        enemy.status.increment_health(-1)
+        view._draw_health_bars([enemy], 0, 0)
+        self.assertNotEqual(screen.get_at(top_left)[:3], settings.BLACK)
+
+
+class DirtyRectsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.screen = pygame.display.set_mode(
+            (settings.WIDTH, settings.HEIGHT))
+        self.dungeon = make_dungeon_controller()._dungeon
+        self.view = dungeon_view.DungeonView()
+        # Larger than the map, so that the camera follows the player.
+        self.view.set_camera_range(4000, 4000)
+        self.zombie = make_zombie(self.dungeon.player)
+
+    def _draw(self) -> pygame.Surface:
+        self.view.draw(self.dungeon.player, self.dungeon.map)
+        return self.screen.copy()
+
+    def test_dirty_frame_matches_full_redraw(self) -> None:
+        self.view.dirty_rects = True
+        self._draw()
+        self.zombie.pos += pygame.math.Vector2(20, 10)
+        self.zombie.motion.rot = 45
+        self.zombie.status.increment_health(-5)
+        dirty = self._draw()
+        self.assertIsNotNone(self.view._updated)
+
+        self.view.dirty_rects = False
+        full = self._draw()
+        self.assertIsNone(self.view._updated)
+
+        self.assertEqual(pygame.image.tostring(dirty, 'RGB'),
+                         pygame.image.tostring(full, 'RGB'))
+
+    def test_updated_areas_cover_old_and_new_sprite_rects(self) -> None:
+        self.view.dirty_rects = True
+        self._draw()
+        old_rect = self.view._drawn[:]
+        self.zombie.kill()
+        self._draw()
+
+        for rect in old_rect:
+            self.assertIn(rect, self.view._updated)
+
+    def test_full_redraw_when_camera_moves(self) -> None:
+        self.view.dirty_rects = True
+        self._draw()
+        self.dungeon.player.pos += pygame.math.Vector2(300, 300)
+        self._draw()
+
+        self.assertIsNone(self.view._updated)
+
+
+class TextCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = draw_utils.TextCache(max_size=2)
+        self.font = images.get_font(images.ZOMBIE_FONT)
+
+    def test_fonts_are_loaded_once_per_file_and_size(self) -> None:
+        font = self.cache.font(self.font, 20)
+        self.assertIs(self.cache.font(self.font, 20), font)
+        self.assertIsNot(self.cache.font(self.font, 16), font)
+        self.assertEqual(self.cache.font_stats,
+                         draw_utils.CacheStats(1, 2, 2))
+
+    def test_rendered_text_is_reused(self) -> None:
+        surface = self.cache.render('3', self.font, 20, settings.RED)
+        self.assertIs(self.cache.render('3', self.font, 20, settings.RED),
+                      surface)
+        self.assertIsNot(self.cache.render('3', self.font, 20,
+                                           settings.WHITE), surface)
+        stats = self.cache.text_stats
+        self.assertEqual(stats, draw_utils.CacheStats(1, 2, 2))
+        self.assertAlmostEqual(stats.hit_rate, 1 / 3)
+
+    def test_least_recently_used_text_is_dropped(self) -> None:
+        first = self.cache.render('1', self.font, 20, settings.RED)
+        self.cache.render('2', self.font, 20, settings.RED)
+        self.cache.render('1', self.font, 20, settings.RED)
+        self.cache.render('3', self.font, 20, settings.RED)
+
+        self.assertIs(self.cache.render('1', self.font, 20, settings.RED),
+                      first)
+        self.assertEqual(self.cache.text_stats.size, 2)
+        self.cache.render('2', self.font, 20, settings.RED)
+        self.assertEqual(self.cache.text_stats.misses, 4)
+
+
+class RetainedHUDTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.screen = pygame.display.set_mode(
+            (settings.WIDTH, settings.HEIGHT))
+        self.hud = hud.HUD()
+        self.player = make_player()
+        self.player.inventory.attempt_pickup(make_item('pistol'))
+        self.player.inventory.attempt_pickup(make_item('healthpack'))
+
+    def _draw(self) -> bytes:
+        self.screen.fill(settings.BLACK)
+        self.hud.draw(self.player)
+        return pygame.image.tostring(self.screen, 'RGB')
+
+    def test_idle_frames_do_not_render(self) -> None:
+        first = self._draw()
+        renders = self.hud.renders_per_second
+        self.assertEqual(self._draw(), first)
+        self.assertEqual(self.hud.renders_per_second, renders)
+
+    def test_state_changes_render(self) -> None:
+        changes = [lambda: self.player.status.increment_health(-30),
+                   lambda: self.player.energy_source.expend_energy(40),
+                   self.hud.toggle_hide_backpack,
+                   lambda: setattr(self.hud, 'selected_item', 0)]
+        frame = self._draw()
+        for change in changes:
+            change()
+            renders = self.hud.renders_per_second
+            new_frame = self._draw()
+            self.assertEqual(self.hud.renders_per_second, renders + 1)
+            self.assertNotEqual(new_frame, frame)
+            frame = new_frame
+
+    def test_canvas_matches_drawing_directly(self) -> None:
+        self.hud.toggle_hide_backpack()
+        self.player.status.increment_health(-30)
+        retained = self._draw()
+
+        self.screen.fill(settings.BLACK)
+        self.hud._canvas = self.screen
+        self.hud._render(self.player)
+        direct = pygame.image.tostring(self.screen, 'RGB')
+        self.assertEqual(retained, direct)
+
+
+class LightingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.screen = pygame.display.set_mode(
+            (settings.WIDTH, settings.HEIGHT))
+        self.screen.fill(settings.WHITE)
+
+    def test_single_light_matches_mask_on_fog(self) -> None:
+        lighting.Lighting().render(self.screen, (-100, -50),
+                                   [((400, 300), 175)])
+        lit = pygame.image.tostring(self.screen, 'RGB')
+
+        self.screen.fill(settings.WHITE)
+        fog = pygame.Surface((settings.WIDTH, settings.HEIGHT))
+        fog.fill(settings.NIGHT_COLOR)
+        mask = images.get_image(images.LIGHT_MASK)
+        fog.blit(mask, mask.get_rect(center=(300, 250)))
+        self.screen.blit(fog, (0, 0), special_flags=pygame.BLEND_MULT)
+        self.assertEqual(lit, pygame.image.tostring(self.screen, 'RGB'))
+
+    def test_overlapping_lights_take_brighter_value(self) -> None:
+        lights = lighting.Lighting()
+        lights.render(self.screen, (0, 0), [((400, 300), 100)])
+        alone = self.screen.get_at((400, 300))
+
+        self.screen.fill(settings.WHITE)
+        lights.render(self.screen, (0, 0),
+                      [((400, 300), 100), ((450, 300), 100)])
+        self.assertEqual(self.screen.get_at((400, 300)), alone)
+        self.assertGreater(self.screen.get_at((430, 300))[0],
+                           settings.NIGHT_COLOR[0])
+
+    def test_static_lights_are_baked_once_per_chunk(self) -> None:
+        lights = lighting.Lighting([((1000, 1000), 100)], chunk_size=256)
+        with mock.patch.object(pygame.transform, 'smoothscale',
+                               wraps=pygame.transform.smoothscale) as scale:
+            lights.render(self.screen, (-700, -700), [])
+            self.screen.fill(settings.WHITE)
+            lights.render(self.screen, (-700, -700), [])
+            self.assertEqual(scale.call_count, 1)
+        self.assertEqual(len(lights._chunks), 4 * 4)
+        self.assertGreater(self.screen.get_at((300, 300))[0],
+                           settings.NIGHT_COLOR[0])
+        self.assertEqual(self.screen.get_at((10, 10))[:3],
+                         settings.NIGHT_COLOR)
+
+    def test_map_lights_come_from_light_objects(self) -> None:
+        light = mock.Mock(type=tilemap.ObjectType.LIGHT, width=200,
+                          center=pygame.math.Vector2(50, 60))
+        wall = mock.Mock(type=tilemap.ObjectType.WALL)
+        tile_map = mock.Mock(objects=[wall, light])
+
+        self.assertEqual(lighting.map_lights(tile_map), [((50, 60), 100)])
+
+
+class MapImageTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tile_map = tilemap.TiledMap('farzomboz.tmx')
+        cls.full_image = cls.tile_map.make_map_img()
+
+    def setUp(self) -> None:
+        self.screen = pygame.display.set_mode(
+            (settings.WIDTH, settings.HEIGHT))
+        self.screen.fill(settings.WHITE)
+
+    def _full_image_at(self, offset: tuple) -> bytes:
+        expected = pygame.Surface(self.screen.get_size())
+        expected.fill(settings.WHITE)
+        expected.blit(self.full_image, offset)
+        return pygame.image.tostring(expected, 'RGB')
+
+    def test_chunks_match_full_map_image(self) -> None:
+        image = map_image.MapImage(self.tile_map, chunk_size=300)
+        for offset in ((0, 0), (-700, -333), (-2400, -1320)):
+            self.screen.fill(settings.WHITE)
+            image.draw(self.screen, offset)
+            self.assertEqual(pygame.image.tostring(self.screen, 'RGB'),
+                             self._full_image_at(offset))
+
+    def test_only_chunks_near_screen_are_rendered(self) -> None:
+        image = map_image.MapImage(self.tile_map)
+        image.draw(self.screen, (0, 0))
+        # 2x2 chunks on screen and one prefetched.
+        self.assertEqual(image.renders, 5)
+        image.draw(self.screen, (0, 0))
+        self.assertEqual(image.renders, 6)
+
+    def test_chunks_are_evicted_least_recently_used_first(self) -> None:
+        image = map_image.MapImage(self.tile_map, max_chunks=8)
+        image.draw(self.screen, (0, 0))
+        image.draw(self.screen, (-2400, -1320))
+        self.assertEqual(len(image), 8)
+
+        renders = image.renders
+        image.draw(self.screen, (-2400, -1320))
+        self.assertEqual(image.renders, renders)
+        image.draw(self.screen, (0, 0))
+        self.assertGreater(image.renders, renders)
+
+    def test_restore_draws_only_given_rects(self) -> None:
+        image = map_image.MapImage(self.tile_map)
+        offset = (-100, -200)
+        image.restore(self.screen, offset, [pygame.Rect(50, 60, 30, 40)])
+
+        expected = self.full_image.get_at((150, 260))
+        self.assertEqual(self.screen.get_at((50, 60)), expected)
+        self.assertEqual(self.screen.get_at((49, 60)), settings.WHITE)
+        self.assertEqual(self.screen.get_at((80, 60)), settings.WHITE)
+
+
+class CullingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+        self.view = dungeon_view.DungeonView()
+        self.view.groups.empty()
+        self.view.set_camera_range(4000, 4000)
+        self.player = make_player()
+        self.player.pos = pygame.math.Vector2(1000, 1000)
+        self.near = make_zombie(self.player)
+        self.far = make_zombie(self.player)
+        self.far.pos = pygame.math.Vector2(3000, 3000)
+
+    def test_off_screen_sprites_do_not_build_images(self) -> None:
+        self.view.camera.update(self.player)
+        offset = self.view.camera.rect.topleft
+        for build_index in (False, True):
+            if build_index:
+                self.player.groups.enemies.build_index()
+            with mock.patch.object(type(self.far), 'image',
+                                   new_callable=mock.PropertyMock,
+                                   return_value=self.near.image) as image:
+                visible = self.view._visible_sprites(self.player, *offset)
+                for sprite in visible:
+                    self.view._draw_sprite(sprite, *offset)
+
+            self.assertIn(self.near, visible)
+            self.assertIn(self.player, visible)
+            self.assertNotIn(self.far, visible)
+            self.assertEqual(image.call_count, 1)
+
+    def test_debug_overlay_counts_visible_sprites(self) -> None:
+        self.view.toggle_debug()
+        tile_map = mock.Mock(img=pygame.Surface((10, 10)),
+                             rect=pygame.Rect(0, 0, 10, 10))
+        self.view.draw(self.player, tile_map)
+
+        self.assertEqual(self.view._visible_count, 2)
+        self.assertEqual(len(self.view.groups.all_sprites), 3)
@@ -1,10 +1,14 @@
+from collections import namedtuple
 from enum import unique, Enum
 from os import path
-from typing import Any, List, Set
+from types import SimpleNamespace
+from typing import Any, Dict, List, Set, Tuple, Union
 
+import numpy as np
 import pygame as pg
 import pytmx
 
+import map_cache
 from data.input_output import is_npc_type, is_item_type
 
 CONFLICT = 'conflict'
@@ -17,6 +21,7 @@ class ObjectType(Enum):
     WALL = 'wall'
     WAYPOINT = 'waypoint'
     ZONE = 'zone'
+    LIGHT = 'light'
 
 
 class MapObject(object):
@@ -38,54 +43,214 @@ class MapObject(object):
             self.labels: Set[str] = set()
 
 
+# Stand-in for a pytmx object, used to build MapObjects for merged walls.
+_WallTileObject = namedtuple('_WallTileObject',
+                             ('x', 'y', 'width', 'height', 'name'))
+
+_Bounds = Tuple[float, float, float, float]
+
+
+def _is_mergeable_wall(obj: MapObject) -> bool:
+    # Labeled walls are referenced by quests and must remain separate.
+    # Fractional walls are skipped because pg.Rect truncates coordinates,
+    # so merging them could change the covered pixels.
+    if obj.type != ObjectType.WALL or obj.labels:
+        return False
+    return all(float(v).is_integer()
+               for v in (obj.x, obj.y, obj.width, obj.height))
+
+
+def _merge_bounds(a: _Bounds, b: _Bounds) -> Union[_Bounds, None]:
+    """The bounds of the union of a and b, if that union is a rectangle."""
+    a_left, a_top, a_right, a_bottom = a
+    b_left, b_top, b_right, b_bottom = b
+    if (a_left <= b_left and a_top <= b_top and b_right <= a_right and
+            b_bottom <= a_bottom):
+        return a
+    if (b_left <= a_left and b_top <= a_top and a_right <= b_right and
+            a_bottom <= b_bottom):
+        return b
+    if a_left == b_left and a_right == b_right and \
+            a_top <= b_bottom and b_top <= a_bottom:
+        return a_left, min(a_top, b_top), a_right, max(a_bottom, b_bottom)
+    if a_top == b_top and a_bottom == b_bottom and \
+            a_left <= b_right and b_left <= a_right:
+        return min(a_left, b_left), a_top, max(a_right, b_right), a_bottom
+    return None
+
+
+def merge_wall_objects(objects: List[MapObject]) -> List[MapObject]:
+    """Merge touching or overlapping walls whose union is a rectangle.
+
+    The area covered by walls is unchanged, only the number of wall objects
+    is reduced. Non-wall objects are returned first, in their original order.
+    """
+    walls = [obj for obj in objects if _is_mergeable_wall(obj)]
+    others = [obj for obj in objects if not _is_mergeable_wall(obj)]
+
+    bounds = [(w.x, w.y, w.x + w.width, w.y + w.height) for w in walls]
+    # Growing a wall can make it mergeable with walls already compared
+    # against, so sweep until nothing changes.
+    merged_any = True
+    while merged_any:
+        merged_any = False
+        i = 0
+        while i < len(bounds):
+            j = i + 1
+            while j < len(bounds):
+                union = _merge_bounds(bounds[i], bounds[j])
+                if union is None:
+                    j += 1
+                    continue
+                bounds[i] = union
+                del bounds[j]
+                merged_any = True
+            i += 1
+
+    merged = [MapObject(_WallTileObject(left, top, right - left,
+                                        bottom - top, ObjectType.WALL))
+              for left, top, right, bottom in bounds]
+    return others + merged
+
+
 class TiledMap:
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str,
+                 cache: map_cache.MapCache = None) -> None:
         game_folder = path.dirname(__file__)
         map_folder = path.join(game_folder, 'maps')
         full_path = path.join(map_folder, filename)
-        tm = pytmx.load_pygame(full_path, pixelalpha=True)
-
-        self.width = tm.width * tm.tilewidth
-        self.height = tm.height * tm.tileheight
-        self.tmxdata = tm
-
-        self._validate_tmxdata()
-        self._format_tileobject_names()
-        self.img = self.make_map_img()
-        self.rect = self.img.get_rect()
-        self.objects: List[MapObject] = \
-            list(map(MapObject, self.tmxdata.objects))
-
-    def _format_tileobject_names(self) -> None:
-        for tile_object in self.tmxdata.objects:
-            try:
-                # Eventually we will not need the ObjectType Enum
-                tile_object.name = ObjectType(tile_object.name)
-            except ValueError:
-                pass
-
-    def _validate_tmxdata(self) -> None:
-        expected_names = {tile.value for tile in ObjectType}
-        names = {obj.name for obj in self.tmxdata.objects}
-        bad_names = names - expected_names
-        # TODO(dvirk): make is_gameobject_type function
-        bad_names = {nm for nm in bad_names if not is_npc_type(nm)}
-        bad_names = {nm for nm in bad_names if not is_item_type(nm)}
-        if bad_names:
-            raise ValueError(
-                'Tile names %s not recognized.' % (list(bad_names)))
+        if cache is None:
+            cache = map_cache.cache
+        data = cache.load(full_path)
+        if data is None:
+            data = _parse_map(full_path)
+            cache.save(full_path, data)
+
+        self.width = data.width * data.tile_width
+        self.height = data.height * data.tile_height
+        self.tile_size = data.tile_width, data.tile_height
+        self._layers = [layer.tolist() for layer in data.layers]
+        self._tiles = data.tiles
+        # Cells, indexed by row and column, holding a tile flagged as a wall
+        # in any layer.
+        self.wall_tile_mask = np.zeros((data.height, data.width), dtype=bool)
+        for layer in data.layers:
+            self.wall_tile_mask |= np.isin(layer, data.wall_tiles)
+
+        tile_objects = [SimpleNamespace(**obj) for obj in data.objects]
+        _validate_names(tile_objects)
+        _format_tileobject_names(tile_objects)
+        # The map image is rendered on demand by render_area.
+        self._overhang = self._tile_overhang()
+        self.rect = pg.Rect(0, 0, self.width, self.height)
+        objects = list(map(MapObject, tile_objects))
+        self.raw_wall_count = _count_walls(objects)
+        self.objects: List[MapObject] = merge_wall_objects(objects)
+        self.wall_count = _count_walls(self.objects)
 
     def render(self, surface: pg.Surface) -> None:
-        ti = self.tmxdata.get_tile_image_by_gid
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, gid, in layer:
-                    tile = ti(gid)
+        self.render_area(surface, self.rect)
+
+    def render_area(self, surface: pg.Surface, area: pg.Rect) -> None:
+        """Draw the part of the map inside area, with the top left of area
+        at the top left of surface."""
+        tile_width, tile_height = self.tile_size
+        # Tile images larger than a tile reach right and down into the
+        # area from tiles above and left of it.
+        reach_x, reach_y = self._overhang
+        first_x = max(0, (area.left - reach_x) // tile_width)
+        first_y = max(0, (area.top - reach_y) // tile_height)
+        stop_x = min(self.width // tile_width,
+                     (area.right - 1) // tile_width + 1)
+        stop_y = min(self.height // tile_height,
+                     (area.bottom - 1) // tile_height + 1)
+
+        tiles = self._tiles
+        blits = []
+        for layer in self._layers:
+            for y in range(first_y, stop_y):
+                row = layer[y]
+                top = y * tile_height - area.top
+                for x in range(first_x, stop_x):
+                    tile = tiles[row[x]]
                     if tile:
-                        surface.blit(tile, (x * self.tmxdata.tilewidth,
-                                            y * self.tmxdata.tileheight))
+                        blits.append(
+                            (tile, (x * tile_width - area.left, top)))
+        surface.blits(blits, doreturn=False)
+
+    def _tile_overhang(self) -> Tuple[int, int]:
+        sizes = [tile.get_size() for tile in self._tiles if tile]
+        width = max([w for w, _ in sizes], default=0)
+        height = max([h for _, h in sizes], default=0)
+        tile_width, tile_height = self.tile_size
+        return max(0, width - tile_width), max(0, height - tile_height)
 
     def make_map_img(self) -> pg.Surface:
         temp_surface = pg.Surface((self.width, self.height))
         self.render(temp_surface)
         return temp_surface
+
+
+def _parse_map(tmx_file: str) -> map_cache.MapData:
+    tm = pytmx.load_pygame(tmx_file, pixelalpha=True)
+    objects = []
+    for tile_object in tm.objects:
+        obj = {'x': tile_object.x, 'y': tile_object.y,
+               'width': tile_object.width, 'height': tile_object.height,
+               'name': tile_object.name}
+        if hasattr(tile_object, 'labels'):
+            obj['labels'] = getattr(tile_object, 'labels')
+        objects.append(obj)
+
+    # Layers refer to the tiles they use by their index in tiles.
+    tiles: List[Union[pg.Surface, None]] = [None]
+    wall_tiles: List[int] = []
+    indices = {0: 0}
+    grids = []
+    for layer in tm.visible_layers:
+        if isinstance(layer, pytmx.TiledTileLayer):
+            for gid in {gid for row in layer.data for gid in row}:
+                if gid not in indices:
+                    tile = tm.get_tile_image_by_gid(gid)
+                    indices[gid] = len(tiles) if tile else 0
+                    if tile:
+                        if _is_wall_tile(tm.get_tile_properties_by_gid(gid)):
+                            wall_tiles.append(len(tiles))
+                        tiles.append(tile)
+            grids.append([[indices[gid] for gid in row] for row in layer.data])
+    dtype = np.min_scalar_type(len(tiles))
+    layers = [np.array(grid, dtype=dtype) for grid in grids]
+    return map_cache.MapData(tm.width, tm.height, tm.tilewidth,
+                             tm.tileheight, objects, layers, tiles,
+                             wall_tiles)
+
+
+def _is_wall_tile(properties: Union[Dict[str, Any], None]) -> bool:
+    """Whether a tile has a true 'wall' property, typed or not."""
+    value = (properties or {}).get('wall', False)
+    return str(value).lower() in ('true', '1')
+
+
+def _validate_names(tile_objects: List[Any]) -> None:
+    expected_names = {tile.value for tile in ObjectType}
+    names = {obj.name for obj in tile_objects}
+    bad_names = names - expected_names
+    # TODO(dvirk): make is_gameobject_type function
+    bad_names = {nm for nm in bad_names if not is_npc_type(nm)}
+    bad_names = {nm for nm in bad_names if not is_item_type(nm)}
+    if bad_names:
+        raise ValueError(
+            'Tile names %s not recognized.' % (list(bad_names)))
+
+
+def _format_tileobject_names(tile_objects: List[Any]) -> None:
+    for tile_object in tile_objects:
+        try:
+            # Eventually we will not need the ObjectType Enum
+            tile_object.name = ObjectType(tile_object.name)
+        except ValueError:
+            pass
+
+
+def _count_walls(objects: List[MapObject]) -> int:
+    return sum(1 for obj in objects if obj.type == ObjectType.WALL)
@@ -22,4 +22,4 @@ class Camera:
         y = min(0, y)  # top
         x = max(-(self.rect.width - WIDTH), x)  # right
         y = max(-(self.rect.height - HEIGHT), y)  # bottom
-        self.rect = pg.Rect(x, y, self.rect.width, self.rect.height)
+        self.rect.topleft = x, y
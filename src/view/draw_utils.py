@@ -1,10 +1,84 @@
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Tuple
+
 import pygame as pg
 
+# Rendered text surfaces kept for reuse, least recently used dropped first.
+TEXT_CACHE_SIZE = 256
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TextCache(object):
+    """Loaded fonts keyed by (file, size), and rendered text in an LRU.
+
+    Rendered surfaces are shared, so callers must not draw on them.
+    """
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._fonts: Dict[Tuple[str, int], pg.font.Font] = {}
+        self._surfaces: OrderedDict = OrderedDict()
+        self._font_hits = 0
+        self._text_hits = 0
+        self._text_misses = 0
+
+    def font(self, font_name: str, size: int) -> pg.font.Font:
+        key = (font_name, size)
+        if key in self._fonts:
+            self._font_hits += 1
+        else:
+            self._fonts[key] = pg.font.Font(font_name, size)
+        return self._fonts[key]
+
+    def render(self, text: str, font_name: str, size: int, color: tuple,
+               antialias: bool = True) -> pg.Surface:
+        key = (text, font_name, size, tuple(color), antialias)
+        surfaces = self._surfaces
+        if key in surfaces:
+            self._text_hits += 1
+            surfaces.move_to_end(key)
+            return surfaces[key]
+        self._text_misses += 1
+        font = self.font(font_name, size)
+        surface = font.render(text, antialias, color)
+        surfaces[key] = surface
+        if len(surfaces) > self.max_size:
+            surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._fonts.clear()
+        self._surfaces.clear()
+        self._font_hits = 0
+        self._text_hits = 0
+        self._text_misses = 0
+
+    @property
+    def font_stats(self) -> CacheStats:
+        return CacheStats(self._font_hits, len(self._fonts), len(self._fonts))
+
+    @property
+    def text_stats(self) -> CacheStats:
+        return CacheStats(self._text_hits, self._text_misses,
+                          len(self._surfaces))
+
+
+text_cache = TextCache()
+
 
 def draw_text(screen: pg.Surface, text: str, font_name: str,
               size: int, color: tuple, x: int, y: int,
-              align: str = "topleft") -> None:
-    fnt = pg.font.Font(font_name, size)
-    text_surface = fnt.render(text, True, color)
+              align: str = "topleft", antialias: bool = True) -> pg.Rect:
+    text_surface = text_cache.render(text, font_name, size, color, antialias)
     text_rect = text_surface.get_rect(**{align: (x, y)})
-    screen.blit(text_surface, text_rect)
+    return screen.blit(text_surface, text_rect)
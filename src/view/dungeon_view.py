@@ -1,22 +1,28 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import pygame as pg
-from pygame.math import Vector2
 from pygame.rect import Rect
 from pygame.sprite import Sprite
 
 import model
 import mods
 import settings
+from creatures.enemies import Enemy
 from creatures.players import Player
 from view.screen import ScreenAccess
 from tilemap import TiledMap
 from view import draw_utils
 from view import images
 from view.camera import Camera
+from view.health_bars import HealthBars
 from view.hud import HUD
+from view.lighting import Lighting, map_lights
+from view.map_image import MapImage
 
 NO_SELECTION = -1
+# Sprites whose position is this far off screen may still show part of
+# their image.
+CULL_MARGIN = 128
 
 
 class DungeonView(model.GroupsAccess, ScreenAccess):
@@ -34,56 +40,162 @@ class DungeonView(model.GroupsAccess, ScreenAccess):
         self._night = False
         self.draw_teleport_text = False
 
-        self._fog = pg.Surface((settings.WIDTH, settings.HEIGHT))
-        self._fog.fill(settings.NIGHT_COLOR)
+        # Image of the map being drawn.
+        self._map_image: MapImage = None
 
-        # lighting effect for night mode
-        self._light_mask = images.get_image(images.LIGHT_MASK)
-        self._light_rect = self._light_mask.get_rect()
+        # Lighting for night mode, built for the map being drawn.
+        self._lighting: Lighting = None
+        self._lit_map: TiledMap = None
 
         self.title_font = images.get_font(images.ZOMBIE_FONT)
 
+        # Reused by _draw_sprite, which runs for every sprite every frame.
+        self._sprite_rect = Rect(0, 0, 0, 0)
+        self._screen_rect = self.screen.get_rect()
+        self._health_bars = HealthBars()
+
+        # Area of the map whose sprites are drawn, see _visible_sprites.
+        self._view_rect = Rect(0, 0, settings.WIDTH + 2 * CULL_MARGIN,
+                               settings.HEIGHT + 2 * CULL_MARGIN)
+        self._visible_enemies: List[Enemy] = []
+        self._visible_count = 0
+
+        # Dirty rect rendering, see draw.
+        self.dirty_rects = False
+        self._drawn: List[Rect] = []
+        self._updated: Union[List[Rect], None] = None
+        self._last_offset: Union[Tuple[int, int], None] = None
+        self._last_map: Union[TiledMap, None] = None
+
     def set_camera_range(self, width: int, height: int) -> None:
         x, y = self.camera.rect.x, self.camera.rect.y
         self.camera.rect = Rect(x, y, width, height)
 
     def draw(self, player: Player, tile_map: TiledMap) -> None:
+        """Draw the dungeon to the screen.
 
+        In dirty rect mode, while the camera stays put, only the screen
+        areas drawn in the last frame are restored from the map image before
+        drawing over them. update_display then only updates those areas and
+        the ones drawn now. Night and debug modes always redraw everything.
+        """
         self.camera.update(player)
+        offset_x, offset_y = self.camera.rect.topleft
+
+        previous = self._drawn
+        self._drawn = []
+        full_redraw = (not self.dirty_rects or self._night or
+                       self._draw_debug or tile_map is not self._last_map or
+                       (offset_x, offset_y) != self._last_offset)
+        self._last_offset = offset_x, offset_y
+        self._last_map = tile_map
+
+        if self._map_image is None or self._map_image.tile_map is not tile_map:
+            self._map_image = MapImage(tile_map)
+        if full_redraw:
+            self._map_image.draw(self.screen, (offset_x, offset_y))
+            self._updated = None
+        else:
+            self._map_image.restore(self.screen, (offset_x, offset_y),
+                                    previous)
+            self._updated = previous
 
-        self.screen.blit(tile_map.img, self.camera.get_shifted_rect(tile_map))
-
-        for sprite in self.groups.all_sprites:
-            self._draw_sprite(sprite)
+        self._screen_rect = self.screen.get_rect()
+        visible = self._visible_sprites(player, offset_x, offset_y)
+        self._visible_count = len(visible)
+        for sprite in visible:
+            self._draw_sprite(sprite, offset_x, offset_y)
+        self._draw_health_bars(self._visible_enemies, offset_x, offset_y)
 
         if self._draw_debug:
             self._draw_debug_rects()
 
         if self._night:
-            self.render_fog(player)
+            self.render_fog(tile_map)
 
         if self.draw_teleport_text:
             self._draw_teleport_text()
 
         # draw hud on top of everything
         self._hud.draw(player)
+        self._drawn += self._hud.bounds
 
-    def _draw_sprite(self, sprite: Sprite) -> None:
-        image = sprite.image
-        rect = image.get_rect().copy()
-        new_center = Vector2(sprite.pos)
-        new_center.x += self.camera.rect.topleft[0]
-        new_center.y += self.camera.rect.topleft[1]
-        rect.center = new_center
+        if self._draw_debug:
+            self._draw_debug_text()
+
+        if self._updated is not None:
+            self._updated += self._drawn
 
-        if self._rect_on_screen(rect):
-            self.screen.blit(image, rect)
+    def update_display(self) -> None:
+        """Show the last drawn frame, updating as little as possible."""
+        if self._updated is None:
+            pg.display.flip()
+        else:
+            pg.display.update(self._updated)
+
+    def toggle_dirty_rects(self) -> None:
+        self.dirty_rects = not self.dirty_rects
+
+    def _visible_sprites(self, player: Player, offset_x: int,
+                         offset_y: int) -> List[Sprite]:
+        """Sprites near enough the screen to show, in drawing order.
+
+        Sprites are picked by position, from the indexes the enemy and
+        projectile groups keep, so off-screen sprites never build their
+        image. Items are drawn first, then the player, enemies,
+        projectiles and effects.
+        """
+        view = self._view_rect
+        view.topleft = -offset_x - CULL_MARGIN, -offset_y - CULL_MARGIN
+        groups = self.groups
+        self._visible_enemies = groups.enemies.in_rect(view)
+
+        visible = [item for item in groups.items
+                   if view.collidepoint(item.pos)]
+        if view.collidepoint(player.pos):
+            visible.append(player)
+        visible += self._visible_enemies
+        visible += groups.bullets.in_rect(view)
+        visible += groups.enemy_projectiles.in_rect(view)
+        visible += [effect for effect in groups.effects
+                    if view.collidepoint(effect.pos)]
+        return visible
+
+    def _draw_sprite(self, sprite: Sprite, offset_x: int,
+                     offset_y: int) -> None:
+        image = sprite.image
+        rect = self._sprite_rect
+        rect.size = image.get_size()
+        pos = sprite.pos
+        rect.centerx = pos.x + offset_x
+        rect.centery = pos.y + offset_y
+
+        if self._screen_rect.colliderect(rect):
+            self._drawn.append(self.screen.blit(image, rect))
+
+    def _draw_health_bars(self, enemies: List[Enemy], offset_x: int,
+                          offset_y: int) -> None:
+        """Draw a bar at the top left of each damaged enemy's image."""
+        rect = self._sprite_rect
+        for enemy in enemies:
+            if not enemy.status.damaged:
+                continue
+            rect.size = enemy.image.get_size()
+            pos = enemy.pos
+            rect.centerx = pos.x + offset_x
+            rect.centery = pos.y + offset_y
+            if not self._screen_rect.colliderect(rect):
+                continue
+            full_width = images.get_image(enemy.image_file).get_width()
+            bar = self._health_bars.bar(full_width, enemy.health_fraction)
+            self._drawn.append(self.screen.blit(bar, rect))
 
     def _draw_teleport_text(self) -> None:
 
         font = images.get_font(images.ZOMBIE_FONT)
-        draw_utils.draw_text(self.screen, 'Press T to continue', font,
-                             16, settings.GREEN, 16, 8)
+        self._drawn.append(draw_utils.draw_text(
+            self.screen, 'Press T to continue', font, 16, settings.GREEN, 16,
+            8))
 
     def _rect_on_screen(self, rect: Rect) -> bool:
         return self.screen.get_rect().colliderect(rect)
@@ -103,12 +215,25 @@ class DungeonView(model.GroupsAccess, ScreenAccess):
             if self._rect_on_screen(shifted_rect):
                 pg.draw.rect(self.screen, settings.CYAN, shifted_rect, 1)
 
-    def render_fog(self, player: Player) -> None:
-        # draw the light mask (gradient) onto fog image
-        self._fog.fill(settings.NIGHT_COLOR)
-        self._light_rect.center = self.camera.get_shifted_rect(player).center
-        self._fog.blit(self._light_mask, self._light_rect)
-        self.screen.blit(self._fog, (0, 0), special_flags=pg.BLEND_MULT)
+    def _draw_debug_text(self) -> None:
+        font = images.get_font(images.ZOMBIE_FONT)
+        lines = ['HUD renders/s: %d' % (self._hud.renders_per_second,),
+                 'Sprites drawn: %d/%d' % (self._visible_count,
+                                           len(self.groups.all_sprites))]
+        for row, line in enumerate(lines):
+            draw_utils.draw_text(self.screen, line, font, 16, settings.CYAN,
+                                 16, 32 + 20 * row)
+
+    def render_fog(self, tile_map: TiledMap) -> None:
+        """Darken the screen, except around the map's lights and around
+        sprites with a light_radius."""
+        if self._lit_map is not tile_map:
+            self._lighting = Lighting(map_lights(tile_map))
+            self._lit_map = tile_map
+        lights = [(sprite.rect.center, sprite.light_radius)
+                  for sprite in self.groups.all_sprites
+                  if sprite.light_radius]
+        self._lighting.render(self.screen, self.camera.rect.topleft, lights)
 
     def toggle_debug(self) -> None:
         self._draw_debug = not self._draw_debug
@@ -0,0 +1,45 @@
+"""Health bar surfaces drawn over damaged enemies."""
+from typing import Dict, Tuple
+
+import pygame as pg
+from pygame.math import Vector3
+
+import settings
+
+BAR_HEIGHT = 7
+# Health fractions are rounded to multiples of 1 / BAR_LEVELS.
+BAR_LEVELS = 32
+
+
+def bar_color(health_fraction: float) -> tuple:
+    if health_fraction > 0.5:
+        frac = 2 * (1 - health_fraction)
+        vec = Vector3(settings.GREEN) * frac
+        vec += Vector3(settings.YELLOW) * (1 - frac)
+    else:
+        frac = 2 * health_fraction
+        vec = Vector3(settings.YELLOW) * frac
+        vec += Vector3(settings.RED) * (1 - frac)
+    return tuple(vec)
+
+
+class HealthBars(object):
+    """Builds each health bar once per full width and health level."""
+
+    def __init__(self, levels: int = BAR_LEVELS) -> None:
+        self.levels = levels
+        self._bars: Dict[Tuple[int, int], pg.Surface] = {}
+
+    def bar(self, full_width: int, health_fraction: float) -> pg.Surface:
+        level = round(health_fraction * self.levels)
+        key = (full_width, level)
+        if key not in self._bars:
+            fraction = level / self.levels
+            width = int(full_width * fraction)
+            bar = pg.Surface((width, BAR_HEIGHT))
+            bar.fill(bar_color(fraction))
+            self._bars[key] = bar
+        return self._bars[key]
+
+    def __len__(self) -> int:
+        return len(self._bars)
@@ -1,4 +1,5 @@
-from typing import List, Dict, Tuple
+from collections import deque
+from typing import Any, Deque, List, Dict, Tuple, Union
 
 import pygame as pg
 
@@ -10,9 +11,19 @@ from view.draw_utils import draw_text
 from view.screen import ScreenAccess
 
 NO_SELECTION = -1
+# Room around the HUD for labels drawn centered on its edges.
+_TEXT_MARGIN = 20
+# Cooldown fractions are rounded to multiples of 1 / COOLDOWN_LEVELS.
+COOLDOWN_LEVELS = 50
 
 
 class HUD(ScreenAccess):
+    """The bars, mods and backpack drawn over the dungeon.
+
+    The HUD is rendered onto a transparent canvas, which is rendered again
+    only when the state it shows changes. Other frames blit the canvas.
+    """
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -39,12 +50,65 @@ class HUD(ScreenAccess):
         self.selected_item = NO_SELECTION
         self._backpack_hidden = True
 
+        self._bounds = self._generate_bounds()
+        self._backpack_bounds = self._generate_backpack_bounds()
+
+        self._canvas = pg.Surface(self.screen.get_size(), pg.SRCALPHA)
+        self._state: Union[Tuple, None] = None
+        # Times at which the canvas was rendered in the last second.
+        self._render_ticks: Deque[int] = deque()
+
+    @property
+    def bounds(self) -> List[pg.Rect]:
+        """Screen areas that draw may change."""
+        if self._backpack_hidden:
+            return [self._bounds]
+        return [self._bounds, self._backpack_bounds]
+
     def draw(self, player: Player) -> None:
+        state = self._displayed_state(player)
+        if state != self._state:
+            self._state = state
+            self._render(player)
+        for rect in self.bounds:
+            self.screen.blit(self._canvas, rect, rect)
+
+    @property
+    def renders_per_second(self) -> int:
+        self._forget_old_renders()
+        return len(self._render_ticks)
+
+    def _render(self, player: Player) -> None:
+        self._canvas.fill((0, 0, 0, 0))
         self._draw_hud_base()
         self._draw_bar(player, 'health')
         self._draw_bar(player, 'energy')
         self._draw_mods(player)
         self._draw_backpack(player)
+        self._render_ticks.append(pg.time.get_ticks())
+        self._forget_old_renders()
+
+    def _forget_old_renders(self) -> None:
+        ticks = self._render_ticks
+        now = pg.time.get_ticks()
+        while ticks and now - ticks[0] >= 1000:
+            ticks.popleft()
+
+    def _displayed_state(self, player: Player) -> Tuple:
+        """Everything draw shows. The canvas is current while it is equal."""
+        levels = self._bar_height
+        health = player.status.health / player.status.max_health
+        energy = player.energy_source.fraction_remaining
+        active_mods = player.inventory.active_mods
+        mods_shown = [(loc, _mod_state(mod),
+                       int(mod.ability.cooldown_fraction * COOLDOWN_LEVELS))
+                      for loc, mod in active_mods.items()]
+        backpack: List[Any] = []
+        if not self._backpack_hidden:
+            backpack = [_mod_state(mod) for mod in player.inventory.backpack]
+        return (int(health * levels), int(energy * levels),
+                mods_shown, backpack, self._backpack_hidden,
+                self.selected_mod, self.selected_item)
 
     def toggle_hide_backpack(self) -> None:
         self.selected_mod = NO_SELECTION
@@ -63,11 +127,11 @@ class HUD(ScreenAccess):
     def _draw_hud_base(self) -> None:
 
         # hud base
-        pg.draw.rect(self.screen, settings.HUDGREY, self.rect)
+        pg.draw.rect(self._canvas, settings.HUDGREY, self.rect)
 
     def _draw_backpack_base(self) -> None:
 
-        pg.draw.rect(self.screen, settings.HUDGREY, self.backpack_base)
+        pg.draw.rect(self._canvas, settings.HUDGREY, self.backpack_base)
 
     def _draw_bar(self, player: Player, bar_type: str) -> None:
 
@@ -95,9 +159,9 @@ class HUD(ScreenAccess):
         fill_rect = pg.Rect(x, y, self._bar_length, self._bar_height)
         outline_rect = pg.Rect(x, y, self._bar_length, self._bar_height)
 
-        pg.draw.rect(self.screen, back_col, fill_rect)
-        pg.draw.rect(self.screen, col, back_rect)
-        pg.draw.rect(self.screen, settings.HUDDARK, outline_rect, 2)
+        pg.draw.rect(self._canvas, back_col, fill_rect)
+        pg.draw.rect(self._canvas, col, back_rect)
+        pg.draw.rect(self._canvas, settings.HUDDARK, outline_rect, 2)
 
     def _draw_mods(self, player: Player) -> None:
 
@@ -106,7 +170,7 @@ class HUD(ScreenAccess):
             col = settings.HUDDARK
             if self.selected_mod == idx:
                 col = settings.RED
-            pg.draw.rect(self.screen, col, r, 2)
+            pg.draw.rect(self._canvas, col, r, 2)
 
         for idx, loc in enumerate(player.inventory.active_mods):
             mod = player.inventory.active_mods[loc]
@@ -118,10 +182,10 @@ class HUD(ScreenAccess):
 
             img_rect = img.get_rect()
             img_rect.center = self.mod_rects[loc].center
-            self.screen.blit(img, img_rect)
+            self._canvas.blit(img, img_rect)
 
             title_font = images.get_font(images.ZOMBIE_FONT)
-            draw_text(self.screen, str(idx + 1), title_font,
+            draw_text(self._canvas, str(idx + 1), title_font,
                       20, settings.WHITE, img_rect.x, img_rect.y,
                       align="center")
 
@@ -150,7 +214,7 @@ class HUD(ScreenAccess):
 
         x_coord = img_rect.x + img_rect.width
         y_coord = img_rect.y + img_rect.height
-        draw_text(self.screen, str(num_uses), title_font,
+        draw_text(self._canvas, str(num_uses), title_font,
                   20, settings.RED, x_coord, y_coord,
                   align="center")
 
@@ -164,7 +228,7 @@ class HUD(ScreenAccess):
             color = settings.HUDDARK
             if self.selected_item == idx:
                 color = settings.RED
-            pg.draw.rect(self.screen, color, rect, 2)
+            pg.draw.rect(self._canvas, color, rect, 2)
 
         for idx, item_mod in enumerate(player.inventory.backpack):
             if not player.inventory.backpack.slot_occupied(idx):
@@ -174,7 +238,7 @@ class HUD(ScreenAccess):
             img_rect = img.get_rect()
             img_rect.center = rect.center
 
-            self.screen.blit(img, img_rect)
+            self._canvas.blit(img, img_rect)
 
             if item_mod.stackable:
                 self._draw_mod_ammo(img_rect, item_mod,
@@ -206,6 +270,19 @@ class HUD(ScreenAccess):
             rects.append(fill_rect)
         return rects
 
+    def _generate_bounds(self) -> pg.Rect:
+        # Bars stick out above and to the right of the base, and text
+        # labels may stick out of any side.
+        x, y = self._hud_pos
+        top = settings.HEIGHT - self._bar_height
+        bounds = pg.Rect(x, top, self._hud_width + self._bar_length,
+                         settings.HEIGHT - top)
+        return bounds.inflate(_TEXT_MARGIN, _TEXT_MARGIN)
+
+    def _generate_backpack_bounds(self) -> pg.Rect:
+        bounds = self.backpack_base.unionall(self.backpack_rects)
+        return bounds.inflate(_TEXT_MARGIN, _TEXT_MARGIN)
+
     def _generate_backpack_base(self) -> pg.Rect:
         # backpack base
         x_b_i = self.backpack_rects[0][0] - 2
@@ -215,3 +292,10 @@ class HUD(ScreenAccess):
 
         b_fill = pg.Rect(x_b_i, y_b_i, x_b_f, y_b_f)
         return b_fill
+
+
+def _mod_state(mod: Union[mods.Mod, None]) -> Any:
+    """What the HUD shows of a mod: its image and ammo count."""
+    if mod is None or not mod.stackable:
+        return mod
+    return mod, mod.ability.uses_left
@@ -1,5 +1,6 @@
 import pygame as pg
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, Tuple
 from os import path
 import random
 
@@ -22,6 +23,10 @@ ALL_IMAGES = set(
 ALL_IMAGES = set(ALL_IMAGES)
 ALL_IMAGES |= input_output.image_filenames()
 
+# Rotated images are cached at multiples of ROTATION_STEP degrees.
+ROTATION_STEP = 5
+ROTATION_CACHE_SIZE = 512
+
 IMPACTED_FONT = 'Impacted2.0.ttf'
 ZOMBIE_FONT = 'ZOMBIE.TTF'
 ALL_FONTS = [IMPACTED_FONT, ZOMBIE_FONT]
@@ -77,3 +82,59 @@ def get_muzzle_flash() -> pg.Surface:
 
 def party_member_image(member_number: int) -> pg.Surface:
     return get_image('partymember%d.png' % member_number)
+
+
+class RotationCache(object):
+    """Rotated copies of the game images, with angles rounded to step.
+
+    At most max_size images are kept. The least recently used one is dropped
+    to make room for a new one. When disabled, images are rotated by the
+    exact angle on every call, as a baseline for quality and cost.
+    Returned surfaces are shared and must not be drawn on.
+    """
+
+    def __init__(self, step: float = ROTATION_STEP,
+                 max_size: int = ROTATION_CACHE_SIZE) -> None:
+        assert step > 0 and max_size > 0
+        self.step = step
+        self.max_size = max_size
+        self.enabled = True
+        self._images: OrderedDict = OrderedDict()
+
+    def rotated(self, image_name: str, angle: float) -> pg.Surface:
+        if not self.enabled:
+            return pg.transform.rotate(get_image(image_name), angle)
+
+        step = self.step
+        angle = step * round(angle / step) % 360
+        if angle == 0:
+            return get_image(image_name)
+
+        key: Tuple[str, float] = (image_name, angle)
+        cached = self._images
+        if key in cached:
+            cached.move_to_end(key)
+            return cached[key]
+        image = pg.transform.rotate(get_image(image_name), angle)
+        cached[key] = image
+        if len(cached) > self.max_size:
+            cached.popitem(last=False)
+        return image
+
+    def clear(self) -> None:
+        self._images.clear()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+
+rotation_cache = RotationCache()
+
+
+def get_rotated_image(image_name: str, angle: float) -> pg.Surface:
+    """image_name rotated counterclockwise by about angle degrees."""
+    return rotation_cache.rotated(image_name, angle)
+
+
+def toggle_rotation_cache() -> None:
+    rotation_cache.enabled = not rotation_cache.enabled
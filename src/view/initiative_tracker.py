@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import pygame as pg
 import settings
 from creatures.party import Party
@@ -7,6 +7,8 @@ from view.draw_utils import draw_text
 from view import images
 
 NO_SELECTION = -1
+# Member images are 64 pixels wide, but their slots only 62.
+_IMAGE_OVERHANG = 8
 
 
 class InitiativeTracker(ScreenAccess):
@@ -30,7 +32,28 @@ class InitiativeTracker(ScreenAccess):
 
         self._backpack_hidden = True
 
+        # The tracker is drawn onto a canvas, rebuilt when the active member
+        # or the initiative order changes. Member images stick out of the
+        # base slightly.
+        self._canvas_rect = self.rect.inflate(_IMAGE_OVERHANG,
+                                              _IMAGE_OVERHANG)
+        self._canvas = pg.Surface(self._canvas_rect.size, pg.SRCALPHA)
+        self._state: Union[Tuple, None] = None
+
     def draw(self) -> None:
+        state = self._displayed_state()
+        if state != self._state:
+            self._state = state
+            self._render()
+        self.screen.blit(self._canvas, self._canvas_rect)
+
+    def _displayed_state(self) -> Tuple:
+        party = self._party
+        return tuple((member, member.initiative, party.member_is_active(idx))
+                     for idx, member in enumerate(party))
+
+    def _render(self) -> None:
+        self._canvas.fill((0, 0, 0, 0))
         self._draw_tracker_base()
         self._draw_images()
 
@@ -46,28 +69,33 @@ class InitiativeTracker(ScreenAccess):
     def _draw_tracker_base(self) -> None:
 
         # tracker base
-        pg.draw.rect(self.screen, settings.HUDGREY, self.rect)
+        pg.draw.rect(self._canvas, settings.HUDGREY,
+                     self._on_canvas(self.rect))
 
     def _draw_images(self) -> None:
 
         for idx, r in enumerate(self._character_rects):
+            r = self._on_canvas(r)
             col = settings.HUDDARK
             if self._party.member_is_active(idx):
                 col = (200, 200, 200)
 
             # outline
-            pg.draw.rect(self.screen, col, r, 2)
+            pg.draw.rect(self._canvas, col, r, 2)
 
             # image
             member = self._party[idx]
             img = pg.transform.scale(member.image, (64, 64))
-            self.screen.blit(img, r)
+            self._canvas.blit(img, r)
 
             # initiative
             font = images.get_font(images.IMPACTED_FONT)
-            draw_text(self.screen, str(member.initiative),
+            draw_text(self._canvas, str(member.initiative),
                       font, 13, (250, 50, 50), r.x + 3, r.y)
 
+    def _on_canvas(self, rect: pg.Rect) -> pg.Rect:
+        return rect.move(-self._canvas_rect.x, -self._canvas_rect.y)
+
     def _generate_character_rects(self) -> List[pg.Rect]:
         mod_size = 62
         x, y = self._tracker_pos
@@ -0,0 +1,110 @@
+"""Night mode lighting with any number of light sources."""
+from typing import Dict, List, Sequence, Tuple
+
+import pygame as pg
+
+import settings
+import tilemap
+from view import images
+
+# Static map lights are baked into square chunks of this size.
+CHUNK_SIZE = 512
+
+Cell = Tuple[int, int]
+# A light given by its center and radius.
+Light = Tuple[Tuple[int, int], int]
+
+
+def map_lights(tile_map: tilemap.TiledMap) -> List[Light]:
+    """The lights placed in tile_map, as objects named 'light'."""
+    return [((int(obj.center.x), int(obj.center.y)), int(obj.width // 2))
+            for obj in tile_map.objects
+            if obj.type == tilemap.ObjectType.LIGHT]
+
+
+class Lighting(object):
+    """Darkens the screen everywhere except around lights.
+
+    A fog surface starts out at NIGHT_COLOR. Each light raises it to the
+    light mask composited over that color, so that a single light looks
+    like the mask blitted on the fog. Where lights overlap, the brighter
+    one wins. The fog is then multiplied onto the screen.
+
+    Static lights are drawn once into chunks of a fog covering the map, each
+    built the first time it is shown. Dynamic lights are drawn every frame
+    with a single batched blits call.
+    """
+
+    def __init__(self, static_lights: Sequence[Light] = (),
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        self._static_lights = list(static_lights)
+        self._chunk_size = chunk_size
+        self._chunks: Dict[Cell, pg.Surface] = {}
+        self._patches: Dict[int, pg.Surface] = {}
+        self._fog = pg.Surface((settings.WIDTH, settings.HEIGHT))
+        self._mask = images.get_image(images.LIGHT_MASK)
+
+    def render(self, screen: pg.Surface, offset: Tuple[int, int],
+               lights: Sequence[Light]) -> None:
+        """Darken screen, given lights in map coordinates.
+
+        offset is the screen position of the map origin.
+        """
+        fog = self._fog
+        fog.fill(settings.NIGHT_COLOR)
+        if self._static_lights:
+            self._draw_chunks(offset)
+
+        offset_x, offset_y = offset
+        blits = []
+        for (x, y), radius in lights:
+            patch = self._patch(radius)
+            dest = (x + offset_x - radius, y + offset_y - radius)
+            # Each patch already holds the night color under its light, so
+            # summing overlapping patches would count that color twice and
+            # wash the overlap out to white. Taking the max keeps every light
+            # as bright as it was alone.
+            blits.append((patch, dest, patch.get_rect(), pg.BLEND_RGB_MAX))
+        fog.blits(blits, doreturn=False)
+
+        screen.blit(fog, (0, 0), special_flags=pg.BLEND_MULT)
+
+    def _draw_chunks(self, offset: Tuple[int, int]) -> None:
+        size = self._chunk_size
+        offset_x, offset_y = offset
+        # Map coordinates of the screen corners.
+        left, top = -offset_x, -offset_y
+        right, bottom = left + settings.WIDTH, top + settings.HEIGHT
+        for cx in range(left // size, (right - 1) // size + 1):
+            for cy in range(top // size, (bottom - 1) // size + 1):
+                self._fog.blit(self._chunk((cx, cy)),
+                               (cx * size + offset_x, cy * size + offset_y))
+
+    def _chunk(self, cell: Cell) -> pg.Surface:
+        if cell not in self._chunks:
+            size = self._chunk_size
+            chunk = pg.Surface((size, size))
+            chunk.fill(settings.NIGHT_COLOR)
+            origin_x, origin_y = cell[0] * size, cell[1] * size
+            chunk_rect = pg.Rect(origin_x, origin_y, size, size)
+            for (x, y), radius in self._static_lights:
+                light_rect = pg.Rect(x - radius, y - radius, 2 * radius,
+                                     2 * radius)
+                if chunk_rect.colliderect(light_rect):
+                    chunk.blit(self._patch(radius),
+                               light_rect.move(-origin_x, -origin_y),
+                               special_flags=pg.BLEND_RGB_MAX)
+            self._chunks[cell] = chunk
+        return self._chunks[cell]
+
+    def _patch(self, radius: int) -> pg.Surface:
+        """The light mask of the given radius composited over the fog."""
+        if radius not in self._patches:
+            mask = self._mask
+            if 2 * radius != mask.get_width():
+                mask = pg.transform.smoothscale(mask, (2 * radius, 2 * radius))
+            patch = pg.Surface(mask.get_size())
+            patch.fill(settings.NIGHT_COLOR)
+            patch.blit(mask, (0, 0))
+            self._patches[radius] = patch
+        return self._patches[radius]
@@ -0,0 +1,96 @@
+"""The map image, rendered in chunks as the camera nears them."""
+from collections import OrderedDict
+from typing import Iterator, Sequence, Tuple
+
+import pygame as pg
+from pygame.rect import Rect
+
+import settings
+from tilemap import TiledMap
+
+CHUNK_SIZE = 512
+# Rendered chunks kept, least recently drawn dropped first. An 800x600
+# screen shows at most 9 chunks of 512x512, and its surroundings within
+# PREFETCH_MARGIN touch at most 16.
+MAX_CHUNKS = 24
+# Chunks this close to the screen are rendered before they are shown, at
+# most one per frame.
+PREFETCH_MARGIN = 256
+
+Cell = Tuple[int, int]
+
+
+class MapImage(object):
+    """The image of a TiledMap, split into square chunks.
+
+    Only chunks near the screen are ever rendered, and at most max_chunks of
+    them are kept, so the memory used does not grow with the map size.
+    """
+
+    def __init__(self, tile_map: TiledMap, chunk_size: int = CHUNK_SIZE,
+                 max_chunks: int = MAX_CHUNKS) -> None:
+        self.tile_map = tile_map
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self._chunks: OrderedDict = OrderedDict()
+        # Chunks rendered so far, counting those rendered again after
+        # eviction.
+        self.renders = 0
+
+    def draw(self, screen: pg.Surface, offset: Tuple[int, int]) -> None:
+        """Draw the map on screen, where offset is the screen position of the
+        map origin."""
+        self.restore(screen, offset, [screen.get_rect()])
+        self._prefetch(offset)
+
+    def restore(self, screen: pg.Surface, offset: Tuple[int, int],
+                rects: Sequence[Rect]) -> None:
+        """Draw the map on the given areas of screen only."""
+        offset_x, offset_y = offset
+        size = self.chunk_size
+        blits = []
+        for rect in rects:
+            area = rect.move(-offset_x, -offset_y).clip(self.tile_map.rect)
+            for cell in self._cells(area):
+                chunk_x, chunk_y = cell[0] * size, cell[1] * size
+                part = area.clip(Rect(chunk_x, chunk_y, size, size))
+                dest = (part.x + offset_x, part.y + offset_y)
+                blits.append((self._chunk(cell), dest,
+                              part.move(-chunk_x, -chunk_y)))
+        screen.blits(blits, doreturn=False)
+
+    def _prefetch(self, offset: Tuple[int, int]) -> None:
+        near = Rect(-offset[0], -offset[1], settings.WIDTH, settings.HEIGHT)
+        near.inflate_ip(2 * PREFETCH_MARGIN, 2 * PREFETCH_MARGIN)
+        for cell in self._cells(near.clip(self.tile_map.rect)):
+            if cell not in self._chunks:
+                self._chunk(cell)
+                return
+
+    def _cells(self, area: Rect) -> Iterator[Cell]:
+        if area.width <= 0 or area.height <= 0:
+            return
+        size = self.chunk_size
+        for cy in range(area.top // size, (area.bottom - 1) // size + 1):
+            for cx in range(area.left // size, (area.right - 1) // size + 1):
+                yield cx, cy
+
+    def _chunk(self, cell: Cell) -> pg.Surface:
+        chunks = self._chunks
+        if cell in chunks:
+            chunks.move_to_end(cell)
+            return chunks[cell]
+        size = self.chunk_size
+        # Chunks on the right and bottom edges only cover the map.
+        area = Rect(cell[0] * size, cell[1] * size, size, size)
+        area = area.clip(self.tile_map.rect)
+        chunk = pg.Surface(area.size)
+        self.tile_map.render_area(chunk, area)
+        self.renders += 1
+        chunks[cell] = chunk
+        if len(chunks) > self.max_chunks:
+            chunks.popitem(last=False)
+        return chunk
+
+    def __len__(self) -> int:
+        return len(self._chunks)
@@ -6,6 +6,8 @@ import settings
 class ScreenAccess(object):
     """Label for an object with access to the screen."""
 
+    __slots__ = ()
+
     _screen: pg.Surface = None
 
     def __init__(self) -> None:
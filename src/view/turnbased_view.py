@@ -1,24 +1,26 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import pygame as pg
 from pygame.math import Vector2
 from pygame.rect import Rect
 from pygame.sprite import Sprite
-import math
 import model
 import settings
 from creatures.party import Party
+from movement import MoveRanges
+from occupancy import OccupancyGrid
 from view.screen import ScreenAccess
 from tilemap import TiledMap
 from view import images
 from view.camera import Camera
 from view.initiative_tracker import InitiativeTracker
+from view.map_image import MapImage
 
 NO_SELECTION = -1
 
 
 class TurnBasedView(model.GroupsAccess, ScreenAccess):
-    def __init__(self, party: Party) -> None:
+    def __init__(self, party: Party, occupancy: OccupancyGrid) -> None:
         super().__init__()
 
         dim_screen = pg.Surface(self.screen.get_size()).convert_alpha()
@@ -39,9 +41,20 @@ class TurnBasedView(model.GroupsAccess, ScreenAccess):
         self.title_font = images.get_font(images.ZOMBIE_FONT)
 
         self._party = party
+        self._occupancy = occupancy
+        self._move_ranges = MoveRanges(occupancy)
         self._initiative_tracker = InitiativeTracker(party)
 
-        self._move_options: List[pg.Surface] = []
+        # None once the active member has moved, until they are rebuilt.
+        self._move_options: Union[List[Rect], None] = []
+        # Move options drawn once in map coordinates, rebuilt when the
+        # active member changes or moves.
+        self._move_overlay: Union[pg.Surface, None] = None
+        self._move_overlay_rect = Rect(0, 0, 0, 0)
+        self._move_state: Union[Tuple, None] = None
+
+        # Image of the map being drawn.
+        self._map_image: MapImage = None
 
     def set_camera_range(self, width: int, height: int) -> None:
         x, y = self.camera.rect.x, self.camera.rect.y
@@ -51,7 +64,9 @@ class TurnBasedView(model.GroupsAccess, ScreenAccess):
 
         self.camera.update(self._party[0])
 
-        self.screen.blit(tile_map.img, self.camera.get_shifted_rect(tile_map))
+        if self._map_image is None or self._map_image.tile_map is not tile_map:
+            self._map_image = MapImage(tile_map)
+        self._map_image.draw(self.screen, self.camera.rect.topleft)
 
         for member in self._party:
             sprite = member
@@ -110,61 +125,50 @@ class TurnBasedView(model.GroupsAccess, ScreenAccess):
         if self._party.active_member_moved:
             return
 
-        self._move_option_rects()
-        if not self._move_options:
+        member = self._party.active_member
+        state = (member, tuple(member.pos))
+        if state != self._move_state or self._move_options is None:
+            self._move_state = state
+            self._move_option_rects()
+            self._render_move_overlay()
+        if self._move_overlay is None:
             return
 
-        for rect in self._move_options:
-            self._highlight_rect(rect, red=True)
+        shifted_rect = self.camera.shift_by_topleft(self._move_overlay_rect)
+        if self._rect_on_screen(shifted_rect):
+            self.screen.blit(self._move_overlay, shifted_rect)
 
-    def _move_option_rects(self) -> None:
-        if self._move_options:
+    def _render_move_overlay(self) -> None:
+        if not self._move_options:
+            self._move_overlay = None
             return
+        bounds = self._move_options[0].unionall(self._move_options)
+        overlay = pg.Surface(bounds.size, pg.SRCALPHA)
+        for rect in self._move_options:
+            pg.draw.rect(overlay, settings.RED,
+                         rect.move(-bounds.x, -bounds.y), 1)
+        self._move_overlay = overlay
+        self._move_overlay_rect = bounds
 
-        rects: List[pg.Surface] = []
+    def _move_option_rects(self) -> None:
         member = self._party.active_member
-        move_range = range(-member.speed, member.speed + 1)
-        for i in move_range:
-            for j in move_range:
-                dest_rect = member.rect.move(i * 32, j * 32)
-                if self._party.active_member.can_reach(i, j) and \
-                        self._path_is_clear(member.rect, dest_rect):
-                    rects.append(dest_rect)
-
-        self._move_options = rects
-
-    def _path_is_clear(self, rect1: pg.Surface, rect2: pg.Surface) -> bool:
-        test_points = self._points_between(rect1, rect2)
-        for point in test_points:
-            for wall in self.groups.walls:
-                if wall.rect.collidepoint(point[0], point[1]):
-                    return False
-
-        return True
-
-    def _points_between(self, rect1: pg.Surface, rect2: pg.Surface)\
-            -> List[Tuple[int, int]]:
-
-        p1 = rect1.center
-        p2 = rect2.center
-
-        points = [p1, p2]
-        dist = math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2)
-        step_size = 5.0
-        num_steps = int(dist / step_size)
-        for i in range(1, num_steps - 1):
-            s = i / num_steps
-            x = p1[0] * s + p2[0] * (1 - s)
-            y = p1[1] * s + p2[1] * (1 - s)
-            points.append((x, y))
-
-        return points
+        cell_of = self._occupancy.cell_of
+        start_x, start_y = cell_of(member.rect.center)
+        occupied = frozenset(cell_of(other.rect.center)
+                             for other in self._party if other is not member)
+        costs = self._move_ranges.reachable((start_x, start_y), member.speed,
+                                            occupied)
+        width = self._occupancy.cell_width
+        height = self._occupancy.cell_height
+        self._move_options = [
+            member.rect.move((x - start_x) * width, (y - start_y) * height)
+            for x, y in sorted(costs)]
 
     def toggle_debug(self) -> None:
         self._draw_debug = not self._draw_debug
 
     def _try_move(self, pos: Tuple[int, int]) -> None:
-        if self._party.active_member_moved:
+        if self._party.active_member_moved or self._move_options is None:
             return
 
         for rect in self._move_options: